@@ -1,26 +1,32 @@
 """Alembic environment configuration."""
 
 import asyncio
+import sys
 from logging.config import fileConfig
+from pathlib import Path
 
 from alembic import context
-from sqlalchemy import pool
+from sqlalchemy import event, pool, text
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from app.core.config import get_settings
-from app.core.database import Base
+from app.core.database import Base, set_sqlite_pragmas
 
 # Import all models to register them with Base.metadata
 from app.models import (  # noqa: F401
     AnnotationEvent,
     ClassificationAnnotation,
     Dataset,
+    ExportJob,
     Item,
     Label,
     Project,
 )
 
+# Make helpers next to this file (migration_utils) importable from revision scripts
+sys.path.append(str(Path(__file__).resolve().parent))
+
 # this is the Alembic Config object
 config = context.config
 
@@ -52,6 +58,14 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with the given connection."""
+    if connection.dialect.name == "postgresql":
+        # Fail fast instead of queueing behind (and blocking) application
+        # traffic while waiting for a table lock; long backfills are allowed.
+        # Session-level so it also covers autocommit blocks.
+        connection.execute(text("SET lock_timeout = '5s'"))
+        connection.execute(text("SET statement_timeout = 0"))
+        connection.commit()
+
     context.configure(connection=connection, target_metadata=target_metadata)
 
     with context.begin_transaction():
@@ -65,6 +79,8 @@ async def run_async_migrations() -> None:
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
     )
+    if connectable.dialect.name == "sqlite":
+        event.listen(connectable.sync_engine, "connect", set_sqlite_pragmas)
 
     async with connectable.connect() as connection:
         await connection.run_sync(do_run_migrations)
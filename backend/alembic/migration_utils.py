@@ -0,0 +1,71 @@
+"""Helpers shared by migration scripts.
+
+Backfills on large tables (``items``, ``annotation_events``) must not run as a
+single UPDATE or page with OFFSET/LIMIT: the former holds row locks on the whole
+table for the duration, the latter rescans every skipped row on each page. Use
+``batched_update`` instead, which numbers the target rows once and then walks
+them in fixed-size ranges, committing after each batch::
+
+    from migration_utils import batched_update
+
+    def upgrade() -> None:
+        batched_update(
+            op.get_bind(),
+            "items",
+            "UPDATE items SET project_id = (SELECT ...) WHERE id IN ({batch})",
+        )
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.engine import Connection
+
+BATCH_SIZE = 10000
+
+
+def batched_update(
+    conn: Connection,
+    table: str,
+    sql_template: str,
+    batch_size: int = BATCH_SIZE,
+) -> None:
+    """
+    Run ``sql_template`` over ``table`` in batches of ``batch_size`` rows.
+
+    Args:
+        conn: Migration connection (``op.get_bind()``)
+        table: Table whose ``id`` column drives the batching
+        sql_template: Statement containing a ``{batch}`` placeholder, which is
+            replaced by a subquery selecting the ids of the current batch
+        batch_size: Rows per batch; each batch is committed separately
+    """
+    numbered = f"_batch_{table}"
+    conn.execute(
+        sa.text(
+            f"CREATE TEMPORARY TABLE {numbered} AS "
+            f"SELECT id, ROW_NUMBER() OVER (ORDER BY id) AS rn FROM {table}"
+        )
+    )
+    conn.execute(sa.text(f"CREATE INDEX ix_{numbered}_rn ON {numbered} (rn)"))
+    total = conn.scalar(sa.text(f"SELECT COUNT(*) FROM {numbered}")) or 0
+
+    stmt = sa.text(sql_template.format(batch=f"SELECT id FROM {numbered} WHERE rn BETWEEN :lo AND :hi"))
+    with op.get_context().autocommit_block():
+        for lo in range(1, total + 1, batch_size):
+            conn.execute(stmt, {"lo": lo, "hi": lo + batch_size - 1})
+
+    conn.execute(sa.text(f"DROP TABLE {numbered}"))
+
+
+def create_index_concurrently(index_name: str, table: str, columns: list[str], **kw) -> None:
+    """
+    Create an index without blocking writes to ``table``.
+
+    On PostgreSQL this runs ``CREATE INDEX CONCURRENTLY`` outside the migration
+    transaction; other dialects fall back to a plain ``CREATE INDEX``.
+    """
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(index_name, table, columns, postgresql_concurrently=True, **kw)
+    else:
+        op.create_index(index_name, table, columns, **kw)
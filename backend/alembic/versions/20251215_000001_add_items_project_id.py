@@ -0,0 +1,61 @@
+"""Add denormalized project_id to items
+
+Revision ID: 20251215_000001
+Revises: 997d87efd364
+Create Date: 2025-12-15 00:00:01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from migration_utils import batched_update, create_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = '20251215_000001'
+down_revision: Union[str, None] = '997d87efd364'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'items',
+        sa.Column(
+            'project_id',
+            sa.Integer(),
+            nullable=True,
+            comment='Denormalized from datasets.project_id to avoid a join on write paths',
+        ),
+    )
+
+    batched_update(
+        op.get_bind(),
+        'items',
+        "UPDATE items SET project_id = "
+        "(SELECT project_id FROM datasets WHERE datasets.id = items.dataset_id) "
+        "WHERE id IN ({batch})",
+    )
+
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+    with op.batch_alter_table('items') as batch_op:
+        batch_op.alter_column('project_id', existing_type=sa.Integer(), nullable=False)
+        if not is_postgresql:
+            batch_op.create_foreign_key(
+                'fk_items_project_id_projects', 'projects', ['project_id'], ['id'], ondelete='CASCADE'
+            )
+    if is_postgresql:
+        # NOT VALID skips the scan of existing rows under lock; 20251215_000002 validates it
+        op.execute(
+            "ALTER TABLE items ADD CONSTRAINT fk_items_project_id_projects "
+            "FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE NOT VALID"
+        )
+    create_index_concurrently('ix_items_project_id', 'items', ['project_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_items_project_id', table_name='items')
+    with op.batch_alter_table('items') as batch_op:
+        batch_op.drop_constraint('fk_items_project_id_projects', type_='foreignkey')
+        batch_op.drop_column('project_id')
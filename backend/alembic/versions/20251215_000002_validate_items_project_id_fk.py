@@ -0,0 +1,27 @@
+"""Validate items.project_id foreign key
+
+Revision ID: 20251215_000002
+Revises: 20251215_000001
+Create Date: 2025-12-15 00:00:02
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20251215_000002'
+down_revision: Union[str, None] = '20251215_000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # VALIDATE CONSTRAINT only takes SHARE UPDATE EXCLUSIVE, so writes continue.
+    # SQLite created the constraint fully in the previous revision.
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("ALTER TABLE items VALIDATE CONSTRAINT fk_items_project_id_projects")
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,32 @@
+"""Replace items single-column indexes with (dataset_id, status)
+
+Revision ID: 20251216_000001
+Revises: 20251215_000002
+Create Date: 2025-12-16 00:00:01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from migration_utils import create_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = '20251216_000001'
+down_revision: Union[str, None] = '20251215_000002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Build the composite first so dataset lookups always have an index to use
+    create_index_concurrently('ix_items_dataset_id_status', 'items', ['dataset_id', 'status'])
+    # dataset_id alone is a prefix of the composite; status alone is never filtered on
+    op.drop_index('ix_items_dataset_id', table_name='items')
+    op.drop_index('ix_items_status', table_name='items')
+
+
+def downgrade() -> None:
+    op.create_index('ix_items_status', 'items', ['status'])
+    op.create_index('ix_items_dataset_id', 'items', ['dataset_id'])
+    op.drop_index('ix_items_dataset_id_status', table_name='items')
@@ -0,0 +1,35 @@
+"""Replace annotation_events single-column indexes with (project_id, ts DESC)
+
+Revision ID: 20251216_000002
+Revises: 20251216_000001
+Create Date: 2025-12-16 00:00:02
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from migration_utils import create_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = '20251216_000002'
+down_revision: Union[str, None] = '20251216_000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        'ix_annotation_events_project_id_ts', 'annotation_events', ['project_id', sa.text('ts DESC')]
+    )
+    op.drop_index('ix_annotation_events_project_id', table_name='annotation_events')
+    op.drop_index('ix_annotation_events_ts', table_name='annotation_events')
+    op.drop_index('ix_annotation_events_dataset_id', table_name='annotation_events')
+
+
+def downgrade() -> None:
+    op.create_index('ix_annotation_events_dataset_id', 'annotation_events', ['dataset_id'])
+    op.create_index('ix_annotation_events_ts', 'annotation_events', ['ts'])
+    op.create_index('ix_annotation_events_project_id', 'annotation_events', ['project_id'])
+    op.drop_index('ix_annotation_events_project_id_ts', table_name='annotation_events')
@@ -0,0 +1,84 @@
+"""Store annotation_events.event_type as SMALLINT
+
+Revision ID: 20251217_000001
+Revises: 20251216_000002
+Create Date: 2025-12-17 00:00:01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from migration_utils import batched_update
+
+# revision identifiers, used by Alembic.
+revision: str = '20251217_000001'
+down_revision: Union[str, None] = '20251216_000002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.models.annotation.EVENT_TYPE_CODES
+EVENT_TYPE_CODES = {
+    'OPEN': 1,
+    'SAVE': 2,
+    'SUBMIT_DONE': 3,
+    'SKIP': 4,
+    'DELETE': 5,
+    'UNSKIP': 6,
+    'RESTORE': 7,
+}
+
+event_type_enum = sa.Enum(*EVENT_TYPE_CODES, name='eventtype')
+
+
+def _case(column: str, mapping: dict) -> str:
+    whens = ' '.join(f"WHEN {k!r} THEN {v!r}" for k, v in mapping.items())
+    return f"CASE {column} {whens} END"
+
+
+def upgrade() -> None:
+    op.add_column('annotation_events', sa.Column('event_type_code', sa.SmallInteger(), nullable=True))
+
+    batched_update(
+        op.get_bind(),
+        'annotation_events',
+        f"UPDATE annotation_events SET event_type_code = {_case('event_type', EVENT_TYPE_CODES)} "
+        "WHERE id IN ({batch})",
+    )
+
+    with op.batch_alter_table('annotation_events') as batch_op:
+        batch_op.drop_column('event_type')
+        batch_op.alter_column(
+            'event_type_code',
+            new_column_name='event_type',
+            existing_type=sa.SmallInteger(),
+            nullable=False,
+        )
+    if op.get_bind().dialect.name == 'postgresql':
+        event_type_enum.drop(op.get_bind(), checkfirst=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        event_type_enum.create(op.get_bind(), checkfirst=True)
+    op.add_column('annotation_events', sa.Column('event_type_name', event_type_enum, nullable=True))
+
+    names = {code: name for name, code in EVENT_TYPE_CODES.items()}
+    value = _case('event_type', names)
+    if op.get_bind().dialect.name == 'postgresql':
+        value = f"CAST({value} AS eventtype)"
+    batched_update(
+        op.get_bind(),
+        'annotation_events',
+        f"UPDATE annotation_events SET event_type_name = {value} WHERE id IN ({{batch}})",
+    )
+
+    with op.batch_alter_table('annotation_events') as batch_op:
+        batch_op.drop_column('event_type')
+        batch_op.alter_column(
+            'event_type_name',
+            new_column_name='event_type',
+            existing_type=event_type_enum,
+            nullable=False,
+        )
@@ -0,0 +1,28 @@
+"""Replace labels.project_id index with (project_id, order)
+
+Revision ID: 20251217_000002
+Revises: 20251217_000001
+Create Date: 2025-12-17 00:00:02
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from migration_utils import create_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = '20251217_000002'
+down_revision: Union[str, None] = '20251217_000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_concurrently('ix_labels_project_id_order', 'labels', ['project_id', 'order'])
+    op.drop_index('ix_labels_project_id', table_name='labels')
+
+
+def downgrade() -> None:
+    op.create_index('ix_labels_project_id', 'labels', ['project_id'])
+    op.drop_index('ix_labels_project_id_order', table_name='labels')
@@ -0,0 +1,42 @@
+"""Make (dataset_id, rel_path) unique on items
+
+Revision ID: 20251218_000001
+Revises: 20251217_000002
+Create Date: 2025-12-18 00:00:01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from migration_utils import create_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = '20251218_000001'
+down_revision: Union[str, None] = '20251217_000002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Duplicates can only come from overlapping scans; they may carry
+    # annotations, so don't pick a survivor here
+    duplicates = op.get_bind().scalar(sa.text(
+        "SELECT COUNT(*) FROM ("
+        "SELECT 1 FROM items GROUP BY dataset_id, rel_path HAVING COUNT(*) > 1"
+        ") AS d"
+    ))
+    if duplicates:
+        raise RuntimeError(
+            f"{duplicates} (dataset_id, rel_path) pairs appear more than once in items; "
+            "merge or delete the extra rows before upgrading"
+        )
+
+    create_index_concurrently(
+        'uq_items_dataset_id_rel_path', 'items', ['dataset_id', 'rel_path'], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_items_dataset_id_rel_path', table_name='items')
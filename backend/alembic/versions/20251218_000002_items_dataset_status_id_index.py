@@ -0,0 +1,32 @@
+"""Extend items (dataset_id, status) index with id
+
+Revision ID: 20251218_000002
+Revises: 20251218_000001
+Create Date: 2025-12-18 00:00:02
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from migration_utils import create_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = '20251218_000002'
+down_revision: Union[str, None] = '20251218_000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Build the replacement first so dataset lookups always have an index to use
+    create_index_concurrently(
+        'ix_items_dataset_id_status_id', 'items', ['dataset_id', 'status', 'id']
+    )
+    # (dataset_id, status) is a prefix of the new index
+    op.drop_index('ix_items_dataset_id_status', table_name='items')
+
+
+def downgrade() -> None:
+    op.create_index('ix_items_dataset_id_status', 'items', ['dataset_id', 'status'])
+    op.drop_index('ix_items_dataset_id_status_id', table_name='items')
@@ -0,0 +1,45 @@
+"""Add export_jobs table for background exports
+
+Revision ID: 20251218_000003
+Revises: 20251218_000002
+Create Date: 2025-12-18 00:00:03
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20251218_000003'
+down_revision: Union[str, None] = '20251218_000002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+export_job_status = sa.Enum('PENDING', 'RUNNING', 'DONE', 'FAILED', name='exportjobstatus')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'export_jobs',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('dataset_id', sa.Integer(), nullable=False),
+        sa.Column('format', sa.String(length=20), nullable=False),
+        sa.Column('include_images', sa.Boolean(), nullable=False),
+        sa.Column('status_filter', sa.JSON(), nullable=True, comment='Item statuses to export; null means done only'),
+        sa.Column('status', export_job_status, nullable=False),
+        sa.Column('filename', sa.String(length=300), nullable=False, comment='Download filename offered to the client'),
+        sa.Column('file_path', sa.String(length=1000), nullable=True, comment='Location of the finished ZIP on the server'),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['dataset_id'], ['datasets.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_export_jobs_dataset_id', 'export_jobs', ['dataset_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_export_jobs_dataset_id', table_name='export_jobs')
+    op.drop_table('export_jobs')
+    export_job_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,60 @@
+"""Store enum columns as VARCHAR with CHECK constraints
+
+Revision ID: 20251219_000001
+Revises: 20251218_000003
+Create Date: 2025-12-19 00:00:01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20251219_000001'
+down_revision: Union[str, None] = '20251218_000003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, enum type / constraint name, stored values); values are the
+# enum member names, as before, so no rows need rewriting
+ENUM_COLUMNS = [
+    ('projects', 'task_type', 'tasktype', ('CLASSIFICATION', 'DETECTION', 'SEGMENTATION')),
+    ('items', 'status', 'itemstatus', ('TODO', 'IN_PROGRESS', 'DONE', 'SKIPPED', 'DELETED')),
+    ('export_jobs', 'status', 'exportjobstatus', ('PENDING', 'RUNNING', 'DONE', 'FAILED')),
+]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for table, column, name, values in ENUM_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.Enum(*values, name=name),
+                type_=sa.String(length=16),
+                existing_nullable=False,
+                postgresql_using=f'{column}::text',
+            )
+            batch_op.create_check_constraint(
+                name, f"{column} IN ({', '.join(repr(v) for v in values)})"
+            )
+        if bind.dialect.name == 'postgresql':
+            sa.Enum(*values, name=name).drop(bind, checkfirst=True)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table, column, name, values in reversed(ENUM_COLUMNS):
+        enum_type = sa.Enum(*values, name=name)
+        if bind.dialect.name == 'postgresql':
+            enum_type.create(bind, checkfirst=True)
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_constraint(name, type_='check')
+            batch_op.alter_column(
+                column,
+                existing_type=sa.String(length=16),
+                type_=enum_type,
+                existing_nullable=False,
+                postgresql_using=f'{column}::{name}',
+            )
@@ -0,0 +1,35 @@
+"""Add partial items index for the open (todo/in-progress) queue
+
+Revision ID: 20251219_000002
+Revises: 20251219_000001
+Create Date: 2025-12-19 00:00:02
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from migration_utils import create_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = '20251219_000002'
+down_revision: Union[str, None] = '20251219_000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OPEN_PREDICATE = sa.text("status IN ('TODO', 'IN_PROGRESS')")
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        'ix_items_open_queue',
+        'items',
+        ['dataset_id', 'id'],
+        postgresql_where=OPEN_PREDICATE,
+        sqlite_where=OPEN_PREDICATE,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_items_open_queue', table_name='items')
@@ -1,13 +1,14 @@
 """Annotation API endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import ColumnElement, Row, bindparam, delete, exists, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.database import get_db
 from app.models.annotation import (
-    AnnotationEvent,
     BBoxAnnotation,
     ClassificationAnnotation,
     EventType,
@@ -28,9 +29,51 @@ from app.schemas.annotation import (
     PolygonUpdate,
     SkipRequest,
 )
+from app.services.event_writer import event_writer
+from app.services.stats_cache import dataset_stats_cache
 
 router = APIRouter()
 
+# Hot lookups are built once and bound per call, so each request skips
+# constructing the Select tree and hits the compiled-statement cache directly
+_ITEM_EXISTS = select(exists().where(Item.id == bindparam("item_id")))
+_ITEM_BY_ID = select(Item).where(Item.id == bindparam("item_id"))
+_LABEL_IN_PROJECT = select(Label).where(
+    Label.id == bindparam("label_id"),
+    Label.project_id == bindparam("project_id"),
+)
+
+
+async def _update_item_status(
+    db: AsyncSession,
+    item_id: int,
+    condition: ColumnElement[bool],
+    values: dict,
+    conflict_detail: str,
+) -> Row:
+    """
+    Update an item's status in one UPDATE ... RETURNING.
+
+    Only applies if ``condition`` holds for the item. Returns its dataset_id
+    and project_id; raises 404 if the item doesn't exist and 400 with
+    ``conflict_detail`` if it exists but ``condition`` is false.
+    """
+    row = (
+        await db.execute(
+            update(Item)
+            .where(Item.id == item_id, condition)
+            .values(**values)
+            .returning(Item.dataset_id, Item.project_id)
+        )
+    ).one_or_none()
+
+    if not row:
+        if not await db.scalar(_ITEM_EXISTS, {"item_id": item_id}):
+            raise HTTPException(status_code=404, detail="Item not found")
+        raise HTTPException(status_code=400, detail=conflict_detail)
+    dataset_stats_cache.invalidate_in(db, row.dataset_id)
+    return row
+
 
 @router.post(
     "/items/{item_id}/classification",
@@ -43,52 +86,47 @@ async def submit_classification(
     db: AsyncSession = Depends(get_db),
 ):
     """Submit a classification for an item."""
-    # Get item with dataset
-    query = select(Item).options(selectinload(Item.dataset)).where(Item.id == item_id)
-    result = await db.execute(query)
-    item = result.scalar_one_or_none()
-
-    if not item:
-        raise HTTPException(status_code=404, detail="Item not found")
-
-    if item.status == ItemStatus.DELETED:
-        raise HTTPException(status_code=400, detail="Cannot annotate deleted item")
-
-    # Create classification annotation
-    classification = ClassificationAnnotation(
-        item_id=item_id,
-        label=classification_in.label,
-        user_id=None,  # M0: no auth
+    # Mark the item done and learn its dataset/project in the same statement
+    item_row = await _update_item_status(
+        db,
+        item_id,
+        Item.status != ItemStatus.DELETED,
+        {"status": ItemStatus.DONE, "skip_reason": None},
+        "Cannot annotate deleted item",
     )
-    db.add(classification)
-
-    # Update item status to done
-    item.status = ItemStatus.DONE
-    item.skip_reason = None
 
-    # Write events
-    save_event = AnnotationEvent(
-        project_id=item.dataset.project_id,
-        dataset_id=item.dataset_id,
-        item_id=item_id,
-        event_type=EventType.SAVE,
-        payload={"label": classification_in.label},
+    # Create classification annotation
+    row = (
+        await db.execute(
+            insert(ClassificationAnnotation)
+            .values(
+                item_id=item_id,
+                label=classification_in.label,
+                user_id=None,  # M0: no auth
+            )
+            .returning(ClassificationAnnotation.id, ClassificationAnnotation.created_at)
+        )
+    ).one()
+
+    # A submit implies a save, so a single SUBMIT_DONE event records both
+    await event_writer.write(
+        db,
+        {
+            "project_id": item_row.project_id,
+            "dataset_id": item_row.dataset_id,
+            "item_id": item_id,
+            "event_type": EventType.SUBMIT_DONE,
+            "payload": {"label": classification_in.label},
+        },
     )
-    db.add(save_event)
 
-    submit_event = AnnotationEvent(
-        project_id=item.dataset.project_id,
-        dataset_id=item.dataset_id,
+    return ClassificationResponse(
+        id=row.id,
         item_id=item_id,
-        event_type=EventType.SUBMIT_DONE,
-        payload={"label": classification_in.label},
+        label=classification_in.label,
+        user_id=None,
+        created_at=row.created_at,
     )
-    db.add(submit_event)
-
-    await db.flush()
-    await db.refresh(classification)
-
-    return classification
 
 
 @router.post("/items/{item_id}/skip", status_code=status.HTTP_200_OK)
@@ -98,32 +136,25 @@ async def skip_item(
     db: AsyncSession = Depends(get_db),
 ):
     """Skip an item with a reason."""
-    # Get item with dataset
-    query = select(Item).options(selectinload(Item.dataset)).where(Item.id == item_id)
-    result = await db.execute(query)
-    item = result.scalar_one_or_none()
-
-    if not item:
-        raise HTTPException(status_code=404, detail="Item not found")
-
-    if item.status == ItemStatus.DELETED:
-        raise HTTPException(status_code=400, detail="Cannot skip deleted item")
-
-    # Update status
-    item.status = ItemStatus.SKIPPED
-    item.skip_reason = skip_in.reason
+    item_row = await _update_item_status(
+        db,
+        item_id,
+        Item.status != ItemStatus.DELETED,
+        {"status": ItemStatus.SKIPPED, "skip_reason": skip_in.reason},
+        "Cannot skip deleted item",
+    )
 
     # Write event
-    event = AnnotationEvent(
-        project_id=item.dataset.project_id,
-        dataset_id=item.dataset_id,
-        item_id=item_id,
-        event_type=EventType.SKIP,
-        payload={"reason": skip_in.reason},
+    await event_writer.write(
+        db,
+        {
+            "project_id": item_row.project_id,
+            "dataset_id": item_row.dataset_id,
+            "item_id": item_id,
+            "event_type": EventType.SKIP,
+            "payload": {"reason": skip_in.reason},
+        },
     )
-    db.add(event)
-
-    await db.flush()
 
     return {"status": "skipped", "reason": skip_in.reason}
 
@@ -134,32 +165,38 @@ async def delete_item(
     db: AsyncSession = Depends(get_db),
 ):
     """Soft delete an item."""
-    # Get item with dataset
-    query = select(Item).options(selectinload(Item.dataset)).where(Item.id == item_id)
-    result = await db.execute(query)
-    item = result.scalar_one_or_none()
-
-    if not item:
+    item_row = (
+        await db.execute(
+            select(Item.status, Item.dataset_id, Item.project_id).where(Item.id == item_id)
+        )
+    ).first()
+    if not item_row:
         raise HTTPException(status_code=404, detail="Item not found")
-
-    if item.status == ItemStatus.DELETED:
+    if item_row.status == ItemStatus.DELETED:
         raise HTTPException(status_code=400, detail="Item already deleted")
 
-    # Update status
-    previous_status = item.status
-    item.status = ItemStatus.DELETED
+    # The event records the previous status, which RETURNING cannot report, so
+    # it is read above; matching on it here keeps a concurrent change from
+    # being logged with the wrong previous status
+    await _update_item_status(
+        db,
+        item_id,
+        Item.status == item_row.status,
+        {"status": ItemStatus.DELETED},
+        "Item status changed concurrently",
+    )
 
     # Write event
-    event = AnnotationEvent(
-        project_id=item.dataset.project_id,
-        dataset_id=item.dataset_id,
-        item_id=item_id,
-        event_type=EventType.DELETE,
-        payload={"previous_status": previous_status.value},
+    await event_writer.write(
+        db,
+        {
+            "project_id": item_row.project_id,
+            "dataset_id": item_row.dataset_id,
+            "item_id": item_id,
+            "event_type": EventType.DELETE,
+            "payload": {"previous_status": item_row.status.value},
+        },
     )
-    db.add(event)
-
-    await db.flush()
 
     return {"status": "deleted"}
 
@@ -170,32 +207,25 @@ async def restore_item(
     db: AsyncSession = Depends(get_db),
 ):
     """Restore a deleted item."""
-    # Get item with dataset
-    query = select(Item).options(selectinload(Item.dataset)).where(Item.id == item_id)
-    result = await db.execute(query)
-    item = result.scalar_one_or_none()
-
-    if not item:
-        raise HTTPException(status_code=404, detail="Item not found")
-
-    if item.status != ItemStatus.DELETED:
-        raise HTTPException(status_code=400, detail="Item is not deleted")
-
-    # Update status back to todo
-    item.status = ItemStatus.TODO
-    item.skip_reason = None
+    item_row = await _update_item_status(
+        db,
+        item_id,
+        Item.status == ItemStatus.DELETED,
+        {"status": ItemStatus.TODO, "skip_reason": None},
+        "Item is not deleted",
+    )
 
     # Write event
-    event = AnnotationEvent(
-        project_id=item.dataset.project_id,
-        dataset_id=item.dataset_id,
-        item_id=item_id,
-        event_type=EventType.RESTORE,
-        payload=None,
+    await event_writer.write(
+        db,
+        {
+            "project_id": item_row.project_id,
+            "dataset_id": item_row.dataset_id,
+            "item_id": item_id,
+            "event_type": EventType.RESTORE,
+            "payload": None,
+        },
     )
-    db.add(event)
-
-    await db.flush()
 
     return {"status": "restored"}
 
@@ -203,11 +233,10 @@ async def restore_item(
 # ===== BBox Annotations =====
 
 
-async def _get_item_with_dataset(item_id: int, db: AsyncSession) -> Item:
-    """Get item with dataset loaded, raise 404 if not found."""
-    query = select(Item).options(selectinload(Item.dataset)).where(Item.id == item_id)
-    result = await db.execute(query)
-    item = result.scalar_one_or_none()
+async def _get_item(item_id: int, db: AsyncSession) -> Item:
+    """Get item, raise 404 if not found."""
+    result = await db.execute(_ITEM_BY_ID, {"item_id": item_id})
+    item = result.scalars().first()
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     return item
@@ -215,9 +244,8 @@ async def _get_item_with_dataset(item_id: int, db: AsyncSession) -> Item:
 
 async def _validate_label(label_id: int, project_id: int, db: AsyncSession) -> Label:
     """Validate that label exists and belongs to the project."""
-    query = select(Label).where(Label.id == label_id, Label.project_id == project_id)
-    result = await db.execute(query)
-    label = result.scalar_one_or_none()
+    result = await db.execute(_LABEL_IN_PROJECT, {"label_id": label_id, "project_id": project_id})
+    label = result.scalars().first()
     if not label:
         raise HTTPException(
             status_code=400,
@@ -227,8 +255,12 @@ async def _validate_label(label_id: int, project_id: int, db: AsyncSession) -> L
 
 
 def _bbox_to_response(bbox: BBoxAnnotation) -> BBoxResponse:
-    """Convert BBoxAnnotation to response with label info."""
-    return BBoxResponse(
+    """
+    Convert BBoxAnnotation to response with label info.
+
+    Values come from a persisted ORM row, so field validation is skipped.
+    """
+    return BBoxResponse.model_construct(
         id=bbox.id,
         item_id=bbox.item_id,
         label_id=bbox.label_id,
@@ -246,8 +278,12 @@ def _bbox_to_response(bbox: BBoxAnnotation) -> BBoxResponse:
 
 
 def _polygon_to_response(polygon: PolygonAnnotation) -> PolygonResponse:
-    """Convert PolygonAnnotation to response with label info."""
-    return PolygonResponse(
+    """
+    Convert PolygonAnnotation to response with label info.
+
+    Values come from a persisted ORM row, so field validation is skipped.
+    """
+    return PolygonResponse.model_construct(
         id=polygon.id,
         item_id=polygon.item_id,
         label_id=polygon.label_id,
@@ -261,37 +297,71 @@ def _polygon_to_response(polygon: PolygonAnnotation) -> PolygonResponse:
     )
 
 
-@router.get("/items/{item_id}/annotations", response_model=ItemAnnotationsResponse)
+_BBOXES_BY_ITEM = (
+    select(
+        BBoxAnnotation.id,
+        BBoxAnnotation.item_id,
+        BBoxAnnotation.label_id,
+        Label.name.label("label_name"),
+        Label.color.label("label_color"),
+        BBoxAnnotation.x,
+        BBoxAnnotation.y,
+        BBoxAnnotation.width,
+        BBoxAnnotation.height,
+        BBoxAnnotation.attributes,
+        BBoxAnnotation.user_id,
+        BBoxAnnotation.created_at,
+        BBoxAnnotation.updated_at,
+    )
+    .join(Label)
+    .where(BBoxAnnotation.item_id == bindparam("item_id"))
+)
+
+_POLYGONS_BY_ITEM = (
+    select(
+        PolygonAnnotation.id,
+        PolygonAnnotation.item_id,
+        PolygonAnnotation.label_id,
+        Label.name.label("label_name"),
+        Label.color.label("label_color"),
+        PolygonAnnotation.points,
+        PolygonAnnotation.attributes,
+        PolygonAnnotation.user_id,
+        PolygonAnnotation.created_at,
+        PolygonAnnotation.updated_at,
+    )
+    .join(Label)
+    .where(PolygonAnnotation.item_id == bindparam("item_id"))
+)
+
+
+@router.get(
+    "/items/{item_id}/annotations",
+    response_model=ItemAnnotationsResponse,
+    response_class=ORJSONResponse,
+)
 async def get_item_annotations(
     item_id: int,
     db: AsyncSession = Depends(get_db),
 ):
-    """Get all annotations (bboxes and polygons) for an item."""
-    item = await _get_item_with_dataset(item_id, db)
+    """
+    Get all annotations (bboxes and polygons) for an item.
 
-    # Get bboxes
-    bbox_query = (
-        select(BBoxAnnotation)
-        .options(selectinload(BBoxAnnotation.label))
-        .where(BBoxAnnotation.item_id == item_id)
-    )
-    bbox_result = await db.execute(bbox_query)
-    bboxes = bbox_result.scalars().all()
+    Items can carry hundreds of annotations, so rows are selected as plain
+    columns and serialized straight to JSON instead of going through ORM
+    objects and response models.
+    """
+    bbox_result = await db.execute(_BBOXES_BY_ITEM, {"item_id": item_id})
+    bboxes = [row._asdict() for row in bbox_result]
+    polygon_result = await db.execute(_POLYGONS_BY_ITEM, {"item_id": item_id})
+    polygons = [row._asdict() for row in polygon_result]
 
-    # Get polygons
-    polygon_query = (
-        select(PolygonAnnotation)
-        .options(selectinload(PolygonAnnotation.label))
-        .where(PolygonAnnotation.item_id == item_id)
-    )
-    polygon_result = await db.execute(polygon_query)
-    polygons = polygon_result.scalars().all()
+    # No annotations: tell an unannotated item apart from a missing one
+    if not bboxes and not polygons:
+        if not await db.scalar(_ITEM_EXISTS, {"item_id": item_id}):
+            raise HTTPException(status_code=404, detail="Item not found")
 
-    return ItemAnnotationsResponse(
-        item_id=item_id,
-        bboxes=[_bbox_to_response(b) for b in bboxes],
-        polygons=[_polygon_to_response(p) for p in polygons],
-    )
+    return ORJSONResponse({"item_id": item_id, "bboxes": bboxes, "polygons": polygons})
 
 
 @router.post(
@@ -305,17 +375,17 @@ async def create_bbox(
     db: AsyncSession = Depends(get_db),
 ):
     """Create a bounding box annotation."""
-    item = await _get_item_with_dataset(item_id, db)
+    item = await _get_item(item_id, db)
     if item.status == ItemStatus.DELETED:
         raise HTTPException(status_code=400, detail="Cannot annotate deleted item")
 
     # Validate label belongs to project
-    await _validate_label(bbox_in.label_id, item.dataset.project_id, db)
+    label = await _validate_label(bbox_in.label_id, item.project_id, db)
 
     # Create bbox
     bbox = BBoxAnnotation(
         item_id=item_id,
-        label_id=bbox_in.label_id,
+        label=label,
         x=bbox_in.x,
         y=bbox_in.y,
         width=bbox_in.width,
@@ -330,12 +400,6 @@ async def create_bbox(
         item.status = ItemStatus.IN_PROGRESS
 
     await db.flush()
-    await db.refresh(bbox)
-
-    # Load label relationship
-    label_query = select(Label).where(Label.id == bbox.label_id)
-    label_result = await db.execute(label_query)
-    bbox.label = label_result.scalar_one()
 
     return _bbox_to_response(bbox)
 
@@ -349,19 +413,21 @@ async def update_bbox(
     """Update a bounding box annotation."""
     query = (
         select(BBoxAnnotation)
-        .options(selectinload(BBoxAnnotation.item).selectinload(Item.dataset))
+        .options(
+            joinedload(BBoxAnnotation.item, innerjoin=True),
+            joinedload(BBoxAnnotation.label, innerjoin=True),
+        )
         .where(BBoxAnnotation.id == bbox_id)
     )
     result = await db.execute(query)
-    bbox = result.scalar_one_or_none()
+    bbox = result.scalars().first()
 
     if not bbox:
         raise HTTPException(status_code=404, detail="BBox not found")
 
     # Validate label if changing
     if bbox_in.label_id is not None and bbox_in.label_id != bbox.label_id:
-        await _validate_label(bbox_in.label_id, bbox.item.dataset.project_id, db)
-        bbox.label_id = bbox_in.label_id
+        bbox.label = await _validate_label(bbox_in.label_id, bbox.item.project_id, db)
 
     # Update fields
     if bbox_in.x is not None:
@@ -376,12 +442,6 @@ async def update_bbox(
         bbox.attributes = bbox_in.attributes
 
     await db.flush()
-    await db.refresh(bbox)
-
-    # Load label
-    label_query = select(Label).where(Label.id == bbox.label_id)
-    label_result = await db.execute(label_query)
-    bbox.label = label_result.scalar_one()
 
     return _bbox_to_response(bbox)
 
@@ -392,16 +452,12 @@ async def delete_bbox(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a bounding box annotation."""
-    query = select(BBoxAnnotation).where(BBoxAnnotation.id == bbox_id)
-    result = await db.execute(query)
-    bbox = result.scalar_one_or_none()
-
-    if not bbox:
+    result = await db.execute(
+        delete(BBoxAnnotation).where(BBoxAnnotation.id == bbox_id).returning(BBoxAnnotation.id)
+    )
+    if result.scalars().first() is None:
         raise HTTPException(status_code=404, detail="BBox not found")
 
-    await db.delete(bbox)
-    await db.flush()
-
 
 # ===== Polygon Annotations =====
 
@@ -417,17 +473,17 @@ async def create_polygon(
     db: AsyncSession = Depends(get_db),
 ):
     """Create a polygon annotation."""
-    item = await _get_item_with_dataset(item_id, db)
+    item = await _get_item(item_id, db)
     if item.status == ItemStatus.DELETED:
         raise HTTPException(status_code=400, detail="Cannot annotate deleted item")
 
     # Validate label belongs to project
-    await _validate_label(polygon_in.label_id, item.dataset.project_id, db)
+    label = await _validate_label(polygon_in.label_id, item.project_id, db)
 
     # Create polygon
     polygon = PolygonAnnotation(
         item_id=item_id,
-        label_id=polygon_in.label_id,
+        label=label,
         points=polygon_in.points,
         attributes=polygon_in.attributes,
         user_id=None,  # M1: no auth
@@ -439,12 +495,6 @@ async def create_polygon(
         item.status = ItemStatus.IN_PROGRESS
 
     await db.flush()
-    await db.refresh(polygon)
-
-    # Load label
-    label_query = select(Label).where(Label.id == polygon.label_id)
-    label_result = await db.execute(label_query)
-    polygon.label = label_result.scalar_one()
 
     return _polygon_to_response(polygon)
 
@@ -458,19 +508,21 @@ async def update_polygon(
     """Update a polygon annotation."""
     query = (
         select(PolygonAnnotation)
-        .options(selectinload(PolygonAnnotation.item).selectinload(Item.dataset))
+        .options(
+            joinedload(PolygonAnnotation.item, innerjoin=True),
+            joinedload(PolygonAnnotation.label, innerjoin=True),
+        )
         .where(PolygonAnnotation.id == polygon_id)
     )
     result = await db.execute(query)
-    polygon = result.scalar_one_or_none()
+    polygon = result.scalars().first()
 
     if not polygon:
         raise HTTPException(status_code=404, detail="Polygon not found")
 
     # Validate label if changing
     if polygon_in.label_id is not None and polygon_in.label_id != polygon.label_id:
-        await _validate_label(polygon_in.label_id, polygon.item.dataset.project_id, db)
-        polygon.label_id = polygon_in.label_id
+        polygon.label = await _validate_label(polygon_in.label_id, polygon.item.project_id, db)
 
     # Update fields
     if polygon_in.points is not None:
@@ -479,12 +531,6 @@ async def update_polygon(
         polygon.attributes = polygon_in.attributes
 
     await db.flush()
-    await db.refresh(polygon)
-
-    # Load label
-    label_query = select(Label).where(Label.id == polygon.label_id)
-    label_result = await db.execute(label_query)
-    polygon.label = label_result.scalar_one()
 
     return _polygon_to_response(polygon)
 
@@ -495,16 +541,12 @@ async def delete_polygon(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a polygon annotation."""
-    query = select(PolygonAnnotation).where(PolygonAnnotation.id == polygon_id)
-    result = await db.execute(query)
-    polygon = result.scalar_one_or_none()
-
-    if not polygon:
+    result = await db.execute(
+        delete(PolygonAnnotation).where(PolygonAnnotation.id == polygon_id).returning(PolygonAnnotation.id)
+    )
+    if result.scalars().first() is None:
         raise HTTPException(status_code=404, detail="Polygon not found")
 
-    await db.delete(polygon)
-    await db.flush()
-
 
 # ===== Batch Operations =====
 
@@ -519,57 +561,66 @@ async def save_annotations_batch(
     Save all annotations for an item (replaces existing).
     Used by canvas to save all drawn objects at once.
     """
-    item = await _get_item_with_dataset(item_id, db)
+    item = await _get_item(item_id, db)
     if item.status == ItemStatus.DELETED:
         raise HTTPException(status_code=400, detail="Cannot annotate deleted item")
 
-    project_id = item.dataset.project_id
+    project_id = item.project_id
+
+    # Validate all labels belong to the project in one query
+    label_ids = {b.label_id for b in batch_in.bboxes} | {p.label_id for p in batch_in.polygons}
+    labels: dict[int, Label] = {}
+    if label_ids:
+        result = await db.execute(
+            select(Label).where(Label.project_id == project_id, Label.id.in_(label_ids))
+        )
+        labels = {label.id: label for label in result.scalars()}
+        missing = label_ids - labels.keys()
+        if missing:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Label {', '.join(map(str, sorted(missing)))} not found in project",
+            )
 
     # Delete existing annotations
-    await db.execute(
-        select(BBoxAnnotation).where(BBoxAnnotation.item_id == item_id)
+    await db.execute(delete(BBoxAnnotation).where(BBoxAnnotation.item_id == item_id))
+    await db.execute(delete(PolygonAnnotation).where(PolygonAnnotation.item_id == item_id))
+
+    # Create new annotations with one INSERT ... RETURNING per table, as
+    # set_labels does
+    new_bboxes = await _insert_annotations(
+        db,
+        BBoxAnnotation,
+        [
+            {
+                "item_id": item_id,
+                "label_id": bbox_in.label_id,
+                "x": bbox_in.x,
+                "y": bbox_in.y,
+                "width": bbox_in.width,
+                "height": bbox_in.height,
+                "attributes": bbox_in.attributes,
+                "user_id": None,
+            }
+            for bbox_in in batch_in.bboxes
+        ],
+        labels,
+    )
+    new_polygons = await _insert_annotations(
+        db,
+        PolygonAnnotation,
+        [
+            {
+                "item_id": item_id,
+                "label_id": polygon_in.label_id,
+                "points": polygon_in.points,
+                "attributes": polygon_in.attributes,
+                "user_id": None,
+            }
+            for polygon_in in batch_in.polygons
+        ],
+        labels,
     )
-    existing_bboxes = (await db.execute(
-        select(BBoxAnnotation).where(BBoxAnnotation.item_id == item_id)
-    )).scalars().all()
-    for bbox in existing_bboxes:
-        await db.delete(bbox)
-
-    existing_polygons = (await db.execute(
-        select(PolygonAnnotation).where(PolygonAnnotation.item_id == item_id)
-    )).scalars().all()
-    for polygon in existing_polygons:
-        await db.delete(polygon)
-
-    # Create new annotations
-    new_bboxes = []
-    for bbox_in in batch_in.bboxes:
-        await _validate_label(bbox_in.label_id, project_id, db)
-        bbox = BBoxAnnotation(
-            item_id=item_id,
-            label_id=bbox_in.label_id,
-            x=bbox_in.x,
-            y=bbox_in.y,
-            width=bbox_in.width,
-            height=bbox_in.height,
-            attributes=bbox_in.attributes,
-            user_id=None,
-        )
-        db.add(bbox)
-        new_bboxes.append(bbox)
-
-    new_polygons = []
-    for polygon_in in batch_in.polygons:
-        await _validate_label(polygon_in.label_id, project_id, db)
-        polygon = PolygonAnnotation(
-            item_id=item_id,
-            label_id=polygon_in.label_id,
-            points=polygon_in.points,
-            attributes=polygon_in.attributes,
-            user_id=None,
-        )
-        db.add(polygon)
-        new_polygons.append(polygon)
 
     # Update item status
     if batch_in.bboxes or batch_in.polygons:
@@ -578,19 +629,6 @@ async def save_annotations_batch(
     
     await db.flush()
 
-    # Refresh and load labels
-    for bbox in new_bboxes:
-        await db.refresh(bbox)
-        label_query = select(Label).where(Label.id == bbox.label_id)
-        label_result = await db.execute(label_query)
-        bbox.label = label_result.scalar_one()
-
-    for polygon in new_polygons:
-        await db.refresh(polygon)
-        label_query = select(Label).where(Label.id == polygon.label_id)
-        label_result = await db.execute(label_query)
-        polygon.label = label_result.scalar_one()
-
     return ItemAnnotationsResponse(
         item_id=item_id,
         bboxes=[_bbox_to_response(b) for b in new_bboxes],
@@ -598,13 +636,35 @@ async def save_annotations_batch(
     )
 
 
+async def _insert_annotations(
+    db: AsyncSession,
+    model: type[BBoxAnnotation] | type[PolygonAnnotation],
+    rows: list[dict],
+    labels: dict[int, Label],
+) -> list:
+    """
+    Insert annotation rows in one statement and attach their (already loaded) labels.
+
+    RETURNING is not asked to follow parameter order, which would make
+    SQLite fall back to an INSERT per row; rows are put back in insertion
+    order by id instead.
+    """
+    if not rows:
+        return []
+    result = await db.scalars(insert(model).returning(model), rows)
+    annotations = sorted(result.all(), key=lambda annotation: annotation.id)
+    for annotation in annotations:
+        set_committed_value(annotation, "label", labels[annotation.label_id])
+    return annotations
+
+
 @router.post("/items/{item_id}/submit", status_code=status.HTTP_200_OK)
 async def submit_annotations(
     item_id: int,
     db: AsyncSession = Depends(get_db),
 ):
     """Mark item as done after annotation is complete."""
-    item = await _get_item_with_dataset(item_id, db)
+    item = await _get_item(item_id, db)
     
     if item.status == ItemStatus.DELETED:
         raise HTTPException(status_code=400, detail="Cannot submit deleted item")
@@ -615,18 +675,19 @@ async def submit_annotations(
     # Update status
     item.status = ItemStatus.DONE
     item.skip_reason = None
+    dataset_stats_cache.invalidate_in(db, item.dataset_id)
 
     # Write event
-    event = AnnotationEvent(
-        project_id=item.dataset.project_id,
-        dataset_id=item.dataset_id,
-        item_id=item_id,
-        event_type=EventType.SUBMIT_DONE,
-        payload=None,
+    await event_writer.write(
+        db,
+        {
+            "project_id": item.project_id,
+            "dataset_id": item.dataset_id,
+            "item_id": item_id,
+            "event_type": EventType.SUBMIT_DONE,
+            "payload": None,
+        },
     )
-    db.add(event)
-
-    await db.flush()
 
     return {"status": "submitted"}
 
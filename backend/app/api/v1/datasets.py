@@ -1,15 +1,16 @@
 """Dataset API endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func, select
+from sqlalchemy import delete, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.core.database import get_db
 from app.models.dataset import Dataset
-from app.models.item import Item, ItemStatus
 from app.models.project import Project
 from app.schemas.dataset import DatasetCreate, DatasetResponse, ScanRequest, ScanResponse
 from app.services.importer import ImporterService
+from app.services.stats_cache import dataset_stats_cache, get_dataset_stats, get_datasets_stats
 
 router = APIRouter()
 
@@ -26,11 +27,7 @@ async def create_dataset(
 ):
     """Create a new dataset in a project."""
     # Verify project exists
-    project_query = select(Project).where(Project.id == project_id)
-    result = await db.execute(project_query)
-    project = result.scalar_one_or_none()
-
-    if not project:
+    if not await db.scalar(select(exists().where(Project.id == project_id))):
         raise HTTPException(status_code=404, detail="Project not found")
 
     dataset = Dataset(
@@ -52,23 +49,23 @@ async def list_datasets(
     db: AsyncSession = Depends(get_db),
 ):
     """List all datasets in a project."""
-    # Verify project exists
-    project_query = select(Project).where(Project.id == project_id)
-    result = await db.execute(project_query)
-    if not result.scalar_one_or_none():
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    # Get datasets
-    query = select(Dataset).where(Dataset.project_id == project_id).order_by(Dataset.created_at.desc())
+    # Get datasets; relationships are never loaded per dataset
+    query = (
+        select(Dataset)
+        .options(raiseload("*"))
+        .where(Dataset.project_id == project_id)
+        .order_by(Dataset.created_at.desc())
+    )
     result = await db.execute(query)
     datasets = result.scalars().all()
 
-    responses = []
-    for dataset in datasets:
-        stats = await _get_dataset_stats(db, dataset.id)
-        responses.append(_dataset_to_response(dataset, **stats))
+    # No datasets: tell an empty project apart from a missing one
+    if not datasets:
+        if not await db.scalar(select(exists().where(Project.id == project_id))):
+            raise HTTPException(status_code=404, detail="Project not found")
 
-    return responses
+    stats = await get_datasets_stats(db, [dataset.id for dataset in datasets])
+    return [_dataset_to_response(dataset, **stats[dataset.id]) for dataset in datasets]
 
 
 @router.get("/datasets/{dataset_id}", response_model=DatasetResponse)
@@ -77,14 +74,12 @@ async def get_dataset(
     db: AsyncSession = Depends(get_db),
 ):
     """Get a dataset by ID."""
-    query = select(Dataset).where(Dataset.id == dataset_id)
-    result = await db.execute(query)
-    dataset = result.scalar_one_or_none()
+    dataset = await db.get(Dataset, dataset_id)
 
     if not dataset:
         raise HTTPException(status_code=404, detail="Dataset not found")
 
-    stats = await _get_dataset_stats(db, dataset.id)
+    stats = await get_dataset_stats(db, dataset.id)
     return _dataset_to_response(dataset, **stats)
 
 
@@ -95,19 +90,22 @@ async def scan_dataset(
     db: AsyncSession = Depends(get_db),
 ):
     """Scan server path and import images into dataset."""
-    query = select(Dataset).where(Dataset.id == dataset_id)
-    result = await db.execute(query)
-    dataset = result.scalar_one_or_none()
+    dataset = await db.get(Dataset, dataset_id)
 
     if not dataset:
         raise HTTPException(status_code=404, detail="Dataset not found")
 
     importer = ImporterService(db)
-    return await importer.scan_directory(
+    response = await importer.scan_directory(
         dataset=dataset,
         glob_pattern=scan_request.glob,
         limit=scan_request.limit,
+        max_workers=scan_request.max_workers,
     )
+    # Commit first, or a listing in between could cache the pre-scan counts
+    await db.commit()
+    dataset_stats_cache.invalidate(dataset_id)
+    return response
 
 
 @router.delete("/datasets/{dataset_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -116,47 +114,13 @@ async def delete_dataset(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a dataset."""
-    query = select(Dataset).where(Dataset.id == dataset_id)
-    result = await db.execute(query)
-    dataset = result.scalar_one_or_none()
-
-    if not dataset:
+    # One statement; items, annotations and events go with it via ON DELETE CASCADE
+    result = await db.execute(delete(Dataset).where(Dataset.id == dataset_id))
+    if not result.rowcount:
         raise HTTPException(status_code=404, detail="Dataset not found")
 
-    await db.delete(dataset)
-    await db.flush()
-
-
-async def _get_dataset_stats(db: AsyncSession, dataset_id: int) -> dict:
-    """Get dataset statistics."""
-    base_query = select(func.count(Item.id)).where(Item.dataset_id == dataset_id)
-
-    # Total (excluding deleted)
-    total_query = base_query.where(Item.status != ItemStatus.DELETED)
-    result = await db.execute(total_query)
-    item_count = result.scalar() or 0
-
-    # Todo
-    todo_query = base_query.where(Item.status.in_([ItemStatus.TODO, ItemStatus.IN_PROGRESS]))
-    result = await db.execute(todo_query)
-    todo_count = result.scalar() or 0
-
-    # Done
-    done_query = base_query.where(Item.status == ItemStatus.DONE)
-    result = await db.execute(done_query)
-    done_count = result.scalar() or 0
-
-    # Skipped
-    skipped_query = base_query.where(Item.status == ItemStatus.SKIPPED)
-    result = await db.execute(skipped_query)
-    skipped_count = result.scalar() or 0
-
-    return {
-        "item_count": item_count,
-        "todo_count": todo_count,
-        "done_count": done_count,
-        "skipped_count": skipped_count,
-    }
+    await db.commit()
+    dataset_stats_cache.invalidate(dataset_id)
 
 
 def _dataset_to_response(
@@ -167,7 +131,8 @@ def _dataset_to_response(
     skipped_count: int,
 ) -> DatasetResponse:
     """Convert dataset to response with statistics."""
-    return DatasetResponse(
+    # Values come straight from the database; skip re-validating every field
+    return DatasetResponse.model_construct(
         id=dataset.id,
         project_id=dataset.project_id,
         name=dataset.name,
@@ -1,22 +1,42 @@
 """Export API endpoints."""
 
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import List, Optional
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.config import get_settings
-from app.core.database import get_db
+from app.core.database import get_db, get_session_factory
+from app.core.logging import get_logger
+from app.models.dataset import Dataset
+from app.models.export_job import ExportJob, ExportJobStatus
 from app.models.item import ItemStatus
 from app.models.project import Project
-from app.services.export import ExportService
-from sqlalchemy import select
+from app.schemas.export import ExportJobResponse
+from app.services.export import CLASSIFICATION_FORMATS, ExportService
+from app.services.export_jobs import run_export_job
 
 router = APIRouter()
 settings = get_settings()
+logger = get_logger(__name__)
+
+
+async def _log_export_errors(
+    chunks: AsyncIterator[bytes], dataset_id: int, format: str
+) -> AsyncIterator[bytes]:
+    # Headers are already sent by the time the archive fails, so the client
+    # only sees a truncated download; make sure the cause ends up in the logs.
+    try:
+        async for chunk in chunks:
+            yield chunk
+    except Exception:
+        logger.exception("Export of dataset %d as %s failed", dataset_id, format)
+        raise
 
 
 class ExportRequest(BaseModel):
@@ -26,6 +46,51 @@ class ExportRequest(BaseModel):
     status_filter: Optional[List[str]] = None  # done, in_progress, etc.
 
 
+async def _validate_export(
+    db: AsyncSession, dataset_id: int, format: str, status: Optional[List[str]]
+) -> tuple[Dataset, Optional[List[ItemStatus]]]:
+    """Check an export request before any work starts; return the dataset and parsed status filter."""
+    # Parse status filter
+    status_filter = None
+    if status:
+        try:
+            status_filter = [ItemStatus(s) for s in status]
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid status: {e}")
+    
+    # Get project to determine task type
+    dataset = await db.get(Dataset, dataset_id)
+    if not dataset:
+        raise HTTPException(status_code=404, detail="Dataset not found")
+    
+    # Get project
+    project = await db.get(Project, dataset.project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    # Validate the format up front: once streaming starts the status code is sent
+    if format in CLASSIFICATION_FORMATS:
+        if project.task_type != "classification":
+            raise HTTPException(
+                status_code=400,
+                detail=f"Format '{format}' is only for classification tasks"
+            )
+    elif project.task_type == "classification":
+        raise HTTPException(
+            status_code=400,
+            detail=f"{format.upper()} format is not for classification tasks. Use csv, json, or imagenet."
+        )
+    
+    return dataset, status_filter
+
+
+def _content_disposition(filename: str) -> str:
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
 @router.post("/datasets/{dataset_id}/export")
 async def export_dataset(
     dataset_id: int,
@@ -46,96 +111,91 @@ async def export_dataset(
         status: Filter by status (default: done only)
     
     Returns:
-        ZIP file download
+        ZIP file download, streamed as it is built
     """
-    # Parse status filter
-    status_filter = None
-    if status:
-        try:
-            status_filter = [ItemStatus(s) for s in status]
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=f"Invalid status: {e}")
-    
-    # Create export directory if not exists
-    # Use temp directory for exports to avoid permission issues
-    import tempfile
-    export_dir = Path(tempfile.gettempdir()) / "labelhub_exports"
-    export_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Get project to determine task type
-    from app.models.dataset import Dataset
-    query = select(Dataset).where(Dataset.id == dataset_id)
-    result = await db.execute(query)
-    dataset = result.scalar_one_or_none()
-    if not dataset:
-        raise HTTPException(status_code=404, detail="Dataset not found")
+    dataset, status_filter = await _validate_export(db, dataset_id, format, status)
     
-    # Get project
-    query = select(Project).where(Project.id == dataset.project_id)
-    result = await db.execute(query)
-    project = result.scalar_one_or_none()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
-    # Export based on format
     export_service = ExportService()
+    chunks = export_service.export(dataset_id, format, include_images, status_filter)
+    filename = export_service.export_filename(dataset.name, format)
     
-    try:
-        # Classification formats
-        if format in ["csv", "json", "imagenet"]:
-            if project.task_type != "classification":
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Format '{format}' is only for classification tasks"
-                )
-            zip_path = await export_service.export_classification(
-                db, dataset_id, export_dir, format, include_images, status_filter
-            )
-        # Detection/Segmentation formats
-        elif format == "coco":
-            if project.task_type == "classification":
-                raise HTTPException(
-                    status_code=400,
-                    detail="COCO format is not for classification tasks. Use csv, json, or imagenet."
-                )
-            zip_path = await export_service.export_coco(
-                db, dataset_id, export_dir, include_images, status_filter
-            )
-        elif format == "yolo":
-            if project.task_type == "classification":
-                raise HTTPException(
-                    status_code=400,
-                    detail="YOLO format is not for classification tasks. Use csv, json, or imagenet."
-                )
-            zip_path = await export_service.export_yolo(
-                db, dataset_id, export_dir, include_images, status_filter
-            )
-        elif format == "voc":
-            if project.task_type == "classification":
-                raise HTTPException(
-                    status_code=400,
-                    detail="VOC format is not for classification tasks. Use csv, json, or imagenet."
-                )
-            zip_path = await export_service.export_voc(
-                db, dataset_id, export_dir, include_images, status_filter
-            )
-        else:
-            raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
-        
-        # Return file for download
-        return FileResponse(
-            zip_path,
-            media_type="application/zip",
-            filename=zip_path.name,
-            headers={
-                "Content-Disposition": f'attachment; filename="{zip_path.name}"'
-            }
-        )
-    
-    except Exception as e:
-        import traceback
-        error_detail = f"Export failed: {str(e)}\n{traceback.format_exc()}"
-        print(f"[EXPORT ERROR] {error_detail}")  # Debug log
-        raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
+    return StreamingResponse(
+        _log_export_errors(chunks, dataset_id, format),
+        media_type="application/zip",
+        headers={"Content-Disposition": _content_disposition(filename)},
+    )
 
 
+@router.post(
+    "/datasets/{dataset_id}/exports",
+    response_model=ExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def create_export_job(
+    dataset_id: int,
+    background_tasks: BackgroundTasks,
+    format: str = Query(..., regex="^(coco|yolo|voc|csv|json|imagenet)$"),
+    include_images: bool = Query(False),
+    status: Optional[List[str]] = Query(None),
+    db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+):
+    """
+    Start a background export and return its job.
+
+    Takes the same parameters as the streaming export. Poll
+    ``GET /exports/{job_id}`` until the job is done, then fetch the archive
+    from ``GET /exports/{job_id}/download``.
+    """
+    dataset, status_filter = await _validate_export(db, dataset_id, format, status)
+
+    job = ExportJob(
+        dataset_id=dataset_id,
+        format=format,
+        include_images=include_images,
+        status_filter=[s.value for s in status_filter] if status_filter else None,
+        status=ExportJobStatus.PENDING,
+        filename=ExportService.export_filename(dataset.name, format),
+    )
+    db.add(job)
+    # The job runs on its own session, so it has to be able to see this row
+    await db.commit()
+
+    background_tasks.add_task(run_export_job, job.id, session_factory)
+    return job
+
+
+@router.get("/exports/{job_id}", response_model=ExportJobResponse)
+async def get_export_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+):
+    """Get the status of an export job."""
+    job = await db.get(ExportJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return job
+
+
+@router.get("/exports/{job_id}/download")
+async def download_export(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+):
+    """Download the archive of a finished export job."""
+    job = await db.get(ExportJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    if job.status != ExportJobStatus.DONE:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Export job is {job.status.value}" + (f": {job.error}" if job.error else ""),
+        )
+    if not job.file_path or not Path(job.file_path).is_file():
+        raise HTTPException(status_code=404, detail="Export file not found")
+
+    return FileResponse(
+        job.file_path,
+        media_type="application/zip",
+        headers={"Content-Disposition": _content_disposition(job.filename)},
+    )
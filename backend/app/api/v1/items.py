@@ -1,70 +1,157 @@
 """Item API endpoints."""
 
+import asyncio
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import FileResponse
-from sqlalchemy import func, select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import ColumnElement, Select, bindparam, exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload
+from starlette.concurrency import run_in_threadpool
 
+from app.core.config import get_settings
 from app.core.database import get_db
-from app.models.annotation import AnnotationEvent, ClassificationAnnotation, EventType
+from app.models.annotation import ClassificationAnnotation, EventType
 from app.models.dataset import Dataset
-from app.models.item import Item, ItemStatus
+from app.models.item import OPEN_STATUSES, Item, ItemStatus
 from app.schemas.item import ItemListResponse, ItemResponse, NextItemResponse
-from app.services.thumbs import ThumbnailService
-from app.services.cache import check_not_modified, add_cache_headers
+from app.services.thumbs import get_thumbnail_service
+from app.services.cache import check_not_modified, add_cache_headers, file_response
+from app.services.event_writer import event_writer
+from app.services.stats_cache import get_dataset_stats
 
 router = APIRouter()
+settings = get_settings()
+
+_thumb_semaphore = asyncio.Semaphore(settings.thumb_concurrency)
+
+_IMAGE_MEDIA_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+}
+
+# Current classification label of the outer Item (latest submission wins);
+# selected alongside items instead of loading their whole classification history
+_LATEST_LABEL = (
+    select(ClassificationAnnotation.label)
+    .where(ClassificationAnnotation.item_id == Item.id)
+    .order_by(ClassificationAnnotation.id.desc())
+    .limit(1)
+    .correlate(Item)
+    .scalar_subquery()
+    .label("label")
+)
+
+# Hot lookups are built once and bound per call (same as in annotations.py)
+_ITEM_EXISTS = select(exists().where(Item.id == bindparam("item_id")))
+
+# The status list is rendered inline rather than bound, so the planner can
+# match it against the predicate of the partial ix_items_open_queue index
+_NEXT_TODO_ITEM = (
+    select(Item, _LATEST_LABEL)
+    .where(Item.dataset_id == bindparam("dataset_id"))
+    .where(
+        Item.status.in_(
+            bindparam("open_statuses", OPEN_STATUSES, expanding=True, literal_execute=True)
+        )
+    )
+    .order_by(Item.id)
+    .limit(1)
+)
+
+
+def _neighbor_query(condition: ColumnElement[bool], order_by: ColumnElement):
+    # Same dataset as :item_id (resolved by subquery), excluding deleted
+    dataset_id = select(Item.dataset_id).where(Item.id == bindparam("item_id")).scalar_subquery()
+    return (
+        select(Item, _LATEST_LABEL)
+        .where(Item.dataset_id == dataset_id)
+        .where(condition)
+        .where(Item.status != ItemStatus.DELETED)
+        .order_by(order_by)
+        .limit(1)
+    )
+
+
+_PREVIOUS_ITEM = _neighbor_query(Item.id < bindparam("item_id"), Item.id.desc())
+_NEXT_ITEM = _neighbor_query(Item.id > bindparam("item_id"), Item.id.asc())
+
+# Hit on every thumbnail/image request
+_ITEM_PATH_BY_ID = (
+    select(Dataset.root_path, Item.rel_path)
+    .join(Dataset, Item.dataset_id == Dataset.id)
+    .where(Item.id == bindparam("item_id"))
+)
 
 
-@router.get("/datasets/{dataset_id}/items", response_model=ItemListResponse)
+@router.get(
+    "/datasets/{dataset_id}/items",
+    response_model=ItemListResponse,
+    response_class=ORJSONResponse,
+)
 async def list_items(
     dataset_id: int,
     status: ItemStatus | None = Query(None, description="Filter by status"),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
+    after_id: int | None = Query(
+        None, description="Return items after this ID (keyset pagination, preferred over page)"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
-    """List items in a dataset with pagination."""
+    """
+    List items in a dataset with pagination.
+
+    Pass the previous response's ``next_cursor`` as ``after_id`` to page
+    through large datasets: it seeks on the primary key instead of scanning
+    and discarding ``(page - 1) * page_size`` rows. ``page`` is ignored when
+    ``after_id`` is given.
+    """
     # Verify dataset exists
-    dataset_query = select(Dataset).where(Dataset.id == dataset_id)
-    result = await db.execute(dataset_query)
-    dataset = result.scalar_one_or_none()
-
-    if not dataset:
+    if not await db.scalar(select(exists().where(Dataset.id == dataset_id))):
         raise HTTPException(status_code=404, detail="Dataset not found")
 
-    # Base query
-    base_query = select(Item).where(Item.dataset_id == dataset_id)
-
-    # Apply status filter
+    # Shared by the count and the page query
+    filters = [Item.dataset_id == dataset_id]
     if status:
-        base_query = base_query.where(Item.status == status)
+        filters.append(Item.status == status)
     else:
         # Exclude deleted by default
-        base_query = base_query.where(Item.status != ItemStatus.DELETED)
+        filters.append(Item.status != ItemStatus.DELETED)
 
-    # Count total
-    count_query = select(func.count()).select_from(base_query.subquery())
+    # Count total directly on items so the (dataset_id, status) index is used
+    count_query = select(func.count(Item.id)).where(*filters)
     result = await db.execute(count_query)
     total = result.scalar() or 0
 
-    # Apply pagination
-    offset = (page - 1) * page_size
-    items_query = base_query.order_by(Item.id).offset(offset).limit(page_size)
-    items_query = items_query.options(selectinload(Item.classifications))
+    # Apply pagination; relationships are never needed for the listing, so
+    # touching one raises instead of issuing a query per item
+    items_query = (
+        select(Item, _LATEST_LABEL)
+        .options(raiseload("*"))
+        .where(*filters)
+        .order_by(Item.id)
+        .limit(page_size)
+    )
+    if after_id is not None:
+        items_query = items_query.where(Item.id > after_id)
+    else:
+        items_query = items_query.offset((page - 1) * page_size)
 
     result = await db.execute(items_query)
-    items = result.scalars().all()
+    rows = result.all()
 
-    return ItemListResponse(
-        items=[_item_to_response(item, dataset.root_path) for item in items],
+    return ItemListResponse.model_construct(
+        items=[_item_to_response(item, label) for item, label in rows],
         total=total,
         page=page,
         page_size=page_size,
         total_pages=(total + page_size - 1) // page_size,
+        next_cursor=rows[-1].Item.id if len(rows) == page_size else None,
     )
 
 
@@ -75,42 +162,21 @@ async def get_next_item(
 ):
     """Get the next item to annotate."""
     # Verify dataset exists and get it
-    dataset_query = select(Dataset).where(Dataset.id == dataset_id)
-    result = await db.execute(dataset_query)
-    dataset = result.scalar_one_or_none()
+    dataset = await db.get(Dataset, dataset_id)
 
     if not dataset:
         raise HTTPException(status_code=404, detail="Dataset not found")
 
     # Get next todo or in_progress item
-    item_query = (
-        select(Item)
-        .where(Item.dataset_id == dataset_id)
-        .where(Item.status.in_([ItemStatus.TODO, ItemStatus.IN_PROGRESS]))
-        .order_by(Item.id)
-        .limit(1)
-        .options(selectinload(Item.classifications))
-    )
-    result = await db.execute(item_query)
-    item = result.scalar_one_or_none()
+    result = await db.execute(_NEXT_TODO_ITEM, {"dataset_id": dataset_id})
+    item, label = result.one_or_none() or (None, None)
 
-    # Get counts
-    base_query = select(func.count(Item.id)).where(Item.dataset_id == dataset_id)
-
-    # Total (excluding deleted)
-    total_query = base_query.where(Item.status != ItemStatus.DELETED)
-    result = await db.execute(total_query)
-    total_count = result.scalar() or 0
-
-    # Done
-    done_query = base_query.where(Item.status == ItemStatus.DONE)
-    result = await db.execute(done_query)
-    done_count = result.scalar() or 0
-
-    # Remaining
-    remaining_query = base_query.where(Item.status.in_([ItemStatus.TODO, ItemStatus.IN_PROGRESS]))
-    result = await db.execute(remaining_query)
-    remaining_count = result.scalar() or 0
+    # Opening an item (todo -> in progress) leaves every count unchanged, so
+    # cached counts stay valid across it
+    stats = await get_dataset_stats(db, dataset_id)
+    total_count = stats["item_count"]
+    done_count = stats["done_count"]
+    remaining_count = stats["todo_count"]
 
     if item:
         # Set status to in_progress if todo
@@ -118,19 +184,20 @@ async def get_next_item(
             item.status = ItemStatus.IN_PROGRESS
 
         # Write open event
-        event = AnnotationEvent(
-            project_id=dataset.project_id,
-            dataset_id=dataset_id,
-            item_id=item.id,
-            event_type=EventType.OPEN,
-            payload=None,
+        await event_writer.write(
+            db,
+            {
+                "project_id": dataset.project_id,
+                "dataset_id": dataset_id,
+                "item_id": item.id,
+                "event_type": EventType.OPEN,
+                "payload": None,
+            },
         )
-        db.add(event)
         await db.flush()
-        await db.refresh(item)  # Refresh to get updated_at
 
         return NextItemResponse(
-            item=_item_to_response(item, dataset.root_path),
+            item=_item_to_response(item, label),
             remaining_count=remaining_count,
             total_count=total_count,
             done_count=done_count,
@@ -150,18 +217,15 @@ async def get_item(
     db: AsyncSession = Depends(get_db),
 ):
     """Get a single item by ID."""
-    query = (
-        select(Item)
-        .options(selectinload(Item.dataset), selectinload(Item.classifications))
-        .where(Item.id == item_id)
-    )
+    query = select(Item, _LATEST_LABEL).where(Item.id == item_id)
     result = await db.execute(query)
-    item = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not item:
+    if not row:
         raise HTTPException(status_code=404, detail="Item not found")
 
-    return _item_to_response(item, item.dataset.root_path)
+    item, label = row
+    return _item_to_response(item, label)
 
 
 @router.get("/items/{item_id}/previous", response_model=ItemResponse | None)
@@ -170,35 +234,7 @@ async def get_previous_item(
     db: AsyncSession = Depends(get_db),
 ):
     """Get the previous item in the dataset (by ID order)."""
-    # Get current item to know dataset
-    current_query = (
-        select(Item)
-        .options(selectinload(Item.dataset))
-        .where(Item.id == item_id)
-    )
-    result = await db.execute(current_query)
-    current_item = result.scalar_one_or_none()
-
-    if not current_item:
-        raise HTTPException(status_code=404, detail="Item not found")
-
-    # Get previous item (smaller ID in same dataset, excluding deleted)
-    prev_query = (
-        select(Item)
-        .options(selectinload(Item.dataset), selectinload(Item.classifications))
-        .where(Item.dataset_id == current_item.dataset_id)
-        .where(Item.id < item_id)
-        .where(Item.status != ItemStatus.DELETED)
-        .order_by(Item.id.desc())
-        .limit(1)
-    )
-    result = await db.execute(prev_query)
-    prev_item = result.scalar_one_or_none()
-
-    if not prev_item:
-        return None
-
-    return _item_to_response(prev_item, prev_item.dataset.root_path)
+    return await _get_neighbor_item(db, item_id, _PREVIOUS_ITEM)
 
 
 @router.get("/items/{item_id}/next", response_model=ItemResponse | None)
@@ -207,35 +243,27 @@ async def get_next_item_by_order(
     db: AsyncSession = Depends(get_db),
 ):
     """Get the next item in the dataset (by ID order, regardless of status)."""
-    # Get current item to know dataset
-    current_query = (
-        select(Item)
-        .options(selectinload(Item.dataset))
-        .where(Item.id == item_id)
-    )
-    result = await db.execute(current_query)
-    current_item = result.scalar_one_or_none()
+    return await _get_neighbor_item(db, item_id, _NEXT_ITEM)
 
-    if not current_item:
-        raise HTTPException(status_code=404, detail="Item not found")
 
-    # Get next item (larger ID in same dataset, excluding deleted)
-    next_query = (
-        select(Item)
-        .options(selectinload(Item.dataset), selectinload(Item.classifications))
-        .where(Item.dataset_id == current_item.dataset_id)
-        .where(Item.id > item_id)
-        .where(Item.status != ItemStatus.DELETED)
-        .order_by(Item.id.asc())
-        .limit(1)
-    )
-    result = await db.execute(next_query)
-    next_item = result.scalar_one_or_none()
+async def _get_neighbor_item(db: AsyncSession, item_id: int, query: Select) -> ItemResponse | None:
+    """
+    Fetch the neighbor of an item in its dataset in a single query.
+
+    The current item's dataset is resolved with a scalar subquery; the item
+    itself is only looked up again when there is no neighbor, to tell a
+    missing item (404) apart from the first/last item of a dataset.
+    """
+    result = await db.execute(query, {"item_id": item_id})
+    row = result.one_or_none()
 
-    if not next_item:
-        return None
+    if row:
+        neighbor, label = row
+        return _item_to_response(neighbor, label)
 
-    return _item_to_response(next_item, next_item.dataset.root_path)
+    if not await db.scalar(_ITEM_EXISTS, {"item_id": item_id}):
+        raise HTTPException(status_code=404, detail="Item not found")
+    return None
 
 
 @router.get("/items/{item_id}/thumb")
@@ -246,23 +274,20 @@ async def get_thumbnail(
     db: AsyncSession = Depends(get_db),
 ):
     """Get thumbnail for an item with HTTP caching support."""
-    # Get item with dataset
-    query = select(Item).options(selectinload(Item.dataset)).where(Item.id == item_id)
-    result = await db.execute(query)
-    item = result.scalar_one_or_none()
-
-    if not item:
-        raise HTTPException(status_code=404, detail="Item not found")
-
-    # Construct full path
-    full_path = Path(item.dataset.root_path) / item.rel_path
+    full_path = await _get_item_path(db, item_id)
 
     if not full_path.exists():
         raise HTTPException(status_code=404, detail="Image file not found")
 
-    # Generate thumbnail
-    thumb_service = ThumbnailService()
-    thumb_path = thumb_service.ensure_thumbnail(str(full_path), size)
+    thumb_service = get_thumbnail_service()
+    thumb_path = thumb_service.get_thumb_path(str(full_path), size)
+    if not thumb_path.exists():
+        # Decoding/resizing blocks; keep it off the event loop and bound how
+        # many run at once so a gallery of cold thumbnails can't hog the pool
+        async with _thumb_semaphore:
+            thumb_path = await run_in_threadpool(
+                thumb_service.ensure_thumbnail, str(full_path), size
+            )
 
     if not thumb_path or not thumb_path.exists():
         raise HTTPException(status_code=500, detail="Failed to generate thumbnail")
@@ -273,9 +298,11 @@ async def get_thumbnail(
         return not_modified_response
 
     # Return file with cache headers
-    response = FileResponse(
+    response = file_response(
         thumb_path,
         media_type="image/webp",
+        root=settings.thumb_root,
+        internal_location=settings.xaccel_thumb_location,
     )
     return add_cache_headers(
         response,
@@ -292,16 +319,7 @@ async def get_image(
     db: AsyncSession = Depends(get_db),
 ):
     """Get original or medium image for an item with HTTP caching support."""
-    # Get item with dataset
-    query = select(Item).options(selectinload(Item.dataset)).where(Item.id == item_id)
-    result = await db.execute(query)
-    item = result.scalar_one_or_none()
-
-    if not item:
-        raise HTTPException(status_code=404, detail="Item not found")
-
-    # Construct full path
-    full_path = Path(item.dataset.root_path) / item.rel_path
+    full_path = await _get_item_path(db, item_id)
 
     if not full_path.exists():
         raise HTTPException(status_code=404, detail="Image file not found")
@@ -312,15 +330,7 @@ async def get_image(
         return not_modified_response
 
     # Determine media type from extension
-    extension = full_path.suffix.lower()
-    media_types = {
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".png": "image/png",
-        ".webp": "image/webp",
-        ".gif": "image/gif",
-    }
-    media_type = media_types.get(extension, "application/octet-stream")
+    media_type = _IMAGE_MEDIA_TYPES.get(full_path.suffix.lower(), "application/octet-stream")
 
     # Return file with cache headers
     cache_control = (
@@ -328,18 +338,31 @@ async def get_image(
         if variant == "medium"
         else "public, max-age=3600"
     )
-    response = FileResponse(full_path, media_type=media_type)
+    response = file_response(
+        full_path,
+        media_type=media_type,
+        root=settings.media_root,
+        internal_location=settings.xaccel_media_location,
+    )
     return add_cache_headers(response, full_path, cache_control=cache_control)
 
 
-def _item_to_response(item: Item, root_path: str) -> ItemResponse:
-    """Convert item to response."""
-    # Get current label if any
-    current_label = None
-    if item.classifications:
-        current_label = item.classifications[-1].label
+async def _get_item_path(db: AsyncSession, item_id: int) -> Path:
+    """Resolve an item's image path without loading the Item/Dataset entities."""
+    result = await db.execute(_ITEM_PATH_BY_ID, {"item_id": item_id})
+    row = result.one_or_none()
+
+    if not row:
+        raise HTTPException(status_code=404, detail="Item not found")
+
+    root_path, rel_path = row
+    return Path(root_path) / rel_path
+
 
-    return ItemResponse(
+def _item_to_response(item: Item, label: str | None) -> ItemResponse:
+    """Convert item to response, with its current classification label if any."""
+    # Values come straight from the database; skip re-validating every field
+    return ItemResponse.model_construct(
         id=item.id,
         dataset_id=item.dataset_id,
         rel_path=item.rel_path,
@@ -351,8 +374,6 @@ def _item_to_response(item: Item, root_path: str) -> ItemResponse:
         skip_reason=item.skip_reason,
         created_at=item.created_at,
         updated_at=item.updated_at,
-        thumb_url=f"/api/v1/items/{item.id}/thumb",
-        image_url=f"/api/v1/items/{item.id}/image",
-        label=current_label,
+        label=label,
     )
 
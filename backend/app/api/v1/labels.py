@@ -1,7 +1,7 @@
 """Label API endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import delete, select
+from sqlalchemy import delete, exists, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -18,15 +18,15 @@ async def list_labels(
     db: AsyncSession = Depends(get_db),
 ):
     """Get all labels for a project."""
-    # Verify project exists
-    project_query = select(Project).where(Project.id == project_id)
-    result = await db.execute(project_query)
-    if not result.scalar_one_or_none():
-        raise HTTPException(status_code=404, detail="Project not found")
-
     query = select(Label).where(Label.project_id == project_id).order_by(Label.order)
     result = await db.execute(query)
-    return result.scalars().all()
+    labels = result.scalars().all()
+
+    # No labels: tell an empty project apart from a missing one
+    if not labels:
+        await _verify_project(db, project_id)
+
+    return labels
 
 
 @router.post(
@@ -40,35 +40,27 @@ async def set_labels(
     db: AsyncSession = Depends(get_db),
 ):
     """Set labels for a project (replaces existing labels)."""
-    # Verify project exists
-    project_query = select(Project).where(Project.id == project_id)
-    result = await db.execute(project_query)
-    if not result.scalar_one_or_none():
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    # Delete existing labels
-    await db.execute(delete(Label).where(Label.project_id == project_id))
-
-    # Create new labels
-    new_labels = []
-    for idx, label_data in enumerate(labels_in.labels):
-        label = Label(
-            project_id=project_id,
-            name=label_data.name,
-            color=label_data.color,
-            shortcut=label_data.shortcut or (str(idx + 1) if idx < 9 else None),
-            order=idx,
-        )
-        db.add(label)
-        new_labels.append(label)
-
-    await db.flush()
-
-    # Refresh to get IDs
-    for label in new_labels:
-        await db.refresh(label)
-
-    return new_labels
+    # Delete existing labels; if any were deleted the project exists
+    result = await db.execute(delete(Label).where(Label.project_id == project_id))
+    if not result.rowcount:
+        await _verify_project(db, project_id)
+
+    # Create new labels in one INSERT ... RETURNING (ids and created_at included)
+    result = await db.scalars(
+        insert(Label).returning(Label),
+        [
+            {
+                "project_id": project_id,
+                "name": label_data.name,
+                "color": label_data.color,
+                "shortcut": label_data.shortcut or (str(idx + 1) if idx < 9 else None),
+                "order": idx,
+            }
+            for idx, label_data in enumerate(labels_in.labels)
+        ],
+    )
+    # Batched RETURNING rows come back in no guaranteed order
+    return sorted(result.all(), key=lambda label: label.order)
 
 
 @router.post(
@@ -82,16 +74,18 @@ async def add_label(
     db: AsyncSession = Depends(get_db),
 ):
     """Add a single label to a project."""
-    # Verify project exists
-    project_query = select(Project).where(Project.id == project_id)
-    result = await db.execute(project_query)
-    if not result.scalar_one_or_none():
-        raise HTTPException(status_code=404, detail="Project not found")
+    # Verify project exists and get max order in one query
+    max_order_query = (
+        select(func.coalesce(func.max(Label.order), -1))
+        .where(Label.project_id == project_id)
+        .scalar_subquery()
+    )
+    query = select(max_order_query).where(Project.id == project_id)
+    result = await db.execute(query)
+    max_order = result.scalar_one_or_none()
 
-    # Get max order
-    order_query = select(Label.order).where(Label.project_id == project_id).order_by(Label.order.desc()).limit(1)
-    result = await db.execute(order_query)
-    max_order = result.scalar() or -1
+    if max_order is None:
+        raise HTTPException(status_code=404, detail="Project not found")
 
     label = Label(
         project_id=project_id,
@@ -102,7 +96,6 @@ async def add_label(
     )
     db.add(label)
     await db.flush()
-    await db.refresh(label)
 
     return label
 
@@ -113,12 +106,15 @@ async def delete_label(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a label."""
-    query = select(Label).where(Label.id == label_id)
-    result = await db.execute(query)
-    label = result.scalar_one_or_none()
+    label = await db.get(Label, label_id)
 
     if not label:
         raise HTTPException(status_code=404, detail="Label not found")
 
     await db.delete(label)
 
+
+async def _verify_project(db: AsyncSession, project_id: int) -> None:
+    """Raise 404 if the project does not exist."""
+    if not await db.scalar(select(exists().where(Project.id == project_id))):
+        raise HTTPException(status_code=404, detail="Project not found")
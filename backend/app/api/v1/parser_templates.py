@@ -1,34 +1,81 @@
 """Parser Template API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+import io
+from collections.abc import Iterator
+from itertools import islice
+from typing import Any
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.models.parser_template import ParserTemplate
 from app.schemas.parser_template import (
     ParserTemplateCreate,
+    ParserTemplateListResponse,
     ParserTemplateResponse,
     ParserTemplateUpdate,
     ParseTestRequest,
     ParseTestResponse,
 )
-from app.services.parser import ParserService
+from app.services.parser import ParserService, compile_path
+from app.services.template_cache import template_cache
 
 router = APIRouter()
 
+# Columns of ParserTemplateResponse, for endpoints that skip the ORM
+_TEMPLATE_COLUMNS = [
+    getattr(ParserTemplate, name) for name in ParserTemplateResponse.model_fields
+]
+
+# Template fields a parser is configured from
+_CONFIG_FIELDS = ("input_type", "input_encoding", "record_path", "mapping", "validation")
+
 
-@router.get("/parser-templates", response_model=list[ParserTemplateResponse])
+@router.get("/parser-templates", response_model=ParserTemplateListResponse)
 async def list_templates(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=200),
     db: AsyncSession = Depends(get_db),
 ):
-    """List all parser templates."""
-    query = select(ParserTemplate).order_by(
-        ParserTemplate.is_builtin.desc(),
-        ParserTemplate.created_at.desc()
+    """
+    List parser templates, built-in ones first, with pagination.
+
+    Rows are selected as plain columns and serialized straight to JSON
+    instead of going through ORM objects and response models. Pages are
+    cached in-process until a template is created, updated or deleted.
+    """
+    payload = template_cache.get_page(page, page_size)
+    if payload is not None:
+        return ORJSONResponse(payload)
+
+    version = template_cache.version
+    result = await db.execute(select(func.count(ParserTemplate.id)))
+    total = result.scalar() or 0
+
+    query = (
+        select(*_TEMPLATE_COLUMNS)
+        .order_by(
+            ParserTemplate.is_builtin.desc(),
+            ParserTemplate.created_at.desc(),
+            ParserTemplate.id.desc(),
+        )
+        .limit(page_size)
+        .offset((page - 1) * page_size)
     )
     result = await db.execute(query)
-    return result.scalars().all()
+    payload = {
+        "items": [row._asdict() for row in result],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": (total + page_size - 1) // page_size,
+    }
+    template_cache.set_page(version, page, page_size, payload)
+    return ORJSONResponse(payload)
 
 
 @router.get("/parser-templates/{template_id}", response_model=ParserTemplateResponse)
@@ -37,14 +84,7 @@ async def get_template(
     db: AsyncSession = Depends(get_db),
 ):
     """Get a parser template by ID."""
-    query = select(ParserTemplate).where(ParserTemplate.id == template_id)
-    result = await db.execute(query)
-    template = result.scalar_one_or_none()
-    
-    if not template:
-        raise HTTPException(status_code=404, detail="Template not found")
-    
-    return template
+    return ORJSONResponse(await _get_cached_template(db, template_id))
 
 
 @router.post(
@@ -71,6 +111,7 @@ async def create_template(
     db.add(template)
     await db.commit()
     await db.refresh(template)
+    template_cache.invalidate()
     
     return template
 
@@ -82,9 +123,7 @@ async def update_template(
     db: AsyncSession = Depends(get_db),
 ):
     """Update a parser template."""
-    query = select(ParserTemplate).where(ParserTemplate.id == template_id)
-    result = await db.execute(query)
-    template = result.scalar_one_or_none()
+    template = await db.get(ParserTemplate, template_id)
     
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
@@ -95,24 +134,18 @@ async def update_template(
             detail="Cannot modify builtin templates"
         )
     
-    # Update fields
-    if template_in.name is not None:
-        template.name = template_in.name
-    if template_in.description is not None:
-        template.description = template_in.description
-    if template_in.input_type is not None:
-        template.input_type = template_in.input_type
-    if template_in.input_encoding is not None:
-        template.input_encoding = template_in.input_encoding
-    if template_in.record_path is not None:
-        template.record_path = template_in.record_path
-    if template_in.mapping is not None:
-        template.mapping = template_in.mapping
-    if template_in.validation is not None:
-        template.validation = template_in.validation
+    # Apply only the fields that actually change; a no-op update skips the
+    # commit, the refresh and the cache invalidation
+    changed = False
+    for field, value in template_in.model_dump(exclude_none=True).items():
+        if getattr(template, field) != value:
+            setattr(template, field, value)
+            changed = True
     
-    await db.commit()
-    await db.refresh(template)
+    if changed:
+        await db.commit()
+        await db.refresh(template)
+        template_cache.invalidate()
     
     return template
 
@@ -123,9 +156,7 @@ async def delete_template(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a parser template."""
-    query = select(ParserTemplate).where(ParserTemplate.id == template_id)
-    result = await db.execute(query)
-    template = result.scalar_one_or_none()
+    template = await db.get(ParserTemplate, template_id)
     
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
@@ -138,6 +169,7 @@ async def delete_template(
     
     await db.delete(template)
     await db.commit()
+    template_cache.invalidate()
 
 
 @router.post("/parser-templates/test", response_model=ParseTestResponse)
@@ -148,20 +180,8 @@ async def test_template(
     """Test a parser template with sample data."""
     # Get template config
     if test_request.template_id is not None:
-        query = select(ParserTemplate).where(ParserTemplate.id == test_request.template_id)
-        result = await db.execute(query)
-        template = result.scalar_one_or_none()
-        
-        if not template:
-            raise HTTPException(status_code=404, detail="Template not found")
-        
-        template_config = {
-            "input_type": template.input_type,
-            "input_encoding": template.input_encoding,
-            "record_path": template.record_path,
-            "mapping": template.mapping,
-            "validation": template.validation,
-        }
+        template = await _get_cached_template(db, test_request.template_id)
+        template_config = {field: template[field] for field in _CONFIG_FIELDS}
     elif test_request.template is not None:
         template_config = {
             "input_type": test_request.template.input_type,
@@ -176,57 +196,89 @@ async def test_template(
             detail="Either template_id or template must be provided"
         )
     
-    # Parse data
+    # Parsing runs as the body is sent: a sync iterator is consumed in the
+    # threadpool, so large samples neither block the event loop nor build
+    # the whole predictions list before encoding
+    return StreamingResponse(
+        _iter_test_results(template_config, test_request.sample_data, test_request.max_records),
+        media_type="application/json",
+    )
+
+
+async def _get_cached_template(db: AsyncSession, template_id: int) -> dict:
+    """Return a template's response fields, from the cache when possible."""
+    template = template_cache.get_template(template_id)
+    if template is not None:
+        return template
+
+    version = template_cache.version
+    result = await db.execute(
+        select(*_TEMPLATE_COLUMNS).where(ParserTemplate.id == template_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Template not found")
+
+    template = row._asdict()
+    template_cache.set_template(version, template_id, template)
+    return template
+
+
+def _iter_sample_records(
+    template_config: dict, sample_data: str, max_records: int
+) -> Iterator[tuple[int, Any]]:
+    """Yield ``(line, record)`` pairs from sample data, at most ``max_records``."""
+    if template_config["input_type"] == "jsonl":
+        # Parse JSONL line by line, reading no further than max_records
+        lines = islice(io.StringIO(sample_data), max_records)
+        for idx, line in enumerate(lines):
+            if line.strip():
+                yield idx + 1, line
+    else:  # json
+        data = orjson.loads(sample_data)
+        
+        # Extract records based on record_path
+        if template_config["record_path"]:
+            records = compile_path(template_config["record_path"])(data)
+            if not isinstance(records, list):
+                records = [records] if records else []
+        else:
+            records = [data] if isinstance(data, dict) else data
+        
+        for idx, record in enumerate(records[:max_records]):
+            yield idx + 1, record
+
+
+def _iter_test_results(template_config: dict, sample_data: str, max_records: int) -> Iterator[bytes]:
+    """
+    Parse sample data and yield a ParseTestResponse JSON document in pieces.
+
+    Each prediction is encoded as soon as it is parsed; the summary fields
+    follow the predictions array.
+    """
     errors = []
-    predictions = []
+    records_parsed = 0
     
+    yield b'{"predictions":['
     try:
         # Initialize parser service
         parser = ParserService(template_config)
         
-        # Parse based on input type
-        if template_config["input_type"] == "jsonl":
-            # Parse JSONL line by line
-            lines = test_request.sample_data.strip().split('\n')
-            for idx, line in enumerate(lines[:test_request.max_records]):
-                if not line.strip():
-                    continue
-                try:
-                    record = parser.parse_record(line)
-                    if record:
-                        predictions.append(record)
-                except Exception as e:
-                    errors.append({"line": idx + 1, "error": str(e)})
-        else:  # json
-            # Parse JSON
-            import json
-            data = json.loads(test_request.sample_data)
-            
-            # Extract records based on record_path
-            if template_config["record_path"]:
-                import jmespath
-                records = jmespath.search(template_config["record_path"], data)
-                if not isinstance(records, list):
-                    records = [records] if records else []
-            else:
-                records = [data] if isinstance(data, dict) else data
-            
-            # Parse each record
-            for idx, record in enumerate(records[:test_request.max_records]):
-                try:
-                    parsed = parser.parse_record(record)
-                    if parsed:
-                        predictions.append(parsed)
-                except Exception as e:
-                    errors.append({"line": idx + 1, "error": str(e)})
-        
+        for line, record in _iter_sample_records(template_config, sample_data, max_records):
+            try:
+                prediction = parser.parse_record(record)
+            except Exception as e:
+                errors.append({"line": line, "error": str(e)})
+                continue
+            if prediction:
+                yield (b"," if records_parsed else b"") + orjson.dumps(prediction.model_dump())
+                records_parsed += 1
     except Exception as e:
         errors.append({"error": f"Parse failed: {str(e)}"})
     
-    return ParseTestResponse(
-        success=len(errors) == 0 and len(predictions) > 0,
-        records_parsed=len(predictions),
-        predictions=predictions,
-        errors=errors,
-    )
-
+    summary = orjson.dumps({
+        "success": not errors and records_parsed > 0,
+        "records_parsed": records_parsed,
+        "errors": errors,
+    })
+    yield b"]," + summary[1:]
@@ -1,19 +1,25 @@
 """Project API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import distinct, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.database import get_db
 from app.models.dataset import Dataset
 from app.models.item import Item, ItemStatus
 from app.models.label import Label
 from app.models.project import Project
-from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
+from app.schemas.label import LabelResponse
+from app.schemas.project import ProjectCreate, ProjectListResponse, ProjectResponse, ProjectUpdate
 
 router = APIRouter()
 
+_LABELS_ADAPTER = TypeAdapter(list[LabelResponse])
+
 
 @router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 async def create_project(
@@ -29,40 +35,66 @@ async def create_project(
     db.add(project)
     await db.flush()
 
-    # Create labels if provided
-    for idx, label_data in enumerate(project_in.labels):
-        label = Label(
-            project_id=project.id,
-            name=label_data.name,
-            color=label_data.color,
-            shortcut=label_data.shortcut or str(idx + 1) if idx < 9 else None,
-            order=idx,
+    # Create all labels in one INSERT ... RETURNING, as set_labels does
+    labels = []
+    if project_in.labels:
+        result = await db.scalars(
+            insert(Label).returning(Label),
+            [
+                {
+                    "project_id": project.id,
+                    "name": label_data.name,
+                    "color": label_data.color,
+                    "shortcut": label_data.shortcut or (str(idx + 1) if idx < 9 else None),
+                    "order": idx,
+                }
+                for idx, label_data in enumerate(project_in.labels)
+            ],
         )
-        db.add(label)
-
-    await db.flush()
-    await db.refresh(project, ["labels"])
+        labels = sorted(result.all(), key=lambda label: label.order)
+    set_committed_value(project, "labels", labels)
 
     return _project_to_response(project, 0, 0, 0)
 
 
-@router.get("", response_model=list[ProjectResponse])
+@router.get("", response_model=ProjectListResponse)
 async def list_projects(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=200),
     db: AsyncSession = Depends(get_db),
 ):
-    """List all projects with statistics."""
-    # Get projects with labels
-    query = select(Project).options(selectinload(Project.labels)).order_by(Project.created_at.desc())
+    """
+    List projects with statistics, newest first, with pagination.
+
+    Responses are built from trusted database values, so they are dumped and
+    encoded directly rather than validated again against the response model.
+    """
+    result = await db.execute(select(func.count(Project.id)))
+    total = result.scalar() or 0
+
+    # Get the page of projects with labels; any other relationship would be
+    # a query per project, so it raises instead
+    query = (
+        select(Project)
+        .options(selectinload(Project.labels), raiseload("*"))
+        .order_by(Project.created_at.desc(), Project.id.desc())
+        .limit(page_size)
+        .offset((page - 1) * page_size)
+    )
     result = await db.execute(query)
     projects = result.scalars().all()
 
-    responses = []
-    for project in projects:
-        # Get counts
-        stats = await _get_project_stats(db, project.id)
-        responses.append(_project_to_response(project, **stats))
-
-    return responses
+    stats = await _get_projects_stats(db, [project.id for project in projects])
+    return ORJSONResponse({
+        "items": [
+            _project_to_response(project, **stats[project.id]).model_dump(mode="json")
+            for project in projects
+        ],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": (total + page_size - 1) // page_size,
+    })
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
@@ -71,9 +103,7 @@ async def get_project(
     db: AsyncSession = Depends(get_db),
 ):
     """Get a project by ID."""
-    query = select(Project).options(selectinload(Project.labels)).where(Project.id == project_id)
-    result = await db.execute(query)
-    project = result.scalar_one_or_none()
+    project = await db.get(Project, project_id, options=[selectinload(Project.labels)])
 
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -89,20 +119,22 @@ async def update_project(
     db: AsyncSession = Depends(get_db),
 ):
     """Update a project."""
-    query = select(Project).options(selectinload(Project.labels)).where(Project.id == project_id)
-    result = await db.execute(query)
-    project = result.scalar_one_or_none()
+    project = await db.get(Project, project_id, options=[selectinload(Project.labels)])
 
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    if project_in.name is not None:
-        project.name = project_in.name
-    if project_in.description is not None:
-        project.description = project_in.description
+    # Apply only the fields that actually change; a no-op update skips the
+    # flush and the refresh that reloads updated_at
+    changed = False
+    for field, value in project_in.model_dump(exclude_none=True).items():
+        if getattr(project, field) != value:
+            setattr(project, field, value)
+            changed = True
 
-    await db.flush()
-    await db.refresh(project)
+    if changed:
+        await db.flush()
+        await db.refresh(project)
 
     stats = await _get_project_stats(db, project.id)
     return _project_to_response(project, **stats)
@@ -114,9 +146,7 @@ async def delete_project(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a project."""
-    query = select(Project).where(Project.id == project_id)
-    result = await db.execute(query)
-    project = result.scalar_one_or_none()
+    project = await db.get(Project, project_id)
 
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -127,36 +157,39 @@ async def delete_project(
 
 async def _get_project_stats(db: AsyncSession, project_id: int) -> dict:
     """Get project statistics."""
-    # Count datasets
-    dataset_query = select(func.count(Dataset.id)).where(Dataset.project_id == project_id)
-    result = await db.execute(dataset_query)
-    dataset_count = result.scalar() or 0
-
-    # Count items through datasets
-    item_query = (
-        select(func.count(Item.id))
-        .join(Dataset)
-        .where(Dataset.project_id == project_id)
-        .where(Item.status != ItemStatus.DELETED)
-    )
-    result = await db.execute(item_query)
-    item_count = result.scalar() or 0
-
-    # Count done items
-    done_query = (
-        select(func.count(Item.id))
-        .join(Dataset)
-        .where(Dataset.project_id == project_id)
-        .where(Item.status == ItemStatus.DONE)
-    )
-    result = await db.execute(done_query)
-    done_count = result.scalar() or 0
+    return (await _get_projects_stats(db, [project_id]))[project_id]
 
-    return {
-        "dataset_count": dataset_count,
-        "item_count": item_count,
-        "done_count": done_count,
+
+async def _get_projects_stats(db: AsyncSession, project_ids: list[int]) -> dict[int, dict]:
+    """Get statistics for several projects with one grouped query, keyed by project ID."""
+    stats = {
+        project_id: {"dataset_count": 0, "item_count": 0, "done_count": 0}
+        for project_id in project_ids
     }
+    if not stats:
+        return stats
+
+    query = (
+        select(
+            Dataset.project_id,
+            func.count(distinct(Dataset.id)),
+            func.count(Item.id).filter(Item.status != ItemStatus.DELETED),
+            func.count(Item.id).filter(Item.status == ItemStatus.DONE),
+        )
+        .select_from(Dataset)
+        .outerjoin(Item, Item.dataset_id == Dataset.id)
+        .where(Dataset.project_id.in_(project_ids))
+        .group_by(Dataset.project_id)
+    )
+    result = await db.execute(query)
+
+    for project_id, dataset_count, item_count, done_count in result:
+        stats[project_id] = {
+            "dataset_count": dataset_count,
+            "item_count": item_count,
+            "done_count": done_count,
+        }
+    return stats
 
 
 def _project_to_response(
@@ -166,25 +199,16 @@ def _project_to_response(
     done_count: int,
 ) -> ProjectResponse:
     """Convert project to response with statistics."""
-    return ProjectResponse(
+    # Values come straight from the database; skip re-validating the project
+    # fields and build the labels in a single pydantic-core call
+    return ProjectResponse.model_construct(
         id=project.id,
         name=project.name,
         description=project.description,
         task_type=project.task_type,
         created_at=project.created_at,
         updated_at=project.updated_at,
-        labels=[
-            {
-                "id": label.id,
-                "project_id": label.project_id,
-                "name": label.name,
-                "color": label.color,
-                "shortcut": label.shortcut,
-                "order": label.order,
-                "created_at": label.created_at,
-            }
-            for label in project.labels
-        ],
+        labels=_LABELS_ADAPTER.validate_python(project.labels, from_attributes=True),
         dataset_count=dataset_count,
         item_count=item_count,
         done_count=done_count,
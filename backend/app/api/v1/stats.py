@@ -5,6 +5,7 @@ Statistics API endpoints
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -24,10 +25,7 @@ async def get_project_overview_stats(
     """
     Get overview statistics for a project or dataset
     """
-    # Verify project exists
-    project = await db.get(Project, project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    await _verify_project(db, project_id)
 
     stats = await StatsService.get_overview_stats(db, project_id, dataset_id)
     return stats
@@ -43,10 +41,7 @@ async def get_project_daily_stats(
     """
     Get daily statistics for a project or dataset
     """
-    # Verify project exists
-    project = await db.get(Project, project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    await _verify_project(db, project_id)
 
     stats = await StatsService.get_daily_stats(db, project_id, dataset_id, days)
     return stats
@@ -62,11 +57,13 @@ async def get_project_annotator_stats(
     Get per-annotator statistics for a project or dataset
     (Placeholder in v1 single-user mode)
     """
-    # Verify project exists
-    project = await db.get(Project, project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    await _verify_project(db, project_id)
 
     stats = await StatsService.get_annotator_stats(db, project_id, dataset_id)
     return stats
 
+
+async def _verify_project(db: AsyncSession, project_id: int) -> None:
+    """Raise 404 if the project does not exist."""
+    if not await db.scalar(select(exists().where(Project.id == project_id))):
+        raise HTTPException(status_code=404, detail="Project not found")
@@ -1,6 +1,6 @@
 """Application configuration using Pydantic Settings."""
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Literal
 
 from pydantic import Field
@@ -27,6 +27,37 @@ class Settings(BaseSettings):
         default="sqlite+aiosqlite:///./labelhub.db",
         description="Database connection URL",
     )
+    db_pool_size: int = Field(default=20, description="Connections kept open in the pool (non-SQLite)")
+    db_max_overflow: int = Field(default=20, description="Extra connections allowed above db_pool_size")
+    db_pool_recycle: int = Field(default=1800, description="Seconds before a pooled connection is replaced")
+    sqlite_pool_size: int = Field(
+        default=8,
+        description="SQLite connections kept open, each with its own warm page cache",
+    )
+    db_null_pool: bool = Field(
+        default=False,
+        description="Disable application-side pooling, e.g. behind PgBouncer in transaction mode",
+    )
+
+    # Annotation event writer
+    event_writer_batch_size: int = Field(
+        default=500,
+        description="Maximum annotation events written per bulk INSERT",
+    )
+    event_writer_flush_ms: int = Field(
+        default=50,
+        description="Maximum time an annotation event waits in the buffer before being written",
+    )
+
+    # Stats
+    stats_cache_ttl: float = Field(
+        default=5.0,
+        description="Seconds dataset status counts are cached (0 disables the cache)",
+    )
+    template_cache_ttl: float = Field(
+        default=60.0,
+        description="Seconds parser template reads are cached (0 disables the cache)",
+    )
 
     # CORS
     cors_origins: str = Field(
@@ -44,15 +75,35 @@ class Settings(BaseSettings):
         description="Directory to store generated thumbnails",
     )
     thumb_size: int = Field(default=256, description="Thumbnail size in pixels")
+    thumb_concurrency: int = Field(
+        default=4,
+        description="Maximum thumbnails decoded/encoded at once in the threadpool",
+    )
+    export_root: str = Field(
+        default="./exports",
+        description="Directory to store archives built by background export jobs",
+    )
+    use_xaccel: bool = Field(
+        default=False,
+        description="Let the Nginx in front of the API send media files via X-Accel-Redirect",
+    )
+    xaccel_media_location: str = Field(
+        default="/internal-media/",
+        description="Internal Nginx location aliased to media_root",
+    )
+    xaccel_thumb_location: str = Field(
+        default="/internal-thumbs/",
+        description="Internal Nginx location aliased to thumb_root",
+    )
 
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
     log_level: Literal["debug", "info", "warning", "error"] = "info"
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
-        """Parse CORS origins string into a list."""
+        """Parse CORS origins string into a list (once per Settings instance)."""
         return [origin.strip() for origin in self.cors_origins.split(",") if origin.strip()]
 
 
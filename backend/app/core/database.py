@@ -1,20 +1,100 @@
 """Database configuration and session management."""
 
 from collections.abc import AsyncGenerator
+from typing import Any
 
+import orjson
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
+# Applied to every new SQLite connection: WAL lets readers proceed during a
+# write, synchronous=NORMAL is durable in WAL mode without an fsync per commit,
+# and a 64 MiB page cache keeps hot pages of a pooled connection in memory
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Connection ``connect`` event handler applying ``SQLITE_PRAGMAS``."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def set_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    """
+    Connection ``connect`` event handler turning on foreign key enforcement.
+
+    SQLite ignores ``ON DELETE CASCADE`` unless this is on, and bulk DELETEs
+    rely on it to remove child rows. Kept out of ``SQLITE_PRAGMAS`` because
+    migrations must not have it: Alembic's batch mode rebuilds a table by
+    dropping it, which would cascade into every referencing table.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def json_serializer(value: Any) -> str:
+    """
+    Encode JSON/JSONB column values with orjson.
+
+    SQLAlchemy passes the result to the driver as text, so it is decoded to
+    ``str``; non-string dict keys are stringified as the stdlib encoder does.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _pool_options() -> dict:
+    """Pool arguments for the engine."""
+    if settings.database_url.startswith("sqlite"):
+        if ":memory:" in settings.database_url:
+            return {}
+        # Connections to a local file never go stale; keep enough open that
+        # their page caches stay warm instead of being closed on return as
+        # overflow. Bursts (e.g. long exports) still get overflow connections.
+        return {"pool_size": settings.sqlite_pool_size}
+    if settings.db_null_pool:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True,
+        # Reuse the most recently returned connection so idle ones can age out
+        "pool_use_lifo": True,
+    }
+
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     future=True,
+    # Default is 500; the API's distinct statements plus ORM variants exceed it
+    query_cache_size=1200,
+    # JSON columns (event payloads, annotation points, template mappings)
+    # are encoded and decoded with orjson; on asyncpg the decoder is
+    # registered as the json/jsonb type codec
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
+    **_pool_options(),
 )
+if engine.dialect.name == "sqlite":
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+    event.listen(engine.sync_engine, "connect", set_sqlite_foreign_keys)
 
 # Session factory
 async_session_factory = async_sessionmaker(
@@ -45,6 +125,16 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Dependency to get the session factory, for work outliving the request session."""
+    return async_session_factory
+
+
+async def close_db() -> None:
+    """Close all pooled connections."""
+    await engine.dispose()
+
+
 async def init_db() -> None:
     """Initialize database tables."""
     async with engine.begin() as conn:
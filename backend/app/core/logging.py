@@ -1,33 +1,64 @@
 """Logging configuration."""
 
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Literal
 
 from app.core.config import get_settings
 
+_queue_handler: QueueHandler | None = None
+_listener: QueueListener | None = None
+
 
 def setup_logging(
     level: Literal["debug", "info", "warning", "error"] | None = None,
 ) -> None:
-    """Configure application logging."""
+    """
+    Configure application logging.
+
+    Log calls only put the record on a queue; a listener thread formats it
+    and writes it to stdout, so request handlers never wait on the stream.
+    Call ``stop_logging()`` on shutdown to flush what is still queued.
+    """
+    global _queue_handler, _listener
     settings = get_settings()
     log_level = (level or settings.log_level).upper()
 
-    # Configure root logger
-    logging.basicConfig(
-        level=getattr(logging, log_level),
-        format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(
+        "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[logging.StreamHandler(sys.stdout)],
-    )
+    ))
+    queue_handler = QueueHandler(queue.SimpleQueue())
+    # Only merge the message with its arguments and traceback before
+    # queueing; the stream handler adds the timestamp, level and logger name
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    # Configure root logger
+    logging.basicConfig(level=getattr(logging, log_level), handlers=[queue_handler])
+
+    # basicConfig leaves an already configured root logger alone
+    if queue_handler in logging.getLogger().handlers:
+        _queue_handler = queue_handler
+        _listener = QueueListener(queue_handler.queue, stream_handler)
+        _listener.start()
 
     # Reduce noise from third-party libraries
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
 
 
+def stop_logging() -> None:
+    """Write out queued log records and stop the listener thread."""
+    global _queue_handler, _listener
+    if _listener is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _listener.stop()
+        _queue_handler = _listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the specified name."""
     return logging.getLogger(name)
-
@@ -4,11 +4,14 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1 import router as api_router
 from app.core.config import get_settings
-from app.core.database import init_db
-from app.core.logging import setup_logging
+from app.core.database import async_session_factory, close_db, init_db
+from app.core.logging import setup_logging, stop_logging
+from app.services.event_writer import event_writer
+from app.services.export_jobs import fail_interrupted_jobs
 
 settings = get_settings()
 
@@ -19,9 +22,13 @@ async def lifespan(app: FastAPI):
     # Startup
     setup_logging()
     await init_db()
+    await fail_interrupted_jobs(async_session_factory)
+    await event_writer.start()
     yield
     # Shutdown
-    pass
+    await event_writer.stop()
+    await close_db()
+    stop_logging()
 
 
 app = FastAPI(
@@ -29,6 +36,8 @@ app = FastAPI(
     version=settings.app_version,
     description="High-efficiency data annotation platform",
     lifespan=lifespan,
+    # Serialize responses with orjson rather than the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -7,6 +7,7 @@ from app.models.annotation import (
     PolygonAnnotation,
 )
 from app.models.dataset import Dataset
+from app.models.export_job import ExportJob
 from app.models.item import Item
 from app.models.label import Label
 from app.models.project import Project
@@ -22,5 +23,6 @@ __all__ = [
     "PolygonAnnotation",
     "AnnotationEvent",
     "ParserTemplate",
+    "ExportJob",
 ]
 
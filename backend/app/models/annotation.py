@@ -4,10 +4,10 @@ import enum
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import DateTime, Enum, Float, ForeignKey, Integer, String, func
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, SmallInteger, String, desc, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.types import JSON
+from sqlalchemy.types import JSON, TypeDecorator
 
 from app.core.database import Base
 
@@ -58,21 +58,63 @@ class EventType(str, enum.Enum):
     RESTORE = "restore"  # Item restored from deleted
 
 
+# Stored codes for EventType; never renumber, only append
+EVENT_TYPE_CODES: dict[EventType, int] = {
+    EventType.OPEN: 1,
+    EventType.SAVE: 2,
+    EventType.SUBMIT_DONE: 3,
+    EventType.SKIP: 4,
+    EventType.DELETE: 5,
+    EventType.UNSKIP: 6,
+    EventType.RESTORE: 7,
+}
+_EVENT_TYPES_BY_CODE = {code: event_type for event_type, code in EVENT_TYPE_CODES.items()}
+
+
+class EventTypeCode(TypeDecorator):
+    """
+    Store EventType as a SMALLINT code.
+
+    Keeps annotation_events rows and indexes small and lets new event types be
+    added without a schema change. Binds accept EventType members or their
+    string values; strings that are not a known event type bind as NULL and
+    so match no rows.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return EVENT_TYPE_CODES[EventType(value)]
+        except ValueError:
+            return None
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return _EVENT_TYPES_BY_CODE[value]
+
+
 class AnnotationEvent(Base):
     """Event log for tracking annotation actions."""
 
     __tablename__ = "annotation_events"
+    __table_args__ = (
+        # Event queries filter by project (then optionally dataset) over a time range
+        Index("ix_annotation_events_project_id_ts", "project_id", desc("ts")),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     project_id: Mapped[int] = mapped_column(
         ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     dataset_id: Mapped[int] = mapped_column(
         ForeignKey("datasets.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     item_id: Mapped[int] = mapped_column(
         ForeignKey("items.id", ondelete="CASCADE"),
@@ -80,12 +122,11 @@ class AnnotationEvent(Base):
         index=True,
     )
     user_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
-    event_type: Mapped[EventType] = mapped_column(Enum(EventType), nullable=False)
+    event_type: Mapped[EventType] = mapped_column(EventTypeCode(), nullable=False)
     ts: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False,
-        index=True,
     )
     # Use JSON type that works with both SQLite and PostgreSQL
     payload: Mapped[dict[str, Any] | None] = mapped_column(
@@ -106,6 +147,9 @@ class BBoxAnnotation(Base):
     """Bounding box annotation for object detection."""
 
     __tablename__ = "bbox_annotations"
+    # Fetch server-generated timestamps in the INSERT/UPDATE itself (RETURNING)
+    # instead of needing a refresh() afterwards
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     item_id: Mapped[int] = mapped_column(
@@ -154,6 +198,9 @@ class PolygonAnnotation(Base):
     """Polygon annotation for instance segmentation."""
 
     __tablename__ = "polygon_annotations"
+    # Fetch server-generated timestamps in the INSERT/UPDATE itself (RETURNING)
+    # instead of needing a refresh() afterwards
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     item_id: Mapped[int] = mapped_column(
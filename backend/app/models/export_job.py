@@ -0,0 +1,65 @@
+"""Export job model."""
+
+import enum
+from datetime import datetime
+
+from sqlalchemy import JSON, Boolean, DateTime, Enum, ForeignKey, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ExportJobStatus(str, enum.Enum):
+    """Export job lifecycle."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class ExportJob(Base):
+    """Export job - a dataset export built in the background and downloaded later."""
+
+    __tablename__ = "export_jobs"
+    # Fetch created_at in the INSERT itself (RETURNING) instead of needing a refresh()
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    dataset_id: Mapped[int] = mapped_column(
+        ForeignKey("datasets.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    format: Mapped[str] = mapped_column(String(20), nullable=False)
+    include_images: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    status_filter: Mapped[list[str] | None] = mapped_column(
+        JSON,
+        nullable=True,
+        comment="Item statuses to export; null means done only",
+    )
+    status: Mapped[ExportJobStatus] = mapped_column(
+        Enum(ExportJobStatus, native_enum=False, length=16, create_constraint=True, name="exportjobstatus"),
+        nullable=False,
+        default=ExportJobStatus.PENDING,
+    )
+    filename: Mapped[str] = mapped_column(
+        String(300),
+        nullable=False,
+        comment="Download filename offered to the client",
+    )
+    file_path: Mapped[str | None] = mapped_column(
+        String(1000),
+        nullable=True,
+        comment="Location of the finished ZIP on the server",
+    )
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<ExportJob(id={self.id}, dataset_id={self.dataset_id}, status={self.status})>"
@@ -4,7 +4,7 @@ import enum
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -28,16 +28,44 @@ class ItemStatus(str, enum.Enum):
     DELETED = "deleted"
 
 
+# Statuses of items still waiting to be annotated
+OPEN_STATUSES = (ItemStatus.TODO, ItemStatus.IN_PROGRESS)
+
+
 class Item(Base):
     """Item model - represents a single image to be annotated."""
 
     __tablename__ = "items"
+    __table_args__ = (
+        # Queries filter by dataset first, then status, and page/pick in id order;
+        # also serves dataset_id-only and (dataset_id, status) lookups and counts
+        Index("ix_items_dataset_id_status_id", "dataset_id", "status", "id"),
+        # The next-item queue only ever looks at open items in id order; kept
+        # partial so it stays small as done items come to dominate a dataset.
+        # Queries must spell the predicate out literally (see OPEN_STATUSES)
+        Index(
+            "ix_items_open_queue",
+            "dataset_id",
+            "id",
+            postgresql_where=text("status IN ('TODO', 'IN_PROGRESS')"),
+            sqlite_where=text("status IN ('TODO', 'IN_PROGRESS')"),
+        ),
+        # A file is imported once per dataset; scans rely on it for ON CONFLICT DO NOTHING
+        Index("uq_items_dataset_id_rel_path", "dataset_id", "rel_path", unique=True),
+    )
+    # Fetch updated_at in the UPDATE itself (RETURNING) instead of needing a refresh()
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     dataset_id: Mapped[int] = mapped_column(
         ForeignKey("datasets.id", ondelete="CASCADE"),
         nullable=False,
+    )
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
         index=True,
+        comment="Denormalized from datasets.project_id to avoid a join on write paths",
     )
     rel_path: Mapped[str] = mapped_column(
         String(1000),
@@ -52,11 +80,12 @@ class Item(Base):
     width: Mapped[int | None] = mapped_column(Integer, nullable=True)
     height: Mapped[int | None] = mapped_column(Integer, nullable=True)
     file_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # VARCHAR + CHECK rather than a native ENUM type: adding a status is a
+    # constraint swap instead of an ALTER TYPE
     status: Mapped[ItemStatus] = mapped_column(
-        Enum(ItemStatus),
+        Enum(ItemStatus, native_enum=False, length=16, create_constraint=True, name="itemstatus"),
         nullable=False,
         default=ItemStatus.TODO,
-        index=True,
     )
     skip_reason: Mapped[str | None] = mapped_column(String(500), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
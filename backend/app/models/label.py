@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -16,12 +16,18 @@ class Label(Base):
     """Label model - defines classification labels for a project."""
 
     __tablename__ = "labels"
+    __table_args__ = (
+        # Labels are always read per project in display order; also serves
+        # lookups by project_id alone
+        Index("ix_labels_project_id_order", "project_id", "order"),
+    )
+    # Fetch created_at in the INSERT itself (RETURNING) instead of needing a refresh()
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     project_id: Mapped[int] = mapped_column(
         ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     color: Mapped[str] = mapped_column(
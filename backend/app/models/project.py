@@ -31,7 +31,7 @@ class Project(Base):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(String(1000), nullable=True)
     task_type: Mapped[TaskType] = mapped_column(
-        Enum(TaskType),
+        Enum(TaskType, native_enum=False, length=16, create_constraint=True, name="tasktype"),
         nullable=False,
         default=TaskType.CLASSIFICATION,
     )
@@ -15,6 +15,7 @@ from app.schemas.annotation import (
     SkipRequest,
 )
 from app.schemas.dataset import DatasetCreate, DatasetResponse, ScanRequest, ScanResponse
+from app.schemas.export import ExportJobResponse
 from app.schemas.item import ItemResponse, NextItemResponse
 from app.schemas.label import LabelCreate, LabelResponse, LabelsUpdate
 from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
@@ -27,6 +28,7 @@ __all__ = [
     "DatasetResponse",
     "ScanRequest",
     "ScanResponse",
+    "ExportJobResponse",
     "ItemResponse",
     "NextItemResponse",
     "LabelCreate",
@@ -47,6 +47,12 @@ class ScanRequest(BaseModel):
         le=100000,
         description="Maximum number of images to import",
     )
+    max_workers: int = Field(
+        default=16,
+        ge=1,
+        le=64,
+        description="Directories/images read concurrently (raise for network mounts)",
+    )
 
 
 class ScanError(BaseModel):
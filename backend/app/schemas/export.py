@@ -0,0 +1,24 @@
+"""Export schemas."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+from app.models.export_job import ExportJobStatus
+
+
+class ExportJobResponse(BaseModel):
+    """Schema for export job response."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    dataset_id: int
+    format: str
+    include_images: bool
+    status_filter: list[str] | None
+    status: ExportJobStatus
+    filename: str
+    error: str | None
+    created_at: datetime
+    finished_at: datetime | None
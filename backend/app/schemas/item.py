@@ -2,10 +2,13 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 from app.models.item import ItemStatus
 
+_THUMB_URL = "/api/v1/items/%d/thumb"
+_IMAGE_URL = "/api/v1/items/%d/image"
+
 
 class ItemResponse(BaseModel):
     """Schema for item response."""
@@ -23,10 +26,19 @@ class ItemResponse(BaseModel):
     skip_reason: str | None = None
     created_at: datetime
     updated_at: datetime
-    thumb_url: str = Field(..., description="URL to thumbnail image")
-    image_url: str = Field(..., description="URL to original image")
     label: str | None = Field(None, description="Current classification label if any")
 
+    # Derived from id only when serializing
+    @computed_field(description="URL to thumbnail image")
+    @property
+    def thumb_url(self) -> str:
+        return _THUMB_URL % self.id
+
+    @computed_field(description="URL to original image")
+    @property
+    def image_url(self) -> str:
+        return _IMAGE_URL % self.id
+
 
 class NextItemResponse(BaseModel):
     """Response for getting next item to annotate."""
@@ -45,4 +57,7 @@ class ItemListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: int | None = Field(
+        None, description="Pass as after_id to fetch the next page; null on the last page"
+    )
 
@@ -43,6 +43,15 @@ class ParserTemplateResponse(ParserTemplateBase):
     model_config = {"from_attributes": True}
 
 
+class ParserTemplateListResponse(BaseModel):
+    """Paginated list of Parser Templates."""
+    items: List[ParserTemplateResponse]
+    total: int
+    page: int
+    page_size: int
+    total_pages: int
+
+
 class ParseTestRequest(BaseModel):
     """Schema for testing parser template."""
     template_id: Optional[int] = None  # Use existing template
@@ -45,3 +45,12 @@ class ProjectResponse(ProjectBase):
     item_count: int = Field(default=0, description="Total items across all datasets")
     done_count: int = Field(default=0, description="Number of completed items")
 
+
+class ProjectListResponse(BaseModel):
+    """Paginated list of projects."""
+
+    items: list[ProjectResponse]
+    total: int
+    page: int
+    page_size: int
+    total_pages: int
@@ -1,12 +1,24 @@
 """HTTP caching utilities for media files."""
 
 import hashlib
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+from urllib.parse import quote
 
 from fastapi import Request
 from fastapi.responses import FileResponse, Response
 
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+@lru_cache(maxsize=16)
+def _resolve_root(root: str) -> Path:
+    # Media roots come from settings and never change at runtime
+    return Path(root).resolve()
+
 
 def calculate_etag(file_path: Path) -> str:
     """
@@ -43,21 +55,60 @@ def check_not_modified(request: Request, file_path: Path) -> Optional[Response]:
     return None
 
 
+def file_response(
+    file_path: Path,
+    media_type: str,
+    root: str,
+    internal_location: str,
+) -> Response:
+    """
+    Build the response that sends a media file to the client.
+    
+    With ``use_xaccel`` enabled, files under ``root`` are handed off to Nginx
+    through an ``X-Accel-Redirect`` to ``internal_location`` so the bytes never
+    pass through the Python worker. Otherwise (local development, or files
+    outside ``root``) a regular FileResponse is returned.
+    
+    Args:
+        file_path: Path to the file being served
+        media_type: Content-Type of the file
+        root: Directory that ``internal_location`` is aliased to in Nginx
+        internal_location: Internal Nginx location prefix
+    
+    Returns:
+        Response without a body for Nginx to fill, or a FileResponse
+    """
+    if settings.use_xaccel:
+        try:
+            rel_path = file_path.resolve().relative_to(_resolve_root(root))
+        except ValueError:
+            rel_path = None
+        if rel_path is not None:
+            return Response(
+                media_type=media_type,
+                headers={
+                    "X-Accel-Redirect": internal_location.rstrip("/") + "/" + quote(rel_path.as_posix()),
+                },
+            )
+    
+    return FileResponse(file_path, media_type=media_type)
+
+
 def add_cache_headers(
-    response: FileResponse,
+    response: Response,
     file_path: Path,
     cache_control: str = "public, max-age=3600",
-) -> FileResponse:
+) -> Response:
     """
-    Add caching headers to FileResponse.
+    Add caching headers to a media file response.
     
     Args:
-        response: The FileResponse to modify
+        response: The response to modify
         file_path: Path to the file being served
         cache_control: Cache-Control header value
     
     Returns:
-        The modified FileResponse
+        The modified response
     """
     etag = calculate_etag(file_path)
     stat = file_path.stat()
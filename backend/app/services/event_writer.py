@@ -0,0 +1,167 @@
+"""Background writer that coalesces annotation event inserts."""
+
+import asyncio
+from typing import Any
+
+from sqlalchemy import event, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.database import async_session_factory
+from app.core.logging import get_logger
+from app.models.annotation import AnnotationEvent
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Queued by stop(): everything ahead of it is flushed, then the consumer exits
+_STOP: Any = object()
+
+
+class EventWriter:
+    """
+    Buffer ``annotation_events`` rows and flush them as one bulk INSERT.
+
+    Events are append-only and never read on the request path, so instead of
+    inserting them inside each request the endpoints hand them to this writer.
+    Events are held on the request session and only queued once it commits,
+    so a request that rolls back logs nothing. A consumer task drains the
+    queue every ``flush_interval`` seconds (or as soon as ``batch_size`` rows
+    are waiting) and writes them with a dedicated session.
+
+    Until ``start()`` has been called (e.g. in tests or scripts that don't run
+    the app lifespan) events are inserted directly on the caller's session.
+    Buffered events not yet flushed are lost if the process is killed.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        flush_interval: float,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.session_factory = session_factory
+        self._queue: asyncio.Queue[dict[str, Any]] | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def write(self, db: AsyncSession, row: dict[str, Any]) -> None:
+        """
+        Record an annotation event as part of the request's transaction.
+
+        Args:
+            db: Request session; the event is written only if it commits
+            row: Column values for one ``AnnotationEvent`` row
+        """
+        if not self.running:
+            await db.execute(insert(AnnotationEvent).values(**row))
+            return
+        pending = db.info.get(self)
+        if pending is None:
+            pending = db.info[self] = []
+            event.listen(db.sync_session, "after_commit", self._after_commit)
+            event.listen(db.sync_session, "after_rollback", self._after_rollback)
+        pending.append(row)
+
+    def _after_commit(self, session: Session) -> None:
+        pending = session.info[self]
+        if self._queue is not None:
+            for row in pending:
+                self._queue.put_nowait(row)
+        pending.clear()
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info[self].clear()
+
+    async def start(self) -> None:
+        """Start the consumer task."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop the consumer task and flush anything still buffered.
+
+        The consumer is told to stop through the queue rather than cancelled:
+        a cancel can be swallowed by ``wait_for`` when the awaited get has
+        just completed, leaving the task blocked on the queue forever.
+        """
+        if not self.running:
+            return
+        self._queue.put_nowait(_STOP)
+        await self._task
+        self._task = None
+
+        # Events written while the consumer was finishing up
+        rows = []
+        while not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        await self._flush(rows)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            row = await self._queue.get()
+            if row is _STOP:
+                return
+            rows = [row]
+            deadline = loop.time() + self.flush_interval
+            while len(rows) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is _STOP:
+                    stopping = True
+                    break
+                rows.append(row)
+            await self._flush(rows)
+
+    async def _flush(self, rows: list[dict[str, Any]]) -> None:
+        if not rows:
+            return
+        try:
+            async with self.session_factory() as session:
+                await session.execute(insert(AnnotationEvent), rows)
+                await session.commit()
+            return
+        except IntegrityError:
+            # Typically an item, dataset or project deleted since the event was
+            # queued; retry row by row so only the orphaned events are dropped
+            logger.warning("Batch of %d annotation events rejected, retrying one by one", len(rows))
+        except Exception:
+            logger.exception("Failed to write %d annotation events", len(rows))
+            return
+
+        # Rare path, so one short transaction per row rather than savepoints
+        dropped = 0
+        for row in rows:
+            try:
+                async with self.session_factory() as session:
+                    await session.execute(insert(AnnotationEvent).values(**row))
+                    await session.commit()
+            except IntegrityError:
+                dropped += 1
+            except Exception:
+                logger.exception("Failed to write annotation event %r", row)
+        if dropped:
+            logger.warning("Dropped %d annotation events referencing deleted rows", dropped)
+
+
+event_writer = EventWriter(
+    batch_size=settings.event_writer_batch_size,
+    flush_interval=settings.event_writer_flush_ms / 1000,
+)
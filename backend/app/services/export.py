@@ -1,98 +1,187 @@
 """Data export service for annotations."""
 
-import csv
 import json
 import zipfile
+from collections.abc import AsyncIterator
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
-from xml.etree.ElementTree import Element, SubElement, ElementTree, tostring
+from xml.etree.ElementTree import Element, SubElement, tostring
 from xml.dom import minidom
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import selectinload
+from starlette.concurrency import run_in_threadpool
 
-from app.models.annotation import BBoxAnnotation, PolygonAnnotation, ClassificationAnnotation
+from app.core.database import async_session_factory
 from app.models.dataset import Dataset
 from app.models.item import Item, ItemStatus
 from app.models.project import Project
 
+# Rows fetched per round-trip while streaming items
+EXPORT_YIELD_PER = 500
+
+# Buffered ZIP output is handed to the client once it reaches this size
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+CLASSIFICATION_FORMATS = ("csv", "json", "imagenet")
+
+
+class _ZipBuffer:
+    """
+    Write-only file object that ZipFile writes into.
+
+    It has no ``seek``/``tell``, so ZipFile writes entries sequentially with
+    data descriptors; the bytes produced so far are taken with ``drain()``.
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._size = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self, min_size: int = 0) -> bytes:
+        """Return and clear buffered bytes once at least ``min_size`` are waiting."""
+        if not self._size or self._size < min_size:
+            return b""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        self._size = 0
+        return data
+
+
+def _json(value) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _write_image(zipf: zipfile.ZipFile, full_path: Path, arcname: str) -> None:
+    # Images are already compressed; storing them avoids burning CPU on deflate
+    if full_path.exists():
+        zipf.write(full_path, arcname, compress_type=zipfile.ZIP_STORED)
+
 
 class ExportService:
-    """Service for exporting annotations in various formats."""
+    """
+    Service for exporting annotations in various formats.
+
+    Each export is an async iterator of ZIP bytes meant to be passed to a
+    ``StreamingResponse``. Items are read with a server-side cursor on a
+    session owned by the iterator, since the request session is closed before
+    the response body is sent.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] = async_session_factory):
+        self.session_factory = session_factory
+
+    @staticmethod
+    async def _get_dataset(db: AsyncSession, dataset_id: int, with_labels: bool = False) -> Dataset:
+        project_load = selectinload(Dataset.project)
+        if with_labels:
+            project_load = project_load.selectinload(Project.labels)
+        query = select(Dataset).options(project_load).where(Dataset.id == dataset_id)
+        result = await db.execute(query)
+        return result.scalar_one()
+
+    @staticmethod
+    async def _stream_items(
+        db: AsyncSession,
+        dataset_id: int,
+        status_filter: List[ItemStatus],
+        *options,
+    ) -> AsyncIterator[Item]:
+        query = (
+            select(Item)
+            .options(*options)
+            .where(Item.dataset_id == dataset_id)
+            .where(Item.status.in_(status_filter))
+            .order_by(Item.id)
+            .execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+        async for item in await db.stream_scalars(query):
+            yield item
+
+    def export(
+        self,
+        dataset_id: int,
+        format: str,
+        include_images: bool = False,
+        status_filter: Optional[List[ItemStatus]] = None,
+    ) -> AsyncIterator[bytes]:
+        """Dispatch to the exporter for ``format`` (coco, yolo, voc, csv, json, imagenet)."""
+        if format in CLASSIFICATION_FORMATS:
+            return self.export_classification(dataset_id, format, include_images, status_filter)
+        if format == "coco":
+            return self.export_coco(dataset_id, include_images, status_filter)
+        if format == "yolo":
+            return self.export_yolo(dataset_id, include_images, status_filter)
+        return self.export_voc(dataset_id, include_images, status_filter)
+
+    @staticmethod
+    def export_filename(dataset_name: str, format: str) -> str:
+        """Timestamped ZIP filename for an export of ``dataset_name``."""
+        kind = "classification" if format in CLASSIFICATION_FORMATS else format
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"{dataset_name}_{kind}_{timestamp}.zip"
 
     async def export_classification(
         self,
-        db: AsyncSession,
         dataset_id: int,
-        output_path: Path,
         format: str = "csv",  # csv, json, imagenet
         include_images: bool = False,
         status_filter: Optional[List[ItemStatus]] = None,
-    ) -> Path:
+    ) -> AsyncIterator[bytes]:
         """
         Export classification annotations.
-        
+
         Args:
-            db: Database session
             dataset_id: Dataset ID to export
-            output_path: Output directory path
             format: Export format (csv, json, imagenet)
             include_images: Whether to include image files in ZIP
             status_filter: Filter items by status (default: done)
-            
-        Returns:
-            Path to generated ZIP file
+
+        Yields:
+            Chunks of the ZIP file
         """
         # Default to only export 'done' items
         if status_filter is None:
             status_filter = [ItemStatus.DONE]
 
-        # Fetch dataset with project
-        query = (
-            select(Dataset)
-            .options(selectinload(Dataset.project))
-            .where(Dataset.id == dataset_id)
-        )
-        result = await db.execute(query)
-        dataset = result.scalar_one()
-        project = dataset.project
+        async with self.session_factory() as db:
+            dataset = await self._get_dataset(db, dataset_id)
+            project = dataset.project
+            root_path = Path(dataset.root_path)
 
-        # Fetch items with classifications
-        items_query = (
-            select(Item)
-            .options(selectinload(Item.classifications))
-            .where(Item.dataset_id == dataset_id)
-            .where(Item.status.in_(status_filter))
-        )
-        result = await db.execute(items_query)
-        items = result.scalars().all()
+            # Only what the archive needs is kept per item: (filename, rel_path, label)
+            entries = []
+            async for item in self._stream_items(
+                db, dataset_id, status_filter, selectinload(Item.classifications)
+            ):
+                if item.classifications:
+                    entries.append((item.filename, item.rel_path, item.classifications[0].label))
 
-        # Create output ZIP
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        zip_path = output_path / f"{dataset.name}_classification_{timestamp}.zip"
-        
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        buffer = _ZipBuffer()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
             if format == "csv":
                 # CSV format: filename, label
                 lines = ["filename,label\n"]
-                for item in items:
-                    if item.classifications:
-                        label = item.classifications[0].label
-                        lines.append(f"{item.filename},{label}\n")
+                for filename, _, label in entries:
+                    lines.append(f"{filename},{label}\n")
                 zipf.writestr("annotations.csv", "".join(lines))
-            
+
             elif format == "json":
                 # JSON format
-                annotations = []
-                for item in items:
-                    if item.classifications:
-                        annotations.append({
-                            "filename": item.filename,
-                            "label": item.classifications[0].label,
-                            "rel_path": item.rel_path,
-                        })
+                annotations = [
+                    {"filename": filename, "label": label, "rel_path": rel_path}
+                    for filename, rel_path, label in entries
+                ]
                 zipf.writestr(
                     "annotations.json",
                     json.dumps({
@@ -103,363 +192,324 @@ class ExportService:
                         "annotations": annotations,
                     }, indent=2, ensure_ascii=False)
                 )
-            
+
             elif format == "imagenet":
                 # ImageNet format: organize by class folders
                 # Also create a mapping file
                 class_folders = {}
-                for item in items:
-                    if item.classifications:
-                        label = item.classifications[0].label
-                        if label not in class_folders:
-                            class_folders[label] = []
-                        class_folders[label].append(item)
-                
+                for filename, rel_path, label in entries:
+                    class_folders.setdefault(label, []).append((filename, rel_path))
+
                 # Write class mapping
-                class_names = list(class_folders.keys())
-                zipf.writestr("classes.txt", "\n".join(class_names))
-                
-                # If including images, organize them by class
-                if include_images:
-                    for class_name, class_items in class_folders.items():
-                        for item in class_items:
-                            full_path = Path(dataset.root_path) / item.rel_path
-                            if full_path.exists():
-                                zipf.write(full_path, f"images/{class_name}/{item.filename}")
-                else:
+                zipf.writestr("classes.txt", "\n".join(class_folders))
+
+                if not include_images:
                     # Just write file lists per class
                     for class_name, class_items in class_folders.items():
-                        filenames = [item.filename for item in class_items]
                         zipf.writestr(
                             f"{class_name}_files.txt",
-                            "\n".join(filenames)
+                            "\n".join(filename for filename, _ in class_items)
                         )
-            
-            # Optionally include images (if not ImageNet format with images)
-            if include_images and format != "imagenet":
-                for item in items:
-                    if item.classifications:
-                        full_path = Path(dataset.root_path) / item.rel_path
-                        if full_path.exists():
-                            # Organize by label
-                            label = item.classifications[0].label
-                            zipf.write(full_path, f"images/{label}/{item.filename}")
-
-        return zip_path
+            yield buffer.drain()
+
+            # Optionally include images, organized by label
+            if include_images:
+                for filename, rel_path, label in entries:
+                    await run_in_threadpool(
+                        _write_image, zipf, root_path / rel_path, f"images/{label}/{filename}"
+                    )
+                    if chunk := buffer.drain(EXPORT_CHUNK_SIZE):
+                        yield chunk
+
+        yield buffer.drain()
 
     async def export_coco(
         self,
-        db: AsyncSession,
         dataset_id: int,
-        output_path: Path,
         include_images: bool = False,
         status_filter: Optional[List[ItemStatus]] = None,
-    ) -> Path:
+    ) -> AsyncIterator[bytes]:
         """
         Export annotations in COCO JSON format.
-        
+
         Args:
-            db: Database session
             dataset_id: Dataset ID to export
-            output_path: Output directory path
             include_images: Whether to include image files in ZIP
             status_filter: Filter items by status (default: done)
-            
-        Returns:
-            Path to generated ZIP file
+
+        Yields:
+            Chunks of the ZIP file
         """
         # Default to only export 'done' items
         if status_filter is None:
             status_filter = [ItemStatus.DONE]
 
-        # Fetch dataset with project and labels
-        query = (
-            select(Dataset)
-            .options(selectinload(Dataset.project).selectinload(Project.labels))
-            .where(Dataset.id == dataset_id)
-        )
-        result = await db.execute(query)
-        dataset = result.scalar_one()
-        project = dataset.project
+        buffer = _ZipBuffer()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            async with self.session_factory() as db:
+                dataset = await self._get_dataset(db, dataset_id, with_labels=True)
+                project = dataset.project
+                root_path = Path(dataset.root_path)
 
-        # Fetch items with annotations
-        items_query = (
-            select(Item)
-            .options(
-                selectinload(Item.bboxes),
-                selectinload(Item.polygons),
-                selectinload(Item.classifications),
-            )
-            .where(Item.dataset_id == dataset_id)
-            .where(Item.status.in_(status_filter))
-        )
-        result = await db.execute(items_query)
-        items = result.scalars().all()
-
-        # Build COCO JSON structure
-        coco = {
-            "info": {
-                "description": f"{project.name} - {dataset.name}",
-                "date_created": datetime.now().isoformat(),
-                "year": datetime.now().year,
-            },
-            "images": [],
-            "annotations": [],
-            "categories": [],
-        }
-
-        # Add categories (labels)
-        label_id_map = {}
-        for idx, label in enumerate(project.labels, 1):
-            label_id_map[label.id] = idx
-            coco["categories"].append({
-                "id": idx,
-                "name": label.name,
-                "supercategory": "object",
-            })
-
-        # Add images and annotations
-        annotation_id = 1
-        for image_id, item in enumerate(items, 1):
-            # Add image
-            full_path = Path(dataset.root_path) / item.rel_path
-            coco["images"].append({
-                "id": image_id,
-                "file_name": item.filename,
-                "width": item.width or 0,  # TODO: Store image dimensions
-                "height": item.height or 0,
-            })
-
-            # Add bbox annotations
-            for bbox in item.bboxes:
-                coco["annotations"].append({
-                    "id": annotation_id,
-                    "image_id": image_id,
-                    "category_id": label_id_map[bbox.label_id],
-                    "bbox": [bbox.x, bbox.y, bbox.width, bbox.height],
-                    "area": bbox.width * bbox.height,
-                    "iscrowd": 0,
-                })
-                annotation_id += 1
-
-            # Add polygon annotations (segmentation)
-            for polygon in item.polygons:
-                # Flatten points: [[x1,y1],[x2,y2]] -> [x1,y1,x2,y2]
-                segmentation = [coord for point in polygon.points for coord in point]
-                
-                # Calculate bbox from polygon
-                xs = [p[0] for p in polygon.points]
-                ys = [p[1] for p in polygon.points]
-                x_min, x_max = min(xs), max(xs)
-                y_min, y_max = min(ys), max(ys)
-                
-                coco["annotations"].append({
-                    "id": annotation_id,
-                    "image_id": image_id,
-                    "category_id": label_id_map[polygon.label_id],
-                    "segmentation": [segmentation],
-                    "bbox": [x_min, y_min, x_max - x_min, y_max - y_min],
-                    "area": (x_max - x_min) * (y_max - y_min),
-                    "iscrowd": 0,
-                })
-                annotation_id += 1
-
-        # Create output ZIP
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        zip_path = output_path / f"{dataset.name}_coco_{timestamp}.zip"
-        
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Write annotations JSON
-            zipf.writestr(
-                "annotations.json",
-                json.dumps(coco, indent=2, ensure_ascii=False)
-            )
-            
-            # Optionally include images
-            if include_images:
-                for item in items:
-                    full_path = Path(dataset.root_path) / item.rel_path
-                    if full_path.exists():
-                        zipf.write(full_path, f"images/{item.filename}")
+                # Add categories (labels)
+                label_id_map = {}
+                categories = []
+                for idx, label in enumerate(project.labels, 1):
+                    label_id_map[label.id] = idx
+                    categories.append({
+                        "id": idx,
+                        "name": label.name,
+                        "supercategory": "object",
+                    })
+                info = {
+                    "description": f"{project.name} - {dataset.name}",
+                    "date_created": datetime.now().isoformat(),
+                    "year": datetime.now().year,
+                }
+
+                # annotations.json is written entry by entry as items stream
+                # in, so neither the items nor the COCO document are held in
+                # memory. Images come first in the document and annotations
+                # second, so the items are read twice. The entry size is not
+                # known up front, so ZIP64 is forced to allow it past 2 GiB.
+                with zipf.open("annotations.json", "w", force_zip64=True) as f:
+                    def write(text: str) -> None:
+                        f.write(text.encode())
+
+                    write('{\n  "info": ' + _json(info))
+                    write(',\n  "categories": ' + _json(categories))
+
+                    # Images are keyed by item id; an item whose status changes
+                    # between the two reads is only annotated if it was listed
+                    write(',\n  "images": [')
+                    image_ids = set()
+                    image_paths = []
+                    async for item in self._stream_items(db, dataset_id, status_filter):
+                        write((",\n    " if image_ids else "\n    ") + _json({
+                            "id": item.id,
+                            "file_name": item.filename,
+                            "width": item.width or 0,  # TODO: Store image dimensions
+                            "height": item.height or 0,
+                        }))
+                        image_ids.add(item.id)
+                        if include_images:
+                            image_paths.append((item.filename, item.rel_path))
+                        if chunk := buffer.drain(EXPORT_CHUNK_SIZE):
+                            yield chunk
+
+                    write('\n  ],\n  "annotations": [')
+                    annotation_id = 0
+                    async for item in self._stream_items(
+                        db,
+                        dataset_id,
+                        status_filter,
+                        selectinload(Item.bboxes),
+                        selectinload(Item.polygons),
+                    ):
+                        if item.id not in image_ids:
+                            continue
+                        annotations = []
+
+                        # Add bbox annotations
+                        for bbox in item.bboxes:
+                            annotations.append({
+                                "image_id": item.id,
+                                "category_id": label_id_map[bbox.label_id],
+                                "bbox": [bbox.x, bbox.y, bbox.width, bbox.height],
+                                "area": bbox.width * bbox.height,
+                                "iscrowd": 0,
+                            })
+
+                        # Add polygon annotations (segmentation)
+                        for polygon in item.polygons:
+                            # Flatten points: [[x1,y1],[x2,y2]] -> [x1,y1,x2,y2]
+                            segmentation = [coord for point in polygon.points for coord in point]
+
+                            # Calculate bbox from polygon
+                            xs = [p[0] for p in polygon.points]
+                            ys = [p[1] for p in polygon.points]
+                            x_min, x_max = min(xs), max(xs)
+                            y_min, y_max = min(ys), max(ys)
+
+                            annotations.append({
+                                "image_id": item.id,
+                                "category_id": label_id_map[polygon.label_id],
+                                "segmentation": [segmentation],
+                                "bbox": [x_min, y_min, x_max - x_min, y_max - y_min],
+                                "area": (x_max - x_min) * (y_max - y_min),
+                                "iscrowd": 0,
+                            })
+
+                        for annotation in annotations:
+                            annotation_id += 1
+                            write(("\n    " if annotation_id == 1 else ",\n    ") + _json({
+                                "id": annotation_id,
+                                **annotation,
+                            }))
+                        if chunk := buffer.drain(EXPORT_CHUNK_SIZE):
+                            yield chunk
 
-        return zip_path
+                    write("\n  ]\n}")
+            yield buffer.drain()
+
+            # Optionally include images, after the session is closed: copying
+            # them can take minutes on a slow client and must not hold a connection
+            for filename, rel_path in image_paths:
+                await run_in_threadpool(
+                    _write_image, zipf, root_path / rel_path, f"images/{filename}"
+                )
+                if chunk := buffer.drain(EXPORT_CHUNK_SIZE):
+                    yield chunk
+
+        yield buffer.drain()
 
     async def export_yolo(
         self,
-        db: AsyncSession,
         dataset_id: int,
-        output_path: Path,
         include_images: bool = False,
         status_filter: Optional[List[ItemStatus]] = None,
-    ) -> Path:
+    ) -> AsyncIterator[bytes]:
         """
         Export annotations in YOLO TXT format.
-        
+
         Format: <class_id> <x_center> <y_center> <width> <height> (normalized 0-1)
         """
         if status_filter is None:
             status_filter = [ItemStatus.DONE]
 
-        # Fetch dataset and items
-        query = (
-            select(Dataset)
-            .options(selectinload(Dataset.project).selectinload(Project.labels))
-            .where(Dataset.id == dataset_id)
-        )
-        result = await db.execute(query)
-        dataset = result.scalar_one()
-        project = dataset.project
+        async with self.session_factory() as db:
+            dataset = await self._get_dataset(db, dataset_id, with_labels=True)
+            project = dataset.project
+            root_path = Path(dataset.root_path)
 
-        items_query = (
-            select(Item)
-            .options(selectinload(Item.bboxes))
-            .where(Item.dataset_id == dataset_id)
-            .where(Item.status.in_(status_filter))
-        )
-        result = await db.execute(items_query)
-        items = result.scalars().all()
+            # Create label map
+            label_id_map = {label.id: idx for idx, label in enumerate(project.labels)}
 
-        # Create label map
-        label_id_map = {label.id: idx for idx, label in enumerate(project.labels)}
-        
-        # Create output ZIP
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        zip_path = output_path / f"{dataset.name}_yolo_{timestamp}.zip"
-        
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Write classes.txt
-            classes_content = "\n".join([label.name for label in project.labels])
-            zipf.writestr("classes.txt", classes_content)
-            
-            # Write labels for each image
-            for item in items:
-                if not item.bboxes:
-                    continue
-                
-                # YOLO format requires image dimensions
-                img_width = item.width or 1920  # TODO: Get actual dimensions
-                img_height = item.height or 1080
-                
-                lines = []
-                for bbox in item.bboxes:
-                    class_id = label_id_map[bbox.label_id]
-                    # Convert to YOLO format (normalized center coordinates)
-                    x_center = (bbox.x + bbox.width / 2) / img_width
-                    y_center = (bbox.y + bbox.height / 2) / img_height
-                    width = bbox.width / img_width
-                    height = bbox.height / img_height
-                    
-                    lines.append(f"{class_id} {x_center:.6f} {y_center:.6f} {width:.6f} {height:.6f}")
-                
-                # Write label file
-                label_filename = Path(item.filename).stem + ".txt"
-                zipf.writestr(f"labels/{label_filename}", "\n".join(lines))
-                
-                # Optionally include image
-                if include_images:
-                    full_path = Path(dataset.root_path) / item.rel_path
-                    if full_path.exists():
-                        zipf.write(full_path, f"images/{item.filename}")
-
-        return zip_path
+            buffer = _ZipBuffer()
+            with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                # Write classes.txt
+                classes_content = "\n".join([label.name for label in project.labels])
+                zipf.writestr("classes.txt", classes_content)
+
+                # Write labels for each image
+                async for item in self._stream_items(
+                    db, dataset_id, status_filter, selectinload(Item.bboxes)
+                ):
+                    if not item.bboxes:
+                        continue
+
+                    # YOLO format requires image dimensions
+                    img_width = item.width or 1920  # TODO: Get actual dimensions
+                    img_height = item.height or 1080
+
+                    lines = []
+                    for bbox in item.bboxes:
+                        class_id = label_id_map[bbox.label_id]
+                        # Convert to YOLO format (normalized center coordinates)
+                        x_center = (bbox.x + bbox.width / 2) / img_width
+                        y_center = (bbox.y + bbox.height / 2) / img_height
+                        width = bbox.width / img_width
+                        height = bbox.height / img_height
+
+                        lines.append(f"{class_id} {x_center:.6f} {y_center:.6f} {width:.6f} {height:.6f}")
+
+                    # Write label file
+                    label_filename = Path(item.filename).stem + ".txt"
+                    zipf.writestr(f"labels/{label_filename}", "\n".join(lines))
+
+                    # Optionally include image
+                    if include_images:
+                        await run_in_threadpool(
+                            _write_image, zipf, root_path / item.rel_path, f"images/{item.filename}"
+                        )
+
+                    if chunk := buffer.drain(EXPORT_CHUNK_SIZE):
+                        yield chunk
+
+        yield buffer.drain()
 
     async def export_voc(
         self,
-        db: AsyncSession,
         dataset_id: int,
-        output_path: Path,
         include_images: bool = False,
         status_filter: Optional[List[ItemStatus]] = None,
-    ) -> Path:
+    ) -> AsyncIterator[bytes]:
         """
         Export annotations in Pascal VOC XML format.
         """
         if status_filter is None:
             status_filter = [ItemStatus.DONE]
 
-        # Fetch dataset and items
-        query = (
-            select(Dataset)
-            .options(selectinload(Dataset.project).selectinload(Project.labels))
-            .where(Dataset.id == dataset_id)
-        )
-        result = await db.execute(query)
-        dataset = result.scalar_one()
-        project = dataset.project
+        async with self.session_factory() as db:
+            dataset = await self._get_dataset(db, dataset_id, with_labels=True)
+            project = dataset.project
+            root_path = Path(dataset.root_path)
 
-        items_query = (
-            select(Item)
-            .options(selectinload(Item.bboxes))
-            .where(Item.dataset_id == dataset_id)
-            .where(Item.status.in_(status_filter))
-        )
-        result = await db.execute(items_query)
-        items = result.scalars().all()
-        
-        # Create label map for quick lookup
-        label_map = {label.id: label.name for label in project.labels}
+            # Create label map for quick lookup
+            label_map = {label.id: label.name for label in project.labels}
 
-        # Create output ZIP
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        zip_path = output_path / f"{dataset.name}_voc_{timestamp}.zip"
-        
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for item in items:
-                if not item.bboxes:
-                    continue
-                
-                # Create XML annotation
-                annotation = Element('annotation')
-                
-                # Folder
-                folder = SubElement(annotation, 'folder')
-                folder.text = dataset.name
-                
-                # Filename
-                filename = SubElement(annotation, 'filename')
-                filename.text = item.filename
-                
-                # Size
-                size = SubElement(annotation, 'size')
-                width = SubElement(size, 'width')
-                width.text = str(item.width or 1920)
-                height = SubElement(size, 'height')
-                height.text = str(item.height or 1080)
-                depth = SubElement(size, 'depth')
-                depth.text = '3'
-                
-                # Objects
-                for bbox in item.bboxes:
-                    obj = SubElement(annotation, 'object')
-                    
-                    name = SubElement(obj, 'name')
-                    # Use label map to get label name
-                    name.text = label_map.get(bbox.label_id, 'unknown')
-                    
-                    bndbox = SubElement(obj, 'bndbox')
-                    xmin = SubElement(bndbox, 'xmin')
-                    xmin.text = str(int(bbox.x))
-                    ymin = SubElement(bndbox, 'ymin')
-                    ymin.text = str(int(bbox.y))
-                    xmax = SubElement(bndbox, 'xmax')
-                    xmax.text = str(int(bbox.x + bbox.width))
-                    ymax = SubElement(bndbox, 'ymax')
-                    ymax.text = str(int(bbox.y + bbox.height))
-                
-                # Format XML nicely
-                xml_str = minidom.parseString(
-                    tostring(annotation, encoding='unicode')
-                ).toprettyxml(indent="  ")
-                
-                # Write XML file
-                xml_filename = Path(item.filename).stem + ".xml"
-                zipf.writestr(f"Annotations/{xml_filename}", xml_str)
-                
-                # Optionally include image
-                if include_images:
-                    full_path = Path(dataset.root_path) / item.rel_path
-                    if full_path.exists():
-                        zipf.write(full_path, f"JPEGImages/{item.filename}")
-
-        return zip_path
+            buffer = _ZipBuffer()
+            with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                async for item in self._stream_items(
+                    db, dataset_id, status_filter, selectinload(Item.bboxes)
+                ):
+                    if not item.bboxes:
+                        continue
+
+                    # Create XML annotation
+                    annotation = Element('annotation')
+
+                    # Folder
+                    folder = SubElement(annotation, 'folder')
+                    folder.text = dataset.name
+
+                    # Filename
+                    filename = SubElement(annotation, 'filename')
+                    filename.text = item.filename
+
+                    # Size
+                    size = SubElement(annotation, 'size')
+                    width = SubElement(size, 'width')
+                    width.text = str(item.width or 1920)
+                    height = SubElement(size, 'height')
+                    height.text = str(item.height or 1080)
+                    depth = SubElement(size, 'depth')
+                    depth.text = '3'
+
+                    # Objects
+                    for bbox in item.bboxes:
+                        obj = SubElement(annotation, 'object')
+
+                        name = SubElement(obj, 'name')
+                        # Use label map to get label name
+                        name.text = label_map.get(bbox.label_id, 'unknown')
+
+                        bndbox = SubElement(obj, 'bndbox')
+                        xmin = SubElement(bndbox, 'xmin')
+                        xmin.text = str(int(bbox.x))
+                        ymin = SubElement(bndbox, 'ymin')
+                        ymin.text = str(int(bbox.y))
+                        xmax = SubElement(bndbox, 'xmax')
+                        xmax.text = str(int(bbox.x + bbox.width))
+                        ymax = SubElement(bndbox, 'ymax')
+                        ymax.text = str(int(bbox.y + bbox.height))
+
+                    # Format XML nicely
+                    xml_str = minidom.parseString(
+                        tostring(annotation, encoding='unicode')
+                    ).toprettyxml(indent="  ")
+
+                    # Write XML file
+                    xml_filename = Path(item.filename).stem + ".xml"
+                    zipf.writestr(f"Annotations/{xml_filename}", xml_str)
+
+                    # Optionally include image
+                    if include_images:
+                        await run_in_threadpool(
+                            _write_image, zipf, root_path / item.rel_path, f"JPEGImages/{item.filename}"
+                        )
+
+                    if chunk := buffer.drain(EXPORT_CHUNK_SIZE):
+                        yield chunk
 
+        yield buffer.drain()
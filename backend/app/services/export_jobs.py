@@ -0,0 +1,102 @@
+"""Background runner for export jobs."""
+
+from contextlib import suppress
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.models.export_job import ExportJob, ExportJobStatus
+from app.models.item import ItemStatus
+from app.services.export import ExportService
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+async def _set_job(
+    session_factory: async_sessionmaker[AsyncSession], job_id: int, **values
+) -> None:
+    async with session_factory() as db:
+        await db.execute(update(ExportJob).where(ExportJob.id == job_id).values(**values))
+        await db.commit()
+
+
+async def run_export_job(
+    job_id: int, session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    """
+    Build the archive for an export job and record the outcome.
+
+    The ZIP is written next to its final name and renamed once complete, so a
+    job marked done always points at a whole file.
+    """
+    async with session_factory() as db:
+        job = await db.get(ExportJob, job_id)
+    if job is None:
+        return
+
+    await _set_job(session_factory, job_id, status=ExportJobStatus.RUNNING)
+
+    export_root = Path(settings.export_root)
+    file_path = export_root / f"export_{job_id}.zip"
+    part_path = file_path.with_suffix(".zip.part")
+    try:
+        export_root.mkdir(parents=True, exist_ok=True)
+        status_filter = (
+            [ItemStatus(s) for s in job.status_filter] if job.status_filter else None
+        )
+        chunks = ExportService(session_factory).export(
+            job.dataset_id, job.format, job.include_images, status_filter
+        )
+        with part_path.open("wb") as f:
+            async for chunk in chunks:
+                await run_in_threadpool(f.write, chunk)
+        part_path.replace(file_path)
+    except Exception as e:
+        logger.exception("Export job %d (dataset %d as %s) failed", job_id, job.dataset_id, job.format)
+        # The directory itself may be what failed, so cleanup must not raise
+        with suppress(OSError):
+            part_path.unlink(missing_ok=True)
+        await _set_job(
+            session_factory,
+            job_id,
+            status=ExportJobStatus.FAILED,
+            error=str(e) or type(e).__name__,
+            finished_at=datetime.now(timezone.utc),
+        )
+        return
+
+    await _set_job(
+        session_factory,
+        job_id,
+        status=ExportJobStatus.DONE,
+        file_path=str(file_path),
+        finished_at=datetime.now(timezone.utc),
+    )
+
+
+async def fail_interrupted_jobs(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    """
+    Mark jobs left pending or running by a previous process as failed.
+
+    Jobs run as in-process background tasks, so none survives a restart;
+    without this, clients polling such a job would wait forever.
+    """
+    async with session_factory() as db:
+        result = await db.execute(
+            update(ExportJob)
+            .where(ExportJob.status.in_([ExportJobStatus.PENDING, ExportJobStatus.RUNNING]))
+            .values(
+                status=ExportJobStatus.FAILED,
+                error="interrupted",
+                finished_at=datetime.now(timezone.utc),
+            )
+        )
+        await db.commit()
+    if result.rowcount:
+        logger.warning("Marked %d interrupted export jobs as failed", result.rowcount)
@@ -1,12 +1,14 @@
 """Image importer service for scanning server paths."""
 
 import os
-from fnmatch import fnmatch
-from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path, PurePosixPath
 
 from PIL import Image
 from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
@@ -20,6 +22,9 @@ settings = get_settings()
 # Supported image extensions
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".tiff"}
 
+# Items inserted per executemany
+INSERT_BATCH_SIZE = 1000
+
 
 class ImporterService:
     """Service for importing images from server paths."""
@@ -32,6 +37,7 @@ class ImporterService:
         dataset: Dataset,
         glob_pattern: str = "**/*.{jpg,jpeg,png,webp,JPG,JPEG,PNG,WEBP}",
         limit: int | None = None,
+        max_workers: int = 16,
     ) -> ScanResponse:
         """
         Scan a directory and import images into the dataset.
@@ -40,6 +46,7 @@ class ImporterService:
             dataset: Dataset to import into
             glob_pattern: Glob pattern for matching files
             limit: Maximum number of files to import
+            max_workers: Directories/images read concurrently
 
         Returns:
             ScanResponse with import statistics
@@ -69,56 +76,45 @@ class ImporterService:
         result = await self.db.execute(existing_query)
         existing_paths = set(result.scalars().all())
 
-        added_count = 0
-        skipped_count = 0
-        errors: list[ScanError] = []
-        new_items: list[Item] = []
-
         # Convert glob pattern with braces to multiple patterns
         patterns = self._expand_glob_pattern(glob_pattern)
 
-        # Scan directory
-        try:
-            for file_path in self._iter_files(root_path, patterns, limit):
-                rel_path = str(file_path.relative_to(root_path))
-
-                if rel_path in existing_paths:
-                    skipped_count += 1
-                    continue
-
-                try:
-                    # Try to get image dimensions
-                    width, height, file_size = self._get_image_info(file_path)
-
-                    item = Item(
-                        dataset_id=dataset.id,
-                        rel_path=rel_path,
-                        filename=file_path.name,
-                        width=width,
-                        height=height,
-                        file_size=file_size,
-                        status=ItemStatus.TODO,
-                    )
-                    new_items.append(item)
-                    added_count += 1
-
-                    # Batch insert
-                    if len(new_items) >= 100:
-                        self.db.add_all(new_items)
-                        await self.db.flush()
-                        new_items = []
-
-                except Exception as e:
-                    errors.append(ScanError(path=rel_path, error=str(e)))
-                    logger.warning(f"Error processing {rel_path}: {e}")
-
-            # Insert remaining items
-            if new_items:
-                self.db.add_all(new_items)
-                await self.db.flush()
+        # Walk the tree and read image headers off the event loop; both are
+        # dominated by filesystem latency, so keep many requests in flight
+        scanned, errors = await run_in_threadpool(
+            self._scan_files, root_path, patterns, limit, existing_paths, max_workers
+        )
 
-        except PermissionError as e:
-            errors.append(ScanError(path=str(root_path), error=f"Permission denied: {e}"))
+        added_count = 0
+        skipped_count = 0
+        new_items: list[dict] = []
+        insert_items = self._insert_ignoring_duplicates()
+
+        for rel_path, info in scanned:
+            if info is None:
+                skipped_count += 1
+                continue
+
+            width, height, file_size = info
+            new_items.append({
+                "dataset_id": dataset.id,
+                "project_id": dataset.project_id,
+                "rel_path": rel_path,
+                "filename": PurePosixPath(rel_path).name,
+                "width": width,
+                "height": height,
+                "file_size": file_size,
+                "status": ItemStatus.TODO,
+            })
+
+            # Batch insert
+            if len(new_items) >= INSERT_BATCH_SIZE:
+                added_count += await insert_items(new_items)
+                new_items = []
+
+        # Insert remaining items
+        if new_items:
+            added_count += await insert_items(new_items)
 
         # Get total count
         total_query = select(Item.id).where(Item.dataset_id == dataset.id)
@@ -137,6 +133,31 @@ class ImporterService:
             errors=errors[:50],  # Limit error list
         )
 
+    def _insert_ignoring_duplicates(self):
+        """
+        Return a coroutine function inserting item rows in one statement.
+
+        Rows whose (dataset_id, rel_path) already exists, e.g. added by a
+        concurrent scan of the same dataset, are skipped by the database via
+        ON CONFLICT DO NOTHING. Returns the number of rows actually inserted.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            insert = postgresql.insert
+        else:
+            insert = sqlite.insert
+
+        async def insert_items(rows: list[dict]) -> int:
+            stmt = (
+                insert(Item.__table__)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["dataset_id", "rel_path"])
+                .returning(Item.id)
+            )
+            result = await self.db.execute(stmt)
+            return len(result.all())
+
+        return insert_items
+
     def _expand_glob_pattern(self, pattern: str) -> list[str]:
         """Expand glob pattern with braces into multiple patterns."""
         # Handle {ext1,ext2} syntax
@@ -149,30 +170,112 @@ class ImporterService:
             return [f"{prefix}{ext}{suffix}" for ext in extensions]
         return [pattern]
 
-    def _iter_files(
+    def _scan_files(
         self,
         root: Path,
         patterns: list[str],
         limit: int | None,
-    ):
-        """Iterate over files matching patterns."""
-        count = 0
+        existing_paths: set[str],
+        max_workers: int,
+    ) -> tuple[list[tuple[str, tuple[int | None, int | None, int | None] | None]], list[ScanError]]:
+        """
+        Find matching images under root and read their info, concurrently.
+
+        Each directory is listed by its own scandir task, so sibling
+        directories are read in parallel instead of one after another.
+
+        Returns:
+            Sorted (rel_path, info) pairs, info being None for paths that
+            already exist in the dataset, and errors encountered
+        """
+        errors: list[ScanError] = []
+        matches: list[str] = []
+        # Non-recursive patterns never need to look deeper than they are long
+        if any("**" in pattern for pattern in patterns):
+            max_depth = None
+        else:
+            max_depth = max(len(PurePosixPath(pattern).parts) for pattern in patterns) - 1
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {executor.submit(self._scan_dir, root, root, 0, max_depth)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs, error = future.result()
+                    if error:
+                        errors.append(error)
+                    matches.extend(
+                        rel_path for rel_path in files if self._matches(rel_path, patterns)
+                    )
+                    pending.update(
+                        executor.submit(self._scan_dir, root, path, depth, max_depth)
+                        for path, depth in subdirs
+                    )
+
+            matches.sort()
+            if limit:
+                matches = matches[:limit]
+
+            new_paths = [rel_path for rel_path in matches if rel_path not in existing_paths]
+            infos = dict(zip(new_paths, executor.map(self._safe_image_info, (root / p for p in new_paths))))
+
+        scanned = []
+        for rel_path in matches:
+            if rel_path not in infos:
+                scanned.append((rel_path, None))
+                continue
+            info = infos[rel_path]
+            if isinstance(info, Exception):
+                errors.append(ScanError(path=rel_path, error=str(info)))
+                logger.warning(f"Error processing {rel_path}: {info}")
+                continue
+            scanned.append((rel_path, info))
+
+        return scanned, errors
+
+    def _scan_dir(
+        self,
+        root: Path,
+        path: Path,
+        depth: int,
+        max_depth: int | None,
+    ) -> tuple[list[str], list[tuple[Path, int]], ScanError | None]:
+        """List one directory: image files (relative to root) and subdirectories to visit."""
+        files: list[str] = []
+        subdirs: list[tuple[Path, int]] = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    # Like rglob, don't descend into symlinked directories
+                    if entry.is_dir(follow_symlinks=False):
+                        if max_depth is None or depth < max_depth:
+                            subdirs.append((Path(entry.path), depth + 1))
+                    elif entry.is_file() and self._is_image(Path(entry.name)):
+                        files.append(Path(entry.path).relative_to(root).as_posix())
+        except PermissionError as e:
+            return files, subdirs, ScanError(path=str(path), error=f"Permission denied: {e}")
+        except OSError as e:
+            return files, subdirs, ScanError(path=str(path), error=str(e))
+        return files, subdirs, None
+
+    @staticmethod
+    def _matches(rel_path: str, patterns: list[str]) -> bool:
+        """Match a root-relative path against the expanded glob patterns."""
+        path = PurePosixPath(rel_path)
         for pattern in patterns:
-            # Handle ** recursive patterns
             if "**" in pattern:
-                for file_path in root.rglob(pattern.replace("**/", "")):
-                    if file_path.is_file() and self._is_image(file_path):
-                        yield file_path
-                        count += 1
-                        if limit and count >= limit:
-                            return
-            else:
-                for file_path in root.glob(pattern):
-                    if file_path.is_file() and self._is_image(file_path):
-                        yield file_path
-                        count += 1
-                        if limit and count >= limit:
-                            return
+                # "**/x" matches x at any depth, as root.rglob("x") does
+                if path.match(pattern.replace("**/", "")):
+                    return True
+            elif len(path.parts) == len(PurePosixPath(pattern).parts) and path.match(pattern):
+                return True
+        return False
+
+    def _safe_image_info(self, path: Path) -> tuple[int | None, int | None, int | None] | Exception:
+        try:
+            return self._get_image_info(path)
+        except Exception as e:
+            return e
 
     def _is_image(self, path: Path) -> bool:
         """Check if file is a supported image."""
@@ -1,10 +1,14 @@
 """Parser service using JMESPath for flexible annotation import."""
 
-import json
+import io
+import re
 import time
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 import jmespath
+import orjson
 from pydantic import ValidationError
 
 from app.schemas.parser_template import Prediction, PredictionItem
@@ -15,6 +19,38 @@ class ParserError(Exception):
     pass
 
 
+# Plain dotted field paths such as ``label`` or ``meta.image.path``
+_FIELD_PATH_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*")
+
+
+@lru_cache(maxsize=256)
+def compile_path(expression: str) -> Callable[[Any], Any]:
+    """
+    Compile a JMESPath expression into a search function.
+
+    Most template mappings are plain field paths, which are turned into a
+    generated function of straight-line dict lookups instead of going through
+    JMESPath's tree interpreter; anything else is compiled by JMESPath.
+    Compiled paths are shared by all parser instances, so repeated runs of a
+    template skip compilation entirely.
+    """
+    if not _FIELD_PATH_RE.fullmatch(expression):
+        return jmespath.compile(expression).search
+
+    # Keys are plain identifiers (checked above) and are emitted as string
+    # literals, so the generated code can only ever do dict lookups
+    lines = ["def search(value):"]
+    for key in expression.split("."):
+        lines.append("    if not isinstance(value, dict):")
+        lines.append("        return None")
+        lines.append(f"    value = value.get({key!r})")
+    lines.append("    return value")
+
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(lines), f"<path {expression}>", "exec"), namespace)
+    return namespace["search"]
+
+
 class ParserService:
     """
     Service for parsing annotations using JMESPath templates.
@@ -47,18 +83,18 @@ class ParserService:
     
     def _compile_expressions(self):
         """Pre-compile JMESPath expressions for performance."""
-        self.image_key_expr = jmespath.compile(self.mapping.get("image_key", ""))
-        self.annotations_path_expr = jmespath.compile(self.mapping.get("annotations_path", ""))
+        self.image_key_expr = compile_path(self.mapping.get("image_key", ""))
+        self.annotations_path_expr = compile_path(self.mapping.get("annotations_path", ""))
         
         # Annotation mappings
         ann_mapping = self.mapping.get("annotation", {})
-        self.label_expr = jmespath.compile(ann_mapping.get("label", ""))
-        self.score_expr = jmespath.compile(ann_mapping.get("score", "")) if ann_mapping.get("score") else None
+        self.label_expr = compile_path(ann_mapping.get("label", ""))
+        self.score_expr = compile_path(ann_mapping.get("score", "")) if ann_mapping.get("score") else None
         
         # Bbox mapping
         bbox_cfg = ann_mapping.get("bbox", {})
         if bbox_cfg:
-            self.bbox_path_expr = jmespath.compile(bbox_cfg.get("path", ""))
+            self.bbox_path_expr = compile_path(bbox_cfg.get("path", ""))
             self.bbox_format = bbox_cfg.get("format", "xyxy")
             self.bbox_normalized = bbox_cfg.get("normalized", False)
         else:
@@ -67,31 +103,30 @@ class ParserService:
         # Polygon mapping
         polygon_cfg = ann_mapping.get("polygon", {})
         if polygon_cfg:
-            self.polygon_path_expr = jmespath.compile(polygon_cfg.get("path", ""))
+            self.polygon_path_expr = compile_path(polygon_cfg.get("path", ""))
             self.polygon_format = polygon_cfg.get("format", "flat")
         else:
             self.polygon_path_expr = None
     
-    def parse_json(self, data: str, record_path: Optional[str] = None) -> List[Prediction]:
+    def parse_json(self, data: str | bytes, record_path: Optional[str] = None) -> List[Prediction]:
         """
-        Parse JSON string.
+        Parse JSON document.
         
         Args:
-            data: JSON string
+            data: JSON string, or raw bytes (parsed without decoding to str first)
             record_path: JMESPath to array of records (optional)
             
         Returns:
             List of Prediction objects
         """
         try:
-            obj = json.loads(data)
-        except json.JSONDecodeError as e:
+            obj = orjson.loads(data)
+        except orjson.JSONDecodeError as e:
             raise ParserError(f"Invalid JSON: {e}")
         
         # Extract records array if record_path is provided
         if record_path:
-            record_path_expr = jmespath.compile(record_path)
-            records = record_path_expr.search(obj)
+            records = compile_path(record_path)(obj)
             if not isinstance(records, list):
                 raise ParserError(f"Record path '{record_path}' did not return an array")
         else:
@@ -112,7 +147,9 @@ class ParserService:
             List of Prediction objects
         """
         records = []
-        for line_num, line in enumerate(data.strip().split('\n'), 1):
+        # Iterate lines lazily: with max_records set, the rest of the input
+        # is never split or copied
+        for line_num, line in enumerate(io.StringIO(data), 1):
             if max_records and len(records) >= max_records:
                 break
             
@@ -121,13 +158,30 @@ class ParserService:
                 continue
             
             try:
-                record = json.loads(line)
+                record = orjson.loads(line)
                 records.append(record)
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 raise ParserError(f"Line {line_num}: Invalid JSON: {e}")
         
         return self._parse_records(records)
     
+    def parse_record(self, record: str | bytes | Dict[str, Any]) -> Optional[Prediction]:
+        """
+        Parse a single record.
+        
+        Args:
+            record: Record dictionary, or one JSON object as text (e.g. a JSONL line)
+            
+        Returns:
+            Prediction object or None if the record has no image key
+        """
+        if not isinstance(record, dict):
+            try:
+                record = orjson.loads(record)
+            except orjson.JSONDecodeError as e:
+                raise ParserError(f"Invalid JSON: {e}")
+        return self._parse_single_record(record)
+    
     def _parse_records(self, records: List[Dict[str, Any]]) -> List[Prediction]:
         """
         Parse a list of record dicts into Predictions.
@@ -164,13 +218,13 @@ class ParserService:
         """
         # Extract image key
         start_time = time.time()
-        image_key = self.image_key_expr.search(record)
+        image_key = self.image_key_expr(record)
         
         if not image_key:
             return None
         
         # Extract annotations array
-        annotations = self.annotations_path_expr.search(record)
+        annotations = self.annotations_path_expr(record)
         if not annotations or not isinstance(annotations, list):
             return Prediction(image_key=str(image_key), predictions=[])
         
@@ -182,20 +236,20 @@ class ParserService:
                 raise ParserError(f"Expression timeout exceeded ({self.MAX_EXPRESSION_TIME_MS}ms)")
             
             # Extract label
-            label = self.label_expr.search(ann)
+            label = self.label_expr(ann)
             if not label:
                 continue
             
             # Extract score (optional)
             score = None
             if self.score_expr:
-                score = self.score_expr.search(ann)
+                score = self.score_expr(ann)
                 if score is not None:
                     score = float(score)
             
             # Parse bbox if configured
             if self.bbox_path_expr:
-                bbox_data = self.bbox_path_expr.search(ann)
+                bbox_data = self.bbox_path_expr(ann)
                 if bbox_data:
                     bbox = self._parse_bbox(bbox_data, self.bbox_format, self.bbox_normalized)
                     if bbox:
@@ -208,7 +262,7 @@ class ParserService:
             
             # Parse polygon if configured
             if self.polygon_path_expr:
-                polygon_data = self.polygon_path_expr.search(ann)
+                polygon_data = self.polygon_path_expr(ann)
                 if polygon_data:
                     polygon = self._parse_polygon(polygon_data, self.polygon_format)
                     if polygon:
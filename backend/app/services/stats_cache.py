@@ -0,0 +1,130 @@
+"""In-process cache for per-dataset item status counts."""
+
+import time
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.core.config import get_settings
+from app.models.item import Item, ItemStatus
+
+settings = get_settings()
+
+
+class StatsCache:
+    """
+    Short-lived cache of dataset statistics keyed by dataset ID.
+
+    Dataset listings and next-item recompute status counts over every item of
+    a dataset, which dominates their cost on large datasets. Counts are cached
+    for ``ttl`` seconds; paths that change them in bulk (scan, delete)
+    invalidate the entry after committing, and single-item status changes
+    through ``invalidate_in()``. Invalidation bumps ``version``; readers
+    capture it before counting and pass it back to ``set()``, so counts read
+    while a change was being committed are discarded instead of cached.
+    The cache is per process, so with several workers each keeps its own copy.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.version = 0
+        self._entries: dict[int, tuple[float, dict]] = {}
+
+    def get(self, dataset_id: int) -> dict | None:
+        """Return cached stats for a dataset, or None if missing or expired."""
+        entry = self._entries.get(dataset_id)
+        if entry is None:
+            return None
+        expires_at, stats = entry
+        if expires_at < time.monotonic():
+            del self._entries[dataset_id]
+            return None
+        return stats
+
+    def set(self, version: int, dataset_id: int, stats: dict) -> None:
+        """Cache stats for a dataset read at ``version``."""
+        if self.ttl > 0 and version == self.version:
+            self._entries[dataset_id] = (time.monotonic() + self.ttl, stats)
+
+    def invalidate(self, dataset_id: int) -> None:
+        """Drop the cached stats of a dataset and reject counts already being read."""
+        self.version += 1
+        self._entries.pop(dataset_id, None)
+
+    def invalidate_in(self, db: AsyncSession, dataset_id: int) -> None:
+        """
+        Invalidate a dataset whose counts ``db`` has changed but not committed.
+
+        The entry is dropped now, so later reads on ``db`` see the change, and
+        again when the transaction ends, discarding anything cached from other
+        sessions in between.
+        """
+        self.invalidate(dataset_id)
+        pending = db.info.get(self)
+        if pending is None:
+            pending = db.info[self] = set()
+            event.listen(db.sync_session, "after_transaction_end", self._after_transaction_end)
+        pending.add(dataset_id)
+
+    def _after_transaction_end(self, session: Session, transaction: SessionTransaction) -> None:
+        pending = session.info[self]
+        for dataset_id in pending:
+            self.invalidate(dataset_id)
+        pending.clear()
+
+    def clear(self) -> None:
+        """Drop all cached stats."""
+        self._entries.clear()
+
+
+dataset_stats_cache = StatsCache(ttl=settings.stats_cache_ttl)
+
+
+async def get_datasets_stats(db: AsyncSession, dataset_ids: list[int]) -> dict[int, dict]:
+    """
+    Get status counts for several datasets, keyed by dataset ID.
+
+    Served from ``dataset_stats_cache`` where possible; the rest are counted
+    with one grouped query. Deleted items are not counted, and
+    ``todo_count`` includes items in progress.
+    """
+    stats = {}
+    missing = {}
+    for dataset_id in dataset_ids:
+        cached = dataset_stats_cache.get(dataset_id)
+        if cached is not None:
+            stats[dataset_id] = cached
+        else:
+            missing[dataset_id] = {"item_count": 0, "todo_count": 0, "done_count": 0, "skipped_count": 0}
+    if not missing:
+        return stats
+
+    version = dataset_stats_cache.version
+    query = (
+        select(Item.dataset_id, Item.status, func.count(Item.id))
+        .where(Item.dataset_id.in_(missing), Item.status != ItemStatus.DELETED)
+        .group_by(Item.dataset_id, Item.status)
+    )
+    result = await db.execute(query)
+
+    for dataset_id, item_status, count in result:
+        dataset_stats = missing[dataset_id]
+        # Total (excluding deleted)
+        dataset_stats["item_count"] += count
+        if item_status in (ItemStatus.TODO, ItemStatus.IN_PROGRESS):
+            dataset_stats["todo_count"] += count
+        elif item_status == ItemStatus.DONE:
+            dataset_stats["done_count"] += count
+        elif item_status == ItemStatus.SKIPPED:
+            dataset_stats["skipped_count"] += count
+
+    for dataset_id, dataset_stats in missing.items():
+        dataset_stats_cache.set(version, dataset_id, dataset_stats)
+    stats.update(missing)
+    return stats
+
+
+async def get_dataset_stats(db: AsyncSession, dataset_id: int) -> dict:
+    """Get status counts for one dataset; see ``get_datasets_stats``."""
+    return (await get_datasets_stats(db, [dataset_id]))[dataset_id]
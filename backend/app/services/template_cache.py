@@ -0,0 +1,67 @@
+"""In-process cache for parser template reads."""
+
+import time
+from collections.abc import Hashable
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class TemplateCache:
+    """
+    Cache of parser template listings and single templates.
+
+    Templates are read on every listing and parse test but rarely change:
+    builtin ones never do at runtime, and user ones only through the template
+    endpoints, which call ``invalidate()``. Invalidation bumps ``version``;
+    readers capture it before querying and pass it back when storing, so a
+    result read while a write was in flight is discarded instead of cached.
+    Entries also expire after ``ttl`` seconds, which bounds how long other
+    worker processes, each with their own copy, can serve a stale template.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.version = 0
+        self._pages: dict[Hashable, tuple[float, dict]] = {}
+        self._templates: dict[Hashable, tuple[float, dict]] = {}
+
+    def get_page(self, page: int, page_size: int) -> dict | None:
+        """Return a cached listing page, or None if missing or expired."""
+        return self._get(self._pages, (page, page_size))
+
+    def set_page(self, version: int, page: int, page_size: int, payload: dict) -> None:
+        """Cache a listing page read at ``version``."""
+        self._set(self._pages, version, (page, page_size), payload)
+
+    def get_template(self, template_id: int) -> dict | None:
+        """Return a cached template, or None if missing or expired."""
+        return self._get(self._templates, template_id)
+
+    def set_template(self, version: int, template_id: int, template: dict) -> None:
+        """Cache a template read at ``version``."""
+        self._set(self._templates, version, template_id, template)
+
+    def invalidate(self) -> None:
+        """Drop everything cached and reject results of reads already running."""
+        self.version += 1
+        self._pages.clear()
+        self._templates.clear()
+
+    def _get(self, entries: dict, key: Hashable) -> dict | None:
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del entries[key]
+            return None
+        return value
+
+    def _set(self, entries: dict, version: int, key: Hashable, value: dict) -> None:
+        if self.ttl > 0 and version == self.version:
+            entries[key] = (time.monotonic() + self.ttl, value)
+
+
+template_cache = TemplateCache(ttl=settings.template_cache_ttl)
@@ -1,6 +1,7 @@
 """Thumbnail generation service."""
 
 import hashlib
+from functools import lru_cache
 from pathlib import Path
 
 from PIL import Image
@@ -102,3 +103,8 @@ class ThumbnailService:
             return thumb_path
         return self.generate_thumbnail(image_path, size)
 
+
+@lru_cache
+def get_thumbnail_service() -> ThumbnailService:
+    """Get shared thumbnail service instance."""
+    return ThumbnailService()
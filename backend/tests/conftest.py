@@ -4,12 +4,22 @@ import asyncio
 from collections.abc import AsyncGenerator
 from typing import Generator
 
+import orjson
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.core.database import Base, get_db
+from app.core.database import (
+    Base,
+    get_db,
+    get_session_factory,
+    json_serializer,
+    set_sqlite_foreign_keys,
+)
 from app.main import app
+from app.services.stats_cache import dataset_stats_cache
+from app.services.template_cache import template_cache
 
 # Test database URL (in-memory SQLite)
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -30,7 +40,10 @@ async def async_engine():
         TEST_DATABASE_URL,
         echo=False,
         future=True,
+        json_serializer=json_serializer,
+        json_deserializer=orjson.loads,
     )
+    event.listen(engine.sync_engine, "connect", set_sqlite_foreign_keys)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield engine
@@ -62,6 +75,13 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    # Background work opens its own sessions; point it at the test database
+    app.dependency_overrides[get_session_factory] = lambda: async_sessionmaker(
+        db_session.bind, class_=AsyncSession, expire_on_commit=False
+    )
+    # Each test gets a fresh database, so anything cached by earlier tests is stale
+    dataset_stats_cache.clear()
+    template_cache.invalidate()
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -0,0 +1,182 @@
+"""Tests for annotation endpoints."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.annotation import AnnotationEvent, EventType
+from app.models.item import Item, ItemStatus
+from app.models.label import Label
+
+
+@pytest.fixture
+async def item_id(client: AsyncClient, db_session: AsyncSession) -> int:
+    """Create a project, dataset and item for testing."""
+    response = await client.post(
+        "/api/v1/projects",
+        json={
+            "name": "Test Project",
+            "task_type": "classification",
+            "labels": [
+                {"name": "Cat", "color": "#FF0000"},
+                {"name": "Dog", "color": "#00FF00"},
+            ],
+        },
+    )
+    project_id = response.json()["id"]
+    response = await client.post(
+        f"/api/v1/projects/{project_id}/datasets",
+        json={"name": "Test Dataset", "root_path": "/tmp/images"},
+    )
+    dataset_id = response.json()["id"]
+
+    item = Item(dataset_id=dataset_id, project_id=project_id, rel_path="a.jpg", filename="a.jpg")
+    db_session.add(item)
+    await db_session.flush()
+    return item.id
+
+
+@pytest.mark.asyncio
+async def test_submit_classification(client: AsyncClient, db_session: AsyncSession, item_id: int):
+    """Test submitting a classification marks the item done."""
+    response = await client.post(
+        f"/api/v1/items/{item_id}/classification",
+        json={"label": "Cat"},
+    )
+    assert response.status_code == 201
+    data = response.json()
+    assert data["item_id"] == item_id
+    assert data["label"] == "Cat"
+
+    item = await db_session.get(Item, item_id)
+    assert item.status == ItemStatus.DONE
+
+    result = await db_session.execute(
+        select(AnnotationEvent.event_type).where(AnnotationEvent.item_id == item_id)
+    )
+    assert result.scalars().all() == [EventType.SUBMIT_DONE]
+
+
+@pytest.mark.asyncio
+async def test_skip_item(client: AsyncClient, item_id: int):
+    """Test skipping an item."""
+    response = await client.post(f"/api/v1/items/{item_id}/skip", json={"reason": "blurry"})
+    assert response.status_code == 200
+    assert response.json() == {"status": "skipped", "reason": "blurry"}
+
+
+@pytest.mark.asyncio
+async def test_delete_and_restore_item(client: AsyncClient, item_id: int):
+    """Test soft deleting and restoring an item."""
+    response = await client.post(f"/api/v1/items/{item_id}/delete")
+    assert response.status_code == 200
+
+    # Deleted items cannot be annotated or deleted again
+    response = await client.post(f"/api/v1/items/{item_id}/classification", json={"label": "Cat"})
+    assert response.status_code == 400
+    response = await client.post(f"/api/v1/items/{item_id}/delete")
+    assert response.status_code == 400
+
+    response = await client.post(f"/api/v1/items/{item_id}/restore")
+    assert response.status_code == 200
+    assert response.json() == {"status": "restored"}
+
+
+@pytest.mark.asyncio
+async def test_item_not_found(client: AsyncClient):
+    """Test annotating a non-existent item."""
+    response = await client.post("/api/v1/items/99999/skip", json={"reason": "blurry"})
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_save_annotations_batch_replaces_existing(
+    client: AsyncClient, db_session: AsyncSession, item_id: int
+):
+    """Test batch save replaces all previous annotations of an item."""
+    label_id = await db_session.scalar(select(Label.id).where(Label.name == "Cat"))
+    bbox = {"label_id": label_id, "x": 1, "y": 2, "width": 3, "height": 4}
+    polygon = {"label_id": label_id, "points": [[0, 0], [1, 0], [1, 1]]}
+
+    response = await client.post(
+        f"/api/v1/items/{item_id}/annotations/batch",
+        json={"bboxes": [bbox, bbox], "polygons": [polygon]},
+    )
+    assert response.status_code == 200
+
+    response = await client.post(
+        f"/api/v1/items/{item_id}/annotations/batch",
+        json={"bboxes": [bbox], "polygons": []},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["bboxes"]) == 1
+    assert data["bboxes"][0]["label_name"] == "Cat"
+    assert data["polygons"] == []
+
+    response = await client.get(f"/api/v1/items/{item_id}/annotations")
+    data = response.json()
+    assert len(data["bboxes"]) == 1
+    assert data["polygons"] == []
+
+
+@pytest.mark.asyncio
+async def test_get_item_annotations_empty(client: AsyncClient, item_id: int):
+    """Test an item without annotations is told apart from a missing item."""
+    response = await client.get(f"/api/v1/items/{item_id}/annotations")
+    assert response.status_code == 200
+    assert response.json() == {"item_id": item_id, "bboxes": [], "polygons": []}
+
+    response = await client.get("/api/v1/items/99999/annotations")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_save_annotations_batch_unknown_label(client: AsyncClient, item_id: int):
+    """Test batch save rejects labels outside the project."""
+    response = await client.post(
+        f"/api/v1/items/{item_id}/annotations/batch",
+        json={"bboxes": [{"label_id": 999, "x": 1, "y": 2, "width": 3, "height": 4}]},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Label 999 not found in project"
+
+
+@pytest.mark.asyncio
+async def test_delete_bbox(client: AsyncClient, db_session: AsyncSession, item_id: int):
+    """Test deleting a bounding box."""
+    label_id = await db_session.scalar(select(Label.id).where(Label.name == "Cat"))
+    response = await client.post(
+        f"/api/v1/items/{item_id}/bboxes",
+        json={"label_id": label_id, "x": 1, "y": 2, "width": 3, "height": 4},
+    )
+    assert response.status_code == 201
+    bbox_id = response.json()["id"]
+
+    response = await client.delete(f"/api/v1/bboxes/{bbox_id}")
+    assert response.status_code == 204
+    response = await client.delete(f"/api/v1/bboxes/{bbox_id}")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_update_bbox_label(client: AsyncClient, db_session: AsyncSession, item_id: int):
+    """Test changing the label and geometry of a bounding box."""
+    labels = dict((await db_session.execute(select(Label.name, Label.id))).all())
+    response = await client.post(
+        f"/api/v1/items/{item_id}/bboxes",
+        json={"label_id": labels["Cat"], "x": 1, "y": 2, "width": 3, "height": 4},
+    )
+    bbox_id = response.json()["id"]
+
+    response = await client.put(
+        f"/api/v1/bboxes/{bbox_id}",
+        json={"label_id": labels["Dog"], "x": 5},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["label_id"] == labels["Dog"]
+    assert data["label_name"] == "Dog"
+    assert data["x"] == 5
+    assert data["updated_at"] is not None
@@ -2,6 +2,12 @@
 
 import pytest
 from httpx import AsyncClient
+from PIL import Image
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.item import Item, ItemStatus
+from app.services.stats_cache import StatsCache
 
 
 @pytest.fixture
@@ -63,14 +69,16 @@ async def test_get_dataset(client: AsyncClient, project_id: int):
 
 
 @pytest.mark.asyncio
-async def test_delete_dataset(client: AsyncClient, project_id: int):
-    """Test deleting a dataset."""
+async def test_delete_dataset(client: AsyncClient, db_session: AsyncSession, project_id: int):
+    """Test deleting a dataset removes its items too."""
     # Create a dataset first
     create_response = await client.post(
         f"/api/v1/projects/{project_id}/datasets",
         json={"name": "To Delete", "root_path": "/tmp/images"},
     )
     dataset_id = create_response.json()["id"]
+    db_session.add(Item(dataset_id=dataset_id, project_id=project_id, rel_path="a.jpg", filename="a.jpg"))
+    await db_session.flush()
 
     response = await client.delete(f"/api/v1/datasets/{dataset_id}")
     assert response.status_code == 204
@@ -78,4 +86,98 @@ async def test_delete_dataset(client: AsyncClient, project_id: int):
     # Verify it's deleted
     get_response = await client.get(f"/api/v1/datasets/{dataset_id}")
     assert get_response.status_code == 404
+    assert await db_session.scalar(select(func.count(Item.id))) == 0
+
+    response = await client.delete(f"/api/v1/datasets/{dataset_id}")
+    assert response.status_code == 404
+
+
+
+@pytest.mark.asyncio
+async def test_list_datasets_stats(client: AsyncClient, db_session: AsyncSession, project_id: int):
+    """Test dataset listing reports item counts per status."""
+    dataset_ids = []
+    for name in ("A", "B"):
+        response = await client.post(
+            f"/api/v1/projects/{project_id}/datasets",
+            json={"name": name, "root_path": "/tmp/images"},
+        )
+        dataset_ids.append(response.json()["id"])
+
+    statuses = [ItemStatus.TODO, ItemStatus.IN_PROGRESS, ItemStatus.DONE, ItemStatus.SKIPPED, ItemStatus.DELETED]
+    db_session.add_all(
+        Item(
+            dataset_id=dataset_ids[0],
+            project_id=project_id,
+            rel_path=f"{i}.jpg",
+            filename=f"{i}.jpg",
+            status=item_status,
+        )
+        for i, item_status in enumerate(statuses)
+    )
+    await db_session.flush()
+
+    response = await client.get(f"/api/v1/projects/{project_id}/datasets")
+    assert response.status_code == 200
+    stats = {
+        d["id"]: (d["item_count"], d["todo_count"], d["done_count"], d["skipped_count"])
+        for d in response.json()
+    }
+    assert stats[dataset_ids[0]] == (4, 2, 1, 1)
+    assert stats[dataset_ids[1]] == (0, 0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_scan_dataset(client: AsyncClient, project_id: int, tmp_path):
+    """Test scanning a nested directory imports images once and skips them on rescan."""
+    for rel_path in ["a.jpg", "sub/b.PNG", "sub/deeper/c.jpeg"]:
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        Image.new("RGB", (4, 3)).save(path, format="PNG" if path.suffix == ".PNG" else "JPEG")
+    (tmp_path / "sub" / "notes.txt").write_text("not an image")
 
+    create_response = await client.post(
+        f"/api/v1/projects/{project_id}/datasets",
+        json={"name": "Scanned", "root_path": str(tmp_path)},
+    )
+    dataset_id = create_response.json()["id"]
+
+    response = await client.post(f"/api/v1/datasets/{dataset_id}/scan", json={"max_workers": 2})
+    assert response.status_code == 200
+    assert response.json() == {"added_count": 3, "total_count": 3, "skipped_count": 0, "errors": []}
+
+    response = await client.get(f"/api/v1/datasets/{dataset_id}/items")
+    items = response.json()["items"]
+    assert sorted(item["rel_path"] for item in items) == ["a.jpg", "sub/b.PNG", "sub/deeper/c.jpeg"]
+    assert {(item["width"], item["height"]) for item in items} == {(4, 3)}
+
+    # Top-level only pattern
+    response = await client.post(f"/api/v1/datasets/{dataset_id}/scan", json={"glob": "*.jpg"})
+    assert response.json()["skipped_count"] == 1
+    assert response.json()["added_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_dataset_missing_project(client: AsyncClient):
+    """Test dataset endpoints 404 on an unknown project."""
+    response = await client.post(
+        "/api/v1/projects/9999/datasets",
+        json={"name": "Orphan", "root_path": "/tmp/images"},
+    )
+    assert response.status_code == 404
+    response = await client.get("/api/v1/projects/9999/datasets")
+    assert response.status_code == 404
+    response = await client.get("/api/v1/datasets/9999/items")
+    assert response.status_code == 404
+
+
+def test_stats_cache_discards_stale_reads():
+    """Test counts read before an invalidation are not cached."""
+    cache = StatsCache(ttl=60)
+    version = cache.version
+    cache.invalidate(1)
+    cache.set(version, 1, {"item_count": 0})
+    assert cache.get(1) is None
+
+    cache.set(cache.version, 1, {"item_count": 5})
+    assert cache.get(1) == {"item_count": 5}
@@ -0,0 +1,124 @@
+"""Tests for the buffered annotation event writer."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.annotation import AnnotationEvent, EventType
+from app.models.dataset import Dataset
+from app.models.item import Item
+from app.models.project import Project
+from app.services.event_writer import EventWriter
+
+
+@pytest.fixture
+def session_factory(async_engine) -> async_sessionmaker[AsyncSession]:
+    """Session factory on the test database, as the writer uses in the app."""
+    return async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+async def event(session_factory) -> dict:
+    """Column values of one event on a committed project, dataset and item."""
+    async with session_factory() as session:
+        project = Project(name="Test Project")
+        dataset = Dataset(project=project, name="Test Dataset", root_path="/tmp/images")
+        session.add(dataset)
+        await session.flush()
+        item = Item(dataset=dataset, project_id=project.id, rel_path="a.jpg", filename="a.jpg")
+        session.add(item)
+        await session.commit()
+        return {
+            "project_id": project.id,
+            "dataset_id": dataset.id,
+            "item_id": item.id,
+            "event_type": EventType.OPEN,
+        }
+
+
+async def _write(writer: EventWriter, session_factory, event: dict, count: int = 1) -> None:
+    """Record events on a request-like session and commit it."""
+    async with session_factory() as session:
+        for _ in range(count):
+            await writer.write(session, event)
+        await session.commit()
+
+
+async def _event_count(session_factory) -> int:
+    async with session_factory() as session:
+        return await session.scalar(select(func.count(AnnotationEvent.id)))
+
+
+@pytest.mark.asyncio
+async def test_flush_full_batch(session_factory, event: dict):
+    """Test a full batch is written without waiting for the flush interval."""
+    writer = EventWriter(batch_size=3, flush_interval=60, session_factory=session_factory)
+    await writer.start()
+    try:
+        await _write(writer, session_factory, event, 3)
+        # Far short of the flush interval
+        await asyncio.sleep(0.2)
+        assert await _event_count(session_factory) == 3
+    finally:
+        await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_flush_interval(session_factory, event: dict):
+    """Test a partial batch is written once the flush interval has passed."""
+    writer = EventWriter(batch_size=100, flush_interval=0.05, session_factory=session_factory)
+    await writer.start()
+    try:
+        await _write(writer, session_factory, event)
+        assert await _event_count(session_factory) == 0
+        await asyncio.sleep(0.2)
+        assert await _event_count(session_factory) == 1
+    finally:
+        await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_buffer(session_factory, event: dict):
+    """Test stop returns promptly and writes everything still buffered."""
+    writer = EventWriter(batch_size=100, flush_interval=60, session_factory=session_factory)
+    await writer.start()
+    await _write(writer, session_factory, event, 2)
+    # Let the consumer take the first event and start waiting for more
+    await asyncio.sleep(0)
+    await _write(writer, session_factory, event)
+
+    await asyncio.wait_for(writer.stop(), timeout=1)
+    assert not writer.running
+    assert await _event_count(session_factory) == 3
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_events_are_not_written(session_factory, event: dict):
+    """Test events of a session that rolls back are discarded."""
+    writer = EventWriter(batch_size=100, flush_interval=60, session_factory=session_factory)
+    await writer.start()
+    async with session_factory() as session:
+        await session.execute(select(1))
+        await writer.write(session, event)
+        await session.rollback()
+        # Nothing is queued before a commit either
+        await writer.write(session, event)
+        await asyncio.sleep(0.1)
+        assert writer._queue.empty()
+        await session.commit()
+
+    await writer.stop()
+    assert await _event_count(session_factory) == 1
+
+
+@pytest.mark.asyncio
+async def test_flush_drops_only_orphaned_events(session_factory, event: dict):
+    """Test an event whose item is gone does not take the rest of its batch with it."""
+    writer = EventWriter(batch_size=100, flush_interval=60, session_factory=session_factory)
+    orphan = {**event, "item_id": event["item_id"] + 1000}
+
+    await writer._flush([event, orphan, event])
+
+    assert await _event_count(session_factory) == 2
@@ -0,0 +1,171 @@
+"""Tests for export endpoints."""
+
+import io
+import json
+import zipfile
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.annotation import BBoxAnnotation
+from app.models.export_job import ExportJob, ExportJobStatus
+from app.models.item import Item, ItemStatus
+from app.models.label import Label
+from app.services import export_jobs
+from app.services.export import ExportService
+
+
+async def _create_dataset(client: AsyncClient, task_type: str) -> tuple[int, int]:
+    response = await client.post(
+        "/api/v1/projects",
+        json={
+            "name": "Export Project",
+            "task_type": task_type,
+            "labels": [{"name": "Cat", "color": "#FF0000"}],
+        },
+    )
+    project_id = response.json()["id"]
+    response = await client.post(
+        f"/api/v1/projects/{project_id}/datasets",
+        json={"name": "Export Dataset", "root_path": "/tmp/images"},
+    )
+    return project_id, response.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_export_format_mismatch(client: AsyncClient):
+    """Test detection formats are rejected for classification projects before streaming."""
+    _, dataset_id = await _create_dataset(client, "classification")
+
+    response = await client.post(f"/api/v1/datasets/{dataset_id}/export?format=coco")
+    assert response.status_code == 400
+    assert "COCO format is not for classification tasks" in response.json()["detail"]
+
+    response = await client.post("/api/v1/datasets/9999/export?format=coco")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_export_yolo_stream(client: AsyncClient, db_session: AsyncSession, async_engine):
+    """Test the streamed YOLO archive is a valid ZIP with one label file per annotated item."""
+    project_id, dataset_id = await _create_dataset(client, "detection")
+    label = (await db_session.execute(select(Label))).scalar_one()
+
+    done = Item(
+        dataset_id=dataset_id, project_id=project_id, rel_path="a.jpg", filename="a.jpg",
+        status=ItemStatus.DONE, width=100, height=100,
+    )
+    todo = Item(dataset_id=dataset_id, project_id=project_id, rel_path="b.jpg", filename="b.jpg")
+    db_session.add_all([done, todo])
+    await db_session.flush()
+    db_session.add(BBoxAnnotation(item_id=done.id, label_id=label.id, x=10, y=20, width=30, height=40))
+    await db_session.commit()
+
+    service = ExportService(async_sessionmaker(async_engine, expire_on_commit=False))
+    data = b"".join([chunk async for chunk in service.export_yolo(dataset_id)])
+
+    with zipfile.ZipFile(io.BytesIO(data)) as zipf:
+        assert sorted(zipf.namelist()) == ["classes.txt", "labels/a.txt"]
+        assert zipf.read("classes.txt") == b"Cat"
+        assert zipf.read("labels/a.txt") == b"0 0.250000 0.400000 0.300000 0.400000"
+
+
+@pytest.mark.asyncio
+async def test_export_job(client: AsyncClient, db_session: AsyncSession, tmp_path, monkeypatch):
+    """Test a background export job runs to completion and serves its archive."""
+    monkeypatch.setattr(export_jobs.settings, "export_root", str(tmp_path))
+    project_id, dataset_id = await _create_dataset(client, "detection")
+    db_session.add(Item(
+        dataset_id=dataset_id, project_id=project_id, rel_path="a.jpg", filename="a.jpg",
+        status=ItemStatus.DONE, width=100, height=100,
+    ))
+    await db_session.commit()
+
+    response = await client.post(f"/api/v1/datasets/{dataset_id}/exports?format=yolo")
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+
+    # The background task has finished by the time the client gets the response
+    response = await client.get(f"/api/v1/exports/{job_id}")
+    assert response.json()["status"] == "done"
+
+    response = await client.get(f"/api/v1/exports/{job_id}/download")
+    assert response.status_code == 200
+    assert "Export%20Dataset_yolo_" in response.headers["content-disposition"]
+    with zipfile.ZipFile(io.BytesIO(response.content)) as zipf:
+        assert zipf.read("classes.txt") == b"Cat"
+
+    response = await client.get("/api/v1/exports/9999")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_export_job_bad_export_root(client: AsyncClient, tmp_path, monkeypatch):
+    """Test a job whose export directory cannot be created ends up failed."""
+    (tmp_path / "file").write_text("")
+    monkeypatch.setattr(export_jobs.settings, "export_root", str(tmp_path / "file" / "exports"))
+    _, dataset_id = await _create_dataset(client, "detection")
+
+    response = await client.post(f"/api/v1/datasets/{dataset_id}/exports?format=yolo")
+    job_id = response.json()["id"]
+
+    response = await client.get(f"/api/v1/exports/{job_id}")
+    assert response.json()["status"] == "failed"
+
+
+@pytest.mark.asyncio
+async def test_fail_interrupted_jobs(client: AsyncClient, db_session: AsyncSession, async_engine):
+    """Test jobs left pending or running by a previous process are marked failed."""
+    _, dataset_id = await _create_dataset(client, "detection")
+    for job_status in (ExportJobStatus.PENDING, ExportJobStatus.RUNNING, ExportJobStatus.DONE):
+        db_session.add(ExportJob(
+            dataset_id=dataset_id, format="yolo", filename="export.zip", status=job_status,
+        ))
+    await db_session.commit()
+
+    await export_jobs.fail_interrupted_jobs(async_sessionmaker(async_engine, expire_on_commit=False))
+
+    result = await db_session.execute(
+        select(ExportJob.status, ExportJob.error).order_by(ExportJob.id).execution_options(populate_existing=True)
+    )
+    assert result.all() == [
+        (ExportJobStatus.FAILED, "interrupted"),
+        (ExportJobStatus.FAILED, "interrupted"),
+        (ExportJobStatus.DONE, None),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_coco_stream(client: AsyncClient, db_session: AsyncSession, async_engine):
+    """Test the incrementally written COCO document is valid JSON with matching ids."""
+    project_id, dataset_id = await _create_dataset(client, "detection")
+    label = (await db_session.execute(select(Label))).scalar_one()
+
+    items = [
+        Item(
+            dataset_id=dataset_id, project_id=project_id, rel_path=f"{i}.jpg", filename=f"{i}.jpg",
+            status=ItemStatus.DONE, width=100, height=100,
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(items)
+    await db_session.flush()
+    db_session.add_all([
+        BBoxAnnotation(item_id=items[0].id, label_id=label.id, x=1, y=2, width=3, height=4),
+        BBoxAnnotation(item_id=items[2].id, label_id=label.id, x=5, y=6, width=7, height=8),
+    ])
+    await db_session.commit()
+
+    service = ExportService(async_sessionmaker(async_engine, expire_on_commit=False))
+    data = b"".join([chunk async for chunk in service.export_coco(dataset_id)])
+
+    with zipfile.ZipFile(io.BytesIO(data)) as zipf:
+        coco = json.loads(zipf.read("annotations.json"))
+    assert coco["categories"] == [{"id": 1, "name": "Cat", "supercategory": "object"}]
+    assert [image["id"] for image in coco["images"]] == [item.id for item in items]
+    assert [(a["id"], a["image_id"], a["bbox"]) for a in coco["annotations"]] == [
+        (1, items[0].id, [1, 2, 3, 4]),
+        (2, items[2].id, [5, 6, 7, 8]),
+    ]
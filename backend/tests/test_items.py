@@ -0,0 +1,177 @@
+"""Tests for item endpoints."""
+
+import pytest
+from fastapi.responses import FileResponse
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.annotation import ClassificationAnnotation
+from app.models.item import Item, ItemStatus
+from app.services import cache
+
+
+@pytest.fixture
+async def dataset_id(client: AsyncClient, db_session: AsyncSession) -> int:
+    """Create a dataset with five items, the third one deleted."""
+    response = await client.post("/api/v1/projects", json={"name": "Test Project"})
+    project_id = response.json()["id"]
+    response = await client.post(
+        f"/api/v1/projects/{project_id}/datasets",
+        json={"name": "Test Dataset", "root_path": "/tmp/images"},
+    )
+    dataset_id = response.json()["id"]
+
+    db_session.add_all([
+        Item(
+            dataset_id=dataset_id,
+            project_id=project_id,
+            rel_path=f"{i}.jpg",
+            filename=f"{i}.jpg",
+            status=ItemStatus.DELETED if i == 2 else ItemStatus.TODO,
+        )
+        for i in range(5)
+    ])
+    await db_session.flush()
+    return dataset_id
+
+
+@pytest.mark.asyncio
+async def test_list_items_keyset(client: AsyncClient, dataset_id: int):
+    """Test paging through items with after_id/next_cursor."""
+    response = await client.get(f"/api/v1/datasets/{dataset_id}/items", params={"page_size": 2})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 4
+    assert [item["filename"] for item in data["items"]] == ["0.jpg", "1.jpg"]
+    first = data["items"][0]
+    assert first["thumb_url"] == f"/api/v1/items/{first['id']}/thumb"
+    assert first["image_url"] == f"/api/v1/items/{first['id']}/image"
+
+    filenames = []
+    cursor = data["next_cursor"]
+    while cursor is not None:
+        response = await client.get(
+            f"/api/v1/datasets/{dataset_id}/items",
+            params={"page_size": 2, "after_id": cursor},
+        )
+        data = response.json()
+        filenames += [item["filename"] for item in data["items"]]
+        cursor = data["next_cursor"]
+
+    assert filenames == ["3.jpg", "4.jpg"]
+
+
+@pytest.mark.asyncio
+async def test_list_items_latest_label(client: AsyncClient, db_session: AsyncSession, dataset_id: int):
+    """Test items carry their most recent classification label."""
+    response = await client.get(f"/api/v1/datasets/{dataset_id}/items")
+    item_id = response.json()["items"][0]["id"]
+    db_session.add_all([
+        ClassificationAnnotation(item_id=item_id, label="Cat"),
+        ClassificationAnnotation(item_id=item_id, label="Dog"),
+    ])
+    await db_session.flush()
+
+    response = await client.get(f"/api/v1/datasets/{dataset_id}/items")
+    assert [item["label"] for item in response.json()["items"]] == ["Dog", None, None, None]
+    response = await client.get(f"/api/v1/items/{item_id}")
+    assert response.json()["label"] == "Dog"
+
+
+@pytest.mark.asyncio
+async def test_list_items_query_count(client: AsyncClient, db_session: AsyncSession, dataset_id: int):
+    """Test listing items runs a fixed number of queries, however many items there are."""
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        response = await client.get(f"/api/v1/datasets/{dataset_id}/items")
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert len(response.json()["items"]) == 4
+    # Dataset existence, total count, then the page itself
+    assert len(statements) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_next_item_counts(client: AsyncClient, dataset_id: int):
+    """Test next-item returns the first todo item and per-status counts."""
+    response = await client.get(f"/api/v1/datasets/{dataset_id}/next-item")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["item"]["filename"] == "0.jpg"
+    assert data["item"]["status"] == "in_progress"
+    assert data["total_count"] == 4
+    assert data["done_count"] == 0
+    assert data["remaining_count"] == 4
+
+
+@pytest.mark.asyncio
+async def test_get_next_item_counts_follow_status_changes(client: AsyncClient, dataset_id: int):
+    """Test cached next-item counts are refreshed by skipping and deleting items."""
+    response = await client.get(f"/api/v1/datasets/{dataset_id}/next-item")
+    item_id = response.json()["item"]["id"]
+    await client.post(f"/api/v1/items/{item_id}/skip", json={"reason": "blurry"})
+    await client.post(f"/api/v1/items/{item_id + 1}/delete")
+
+    data = (await client.get(f"/api/v1/datasets/{dataset_id}/next-item")).json()
+    assert data["total_count"] == 3
+    assert data["remaining_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_previous_and_next_item(client: AsyncClient, dataset_id: int):
+    """Test neighbor navigation skips deleted items and 404s on unknown items."""
+    response = await client.get(f"/api/v1/datasets/{dataset_id}/items")
+    ids = [item["id"] for item in response.json()["items"]]
+
+    response = await client.get(f"/api/v1/items/{ids[1]}/next")
+    assert response.json()["filename"] == "3.jpg"
+    response = await client.get(f"/api/v1/items/{ids[2]}/previous")
+    assert response.json()["filename"] == "1.jpg"
+
+    response = await client.get(f"/api/v1/items/{ids[0]}/previous")
+    assert response.status_code == 200
+    assert response.json() is None
+
+    response = await client.get("/api/v1/items/9999/next")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_image_not_found(client: AsyncClient, dataset_id: int):
+    """Test image requests distinguish unknown items from missing files."""
+    response = await client.get("/api/v1/items/9999/image")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Item not found"
+
+    response = await client.get(f"/api/v1/datasets/{dataset_id}/items")
+    item_id = response.json()["items"][0]["id"]
+    response = await client.get(f"/api/v1/items/{item_id}/thumb")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Image file not found"
+
+
+def test_file_response_xaccel(tmp_path, monkeypatch):
+    """Test files under the media root are handed to Nginx when X-Accel is enabled."""
+    image = tmp_path / "cats" / "a b.jpg"
+    image.parent.mkdir()
+    image.write_bytes(b"jpeg")
+
+    response = cache.file_response(image, "image/jpeg", str(tmp_path), "/internal-media/")
+    assert isinstance(response, FileResponse)
+
+    monkeypatch.setattr(cache.settings, "use_xaccel", True)
+    response = cache.file_response(image, "image/jpeg", str(tmp_path), "/internal-media/")
+    assert response.headers["x-accel-redirect"] == "/internal-media/cats/a%20b.jpg"
+    assert response.headers["content-type"] == "image/jpeg"
+
+    # Outside the aliased root Nginx cannot serve it
+    response = cache.file_response(image, "image/jpeg", str(tmp_path / "cats" / "x"), "/internal-media/")
+    assert isinstance(response, FileResponse)
@@ -0,0 +1,62 @@
+"""Tests for label endpoints."""
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_set_labels(client: AsyncClient):
+    """Test replacing a project's labels."""
+    create_response = await client.post(
+        "/api/v1/projects",
+        json={"name": "Labels", "labels": [{"name": "Old"}]},
+    )
+    project_id = create_response.json()["id"]
+
+    response = await client.post(
+        f"/api/v1/projects/{project_id}/labels",
+        json={"labels": [{"name": "Cat", "color": "#FF0000"}, {"name": "Dog", "shortcut": "5"}]},
+    )
+    assert response.status_code == 201
+    data = response.json()
+    assert [label["name"] for label in data] == ["Cat", "Dog"]
+    assert [label["shortcut"] for label in data] == ["1", "5"]
+    assert [label["order"] for label in data] == [0, 1]
+    assert all(label["id"] and label["created_at"] for label in data)
+
+    response = await client.get(f"/api/v1/projects/{project_id}/labels")
+    assert response.json() == data
+
+
+@pytest.mark.asyncio
+async def test_set_labels_project_not_found(client: AsyncClient):
+    """Test setting labels on a missing project."""
+    response = await client.post(
+        "/api/v1/projects/9999/labels",
+        json={"labels": [{"name": "Cat"}]},
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_add_and_list_labels(client: AsyncClient):
+    """Test appending labels and listing them in order."""
+    create_response = await client.post("/api/v1/projects", json={"name": "Labels"})
+    project_id = create_response.json()["id"]
+
+    response = await client.get(f"/api/v1/projects/{project_id}/labels")
+    assert response.status_code == 200
+    assert response.json() == []
+
+    for name in ["Cat", "Dog"]:
+        response = await client.post(f"/api/v1/projects/{project_id}/labels/add", json={"name": name})
+        assert response.status_code == 201
+        assert response.json()["created_at"]
+
+    response = await client.get(f"/api/v1/projects/{project_id}/labels")
+    assert [(label["name"], label["order"]) for label in response.json()] == [("Cat", 0), ("Dog", 1)]
+
+    response = await client.get("/api/v1/projects/9999/labels")
+    assert response.status_code == 404
+    response = await client.post("/api/v1/projects/9999/labels/add", json={"name": "Cat"})
+    assert response.status_code == 404
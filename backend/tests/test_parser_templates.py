@@ -0,0 +1,115 @@
+"""Tests for parser template endpoints."""
+
+import jmespath
+import pytest
+from httpx import AsyncClient
+
+from app.services.parser import compile_path
+
+TEMPLATE = {
+    "name": "Test Template",
+    "input_type": "jsonl",
+    "mapping": {
+        "image_key": "image",
+        "annotations_path": "objects",
+        "annotation": {
+            "label": "label",
+            "score": "score",
+            "bbox": {"path": "box", "format": "xyxy"},
+        },
+    },
+}
+
+
+@pytest.mark.asyncio
+async def test_test_template_jsonl(client: AsyncClient):
+    """Test parsing sample JSONL data with an inline template."""
+    sample = "\n".join([
+        '{"image": "a.jpg", "objects": [{"label": "cat", "score": 0.9, "box": [1, 2, 11, 22]}]}',
+        "not json",
+    ])
+    response = await client.post(
+        "/api/v1/parser-templates/test",
+        json={"template": TEMPLATE, "sample_data": sample},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["records_parsed"] == 1
+    assert data["predictions"][0]["image_key"] == "a.jpg"
+    assert data["predictions"][0]["predictions"][0]["data"] == {"x": 1, "y": 2, "width": 10, "height": 20}
+    assert data["errors"][0]["line"] == 2
+
+    # Lines past max_records are never parsed
+    response = await client.post(
+        "/api/v1/parser-templates/test",
+        json={"template": TEMPLATE, "sample_data": sample, "max_records": 1},
+    )
+    assert response.json()["errors"] == []
+
+
+@pytest.mark.asyncio
+async def test_test_template_json(client: AsyncClient):
+    """Test parsing a sample JSON document through the template's record path."""
+    template = {**TEMPLATE, "input_type": "json", "record_path": "records"}
+    sample = '{"records": [{"image": "a.jpg", "objects": []}, {"image": "b.jpg", "objects": []}]}'
+    response = await client.post(
+        "/api/v1/parser-templates/test",
+        json={"template": template, "sample_data": sample},
+    )
+    data = response.json()
+    assert data["errors"] == []
+    assert [p["image_key"] for p in data["predictions"]] == ["a.jpg", "b.jpg"]
+
+    response = await client.post(
+        "/api/v1/parser-templates/test",
+        json={"template": template, "sample_data": "{not json"},
+    )
+    data = response.json()
+    assert data["success"] is False
+    assert data["predictions"] == []
+    assert data["errors"][0]["error"].startswith("Parse failed")
+
+
+@pytest.mark.asyncio
+async def test_list_templates(client: AsyncClient):
+    """Test listing templates returns every response field."""
+    response = await client.post("/api/v1/parser-templates", json=TEMPLATE)
+    assert response.status_code == 201
+    created = response.json()
+
+    response = await client.get("/api/v1/parser-templates")
+    assert response.status_code == 200
+    assert response.json() == {"items": [created], "total": 1, "page": 1, "page_size": 50, "total_pages": 1}
+
+
+@pytest.mark.asyncio
+async def test_template_cache_invalidation(client: AsyncClient):
+    """Test cached template reads reflect creates, updates and deletes."""
+    response = await client.get("/api/v1/parser-templates")
+    assert response.json()["total"] == 0
+
+    response = await client.post("/api/v1/parser-templates", json=TEMPLATE)
+    template_id = response.json()["id"]
+    response = await client.get("/api/v1/parser-templates")
+    assert response.json()["total"] == 1
+    response = await client.get(f"/api/v1/parser-templates/{template_id}")
+    assert response.json()["name"] == "Test Template"
+
+    await client.put(f"/api/v1/parser-templates/{template_id}", json={"name": "Renamed"})
+    response = await client.get(f"/api/v1/parser-templates/{template_id}")
+    assert response.json()["name"] == "Renamed"
+    response = await client.get("/api/v1/parser-templates")
+    assert response.json()["items"][0]["name"] == "Renamed"
+
+    await client.delete(f"/api/v1/parser-templates/{template_id}")
+    response = await client.get(f"/api/v1/parser-templates/{template_id}")
+    assert response.status_code == 404
+    response = await client.get("/api/v1/parser-templates")
+    assert response.json()["total"] == 0
+
+
+@pytest.mark.parametrize("expression", ["image", "meta.size.w", "meta.missing.w", "objects[0].label", "objects[*].label"])
+def test_compile_path_matches_jmespath(expression: str):
+    """Test the field-path fast path returns what JMESPath would."""
+    record = {"image": "a.jpg", "meta": {"size": {"w": 4}, "missing": [1]}, "objects": [{"label": "cat"}]}
+    assert compile_path(expression)(record) == jmespath.search(expression, record)
@@ -2,6 +2,9 @@
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.item import Item, ItemStatus
 
 
 @pytest.mark.asyncio
@@ -40,7 +43,8 @@ async def test_list_projects(client: AsyncClient):
     response = await client.get("/api/v1/projects")
     assert response.status_code == 200
     data = response.json()
-    assert len(data) >= 1
+    assert data["total"] == 1
+    assert data["items"][0]["name"] == "Project 1"
 
 
 @pytest.mark.asyncio
@@ -81,6 +85,15 @@ async def test_update_project(client: AsyncClient):
     )
     assert response.status_code == 200
     assert response.json()["name"] == "Updated Name"
+    updated = response.json()
+
+    # Resending the same values changes nothing, updated_at included
+    response = await client.put(
+        f"/api/v1/projects/{project_id}",
+        json={"name": "Updated Name"},
+    )
+    assert response.status_code == 200
+    assert response.json() == updated
 
 
 @pytest.mark.asyncio
@@ -100,3 +113,56 @@ async def test_delete_project(client: AsyncClient):
     get_response = await client.get(f"/api/v1/projects/{project_id}")
     assert get_response.status_code == 404
 
+
+
+@pytest.mark.asyncio
+async def test_list_projects_stats(client: AsyncClient, db_session: AsyncSession):
+    """Test project listing reports dataset and item counts per project."""
+    response = await client.post("/api/v1/projects", json={"name": "Busy", "task_type": "classification"})
+    busy_id = response.json()["id"]
+    await client.post("/api/v1/projects", json={"name": "Empty", "task_type": "classification"})
+    for name in ["A", "B"]:
+        response = await client.post(
+            f"/api/v1/projects/{busy_id}/datasets",
+            json={"name": name, "root_path": "/tmp/images"},
+        )
+    dataset_id = response.json()["id"]
+    db_session.add_all([
+        Item(dataset_id=dataset_id, project_id=busy_id, rel_path=f"{i}.jpg", filename=f"{i}.jpg", status=status)
+        for i, status in enumerate([ItemStatus.DONE, ItemStatus.TODO, ItemStatus.DELETED])
+    ])
+    await db_session.flush()
+
+    response = await client.get("/api/v1/projects")
+    stats = {
+        project["name"]: (project["dataset_count"], project["item_count"], project["done_count"])
+        for project in response.json()["items"]
+    }
+    assert stats == {"Busy": (2, 2, 1), "Empty": (0, 0, 0)}
+
+
+@pytest.mark.asyncio
+async def test_list_projects_pagination(client: AsyncClient):
+    """Test projects are paged newest first."""
+    for i in range(3):
+        await client.post("/api/v1/projects", json={"name": f"Project {i}", "task_type": "classification"})
+
+    response = await client.get("/api/v1/projects", params={"page": 2, "page_size": 2})
+    data = response.json()
+    assert [project["name"] for project in data["items"]] == ["Project 0"]
+    assert (data["total"], data["page"], data["page_size"], data["total_pages"]) == (3, 2, 2, 2)
+
+
+@pytest.mark.asyncio
+async def test_create_project_label_shortcuts(client: AsyncClient):
+    """Test default shortcuts stop at 9 while explicit ones are always kept."""
+    labels = [{"name": f"L{i}", "color": "#FF0000"} for i in range(10)]
+    labels[9]["shortcut"] = "5"
+    labels.append({"name": "L10", "color": "#FF0000"})
+    response = await client.post(
+        "/api/v1/projects",
+        json={"name": "Many Labels", "task_type": "classification", "labels": labels},
+    )
+    assert response.status_code == 201
+    shortcuts = [label["shortcut"] for label in response.json()["labels"]]
+    assert shortcuts == ["1", "2", "3", "4", "5", "6", "7", "8", "9", "5", None]
@@ -75,6 +75,30 @@ export interface ItemListResponse {
   page: number
   page_size: number
   total_pages: number
+  next_cursor: number | null
+}
+
+export interface Page<T> {
+  items: T[]
+  total: number
+  page: number
+  page_size: number
+  total_pages: number
+}
+
+// Backend cap on page_size for paginated list endpoints
+const MAX_PAGE_SIZE = 200
+
+// Fetch every page of a paginated list endpoint; the first page reports
+// how many there are, the rest are requested together
+async function listAll<T>(url: string): Promise<T[]> {
+  const first = await api.get<Page<T>>(url, { params: { page: 1, page_size: MAX_PAGE_SIZE } })
+  const rest = await Promise.all(
+    Array.from({ length: Math.max(first.data.total_pages - 1, 0) }, (_, i) =>
+      api.get<Page<T>>(url, { params: { page: i + 2, page_size: MAX_PAGE_SIZE } }),
+    ),
+  )
+  return first.data.items.concat(...rest.map((r) => r.data.items))
 }
 
 export interface ScanResponse {
@@ -86,7 +110,7 @@ export interface ScanResponse {
 
 // API functions
 export const projectsApi = {
-  list: () => api.get<Project[]>('/projects').then((r) => r.data),
+  list: () => listAll<Project>('/projects'),
   get: (id: number) => api.get<Project>(`/projects/${id}`).then((r) => r.data),
   create: (data: {
     name: string
@@ -126,7 +150,7 @@ export const datasetsApi = {
 }
 
 export const itemsApi = {
-  list: (datasetId: number, params?: { status?: string; page?: number; page_size?: number }) =>
+  list: (datasetId: number, params?: { status?: string; page?: number; page_size?: number; after_id?: number }) =>
     api.get<ItemListResponse>(`/datasets/${datasetId}/items`, { params }).then((r) => r.data),
   get: (itemId: number) => api.get<Item>(`/items/${itemId}`).then((r) => r.data),
   getPrevious: (itemId: number) =>
@@ -277,7 +301,7 @@ export interface ParseTestResponse {
 }
 
 export const parserTemplatesApi = {
-  list: () => api.get<ParserTemplate[]>('/parser-templates').then((r) => r.data),
+  list: () => listAll<ParserTemplate>('/parser-templates'),
   get: (id: number) => api.get<ParserTemplate>(`/parser-templates/${id}`).then((r) => r.data),
   create: (data: ParserTemplateCreate) =>
     api.post<ParserTemplate>('/parser-templates', data).then((r) => r.data),